@@ -4,14 +4,24 @@ Inicia la creación y configuración de todos los componentes:
     - Carga de configuración y variables de entorno
     - Registro de rutas y blueprints
     - Configuración de manejo de errores
+    - Registro de comandos de mantenimiento (flask CLI)
+    - Control de admisión y deadline de cada request
+    - Perfilado de requests a pedido
+    - Actualización periódica de la cache en segundo plano
+    - Precarga de la Pokedex (snapshot e índices), antes de que el servidor haga fork de los workers
 
-Se ejecuta durante run.py
+Se ejecuta durante run.py, o desde el servidor WSGI con la factory create_app
 """
 
 from flask import Flask
 from app.api.routes import register_routes
 from app.api.errors.handlers import register_error_handlers
-from app.config.settings import load_config
+from app.config.settings import load_config, PRELOAD_POKEDEX
+from app.preload import preload_pokedex
+from app.scheduler import register_refresh_scheduler
+from app.cli import register_commands
+from app.utils.admission import register_admission_control
+from app.utils.profiler import register_profiler
 from app.utils.logger import get_logger
 
 logger = get_logger()
@@ -38,5 +48,16 @@ def create_app():
     logger.debug('Configurando manejo de errores')
     register_error_handlers(app) #Configura el sistema de manejo de errores
     
+    register_commands(app) #Registra los comandos de la CLI (ej: pokedex-snapshot)
+    
+    register_admission_control(app) #Limita la concurrencia por clase de ruta y descarta con 503 ante sobrecarga
+    
+    register_profiler(app) #Perfila requests a pedido (header X-Pokedex-Profile) o por muestreo
+    
+    register_refresh_scheduler(app) #Compara la cache con la PokeAPI cada REFRESH_INTERVAL segundos
+    
+    if PRELOAD_POKEDEX:
+        preload_pokedex() #Construye caches e índices una vez, para compartirlos entre workers
+    
     logger.info('Aplicacion Flask creada exitosamente.')
     return app
\ No newline at end of file
@@ -1,10 +1,12 @@
 from flask import Flask
 from .auth import auth_bp
 from .pokemon import pokemon_bp
+from .admin import admin_bp
 
 def register_routes(app: Flask):
     """
     Registra todos los blueprints de la aplicación
     """
     app.register_blueprint(auth_bp)
-    app.register_blueprint(pokemon_bp)
\ No newline at end of file
+    app.register_blueprint(pokemon_bp)
+    app.register_blueprint(admin_bp)
\ No newline at end of file
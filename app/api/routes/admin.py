@@ -0,0 +1,192 @@
+"""
+Módulo de rutas de administración.
+Expone los perfiles de requests guardados por el perfilador (ver app/utils/profiler.py)
+el estado del control de admisión (ver app/utils/admission.py), las métricas de hedging
+de la PokeAPI (ver app/utils/hedging.py) y las métricas e invalidación de las caches
+(ver app/utils/cache.py).
+Todos los endpoints requieren el header X-Admin-Token.
+"""
+
+import os
+from flask import Blueprint, request, send_file
+from app.api.routes.pokemon import pokemon_service
+from app.services.auth_service import token_cache
+from app.utils.admission import limiters
+from app.utils.cache import invalidation_bus
+from app.utils.decorators import handle_api_errors, requires_admin
+from app.utils.hedging import hedger
+from app.utils.profiler import profile_ring
+from app.utils.responses import create_response
+from app.utils.logger import get_logger
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+logger = get_logger()
+
+# Prefijos de las claves de cache que se pueden invalidar
+CACHE_NAMESPACES = ('pokemon/', 'type/', 'evolution-chain/', 'token/')
+
+def invalidate_local_caches(pattern: str) -> int:
+    """
+    Aplica una invalidación a las caches de este proceso. Los documentos de la PokeAPI
+    quedan obsoletos (se vuelven a descargar al consultarlos); los tokens se eliminan.
+    
+    Returns:
+        int: Entradas invalidadas
+    """
+    return pokemon_service.invalidate_cache(pattern) + token_cache.invalidate(pattern)
+
+@admin_bp.before_app_request
+def apply_pending_invalidations():
+    """Antes de cada request, aplica las invalidaciones publicadas por cualquier worker."""
+    for pattern in invalidation_bus.poll():
+        invalidate_local_caches(pattern)
+
+@admin_bp.route('/profiles', methods=['GET'])
+@requires_admin
+@handle_api_errors
+def list_profiles():
+    """
+    Endpoint para listar los perfiles de requests más recientes.
+    
+    Returns:
+        Response: Perfiles guardados, del más reciente al más viejo
+    """
+    profiles = profile_ring.list()
+    return create_response({
+        "mensaje": f"Hay {len(profiles)} perfiles guardados",
+        "perfiles": profiles
+    })
+
+@admin_bp.route('/profiles/<profile_id>', methods=['GET'])
+@requires_admin
+@handle_api_errors
+def download_profile(profile_id: str):
+    """
+    Endpoint para descargar un perfil.
+    
+    Args:
+        profile_id (str): Identificador devuelto en el header X-Pokedex-Profile-Id
+        
+    Returns:
+        Response: Archivo .collapsed (texto) o .pstats (binario)
+    """
+    profile_path = profile_ring.path_for(profile_id)
+    if profile_path is None:
+        return create_response({
+            "error": f"¡Ups! No encontré el perfil '{profile_id}'",
+            "sugerencia": "Consultá los perfiles disponibles en /admin/profiles"
+        }, 404)
+    
+    logger.info(f'Descargando perfil: {profile_id}')
+    mimetype = 'text/plain' if profile_id.endswith('.collapsed') else 'application/octet-stream'
+    return send_file(os.path.abspath(profile_path), mimetype=mimetype, as_attachment=True, download_name=profile_id)
+
+@admin_bp.route('/admission', methods=['GET'])
+@requires_admin
+@handle_api_errors
+def admission_status():
+    """
+    Endpoint para consultar el control de admisión de este proceso.
+    
+    Returns:
+        Response: Límite actual, requests en curso y descartadas por clase de ruta
+    """
+    return create_response({
+        "mensaje": "Estado del control de admisión",
+        "clases": {name: limiter.stats() for name, limiter in limiters.items()}
+    })
+
+@admin_bp.route('/hedging', methods=['GET'])
+@requires_admin
+@handle_api_errors
+def hedging_status():
+    """
+    Endpoint para consultar las métricas de hedging de este proceso.
+    
+    Returns:
+        Response: Requests, hedges lanzados y ganados, y p95 por endpoint de la PokeAPI
+    """
+    return create_response({
+        "mensaje": "Métricas de hedging de la PokeAPI",
+        **hedger.stats()
+    })
+
+@admin_bp.route('/caches', methods=['GET'])
+@requires_admin
+@handle_api_errors
+def cache_status():
+    """
+    Endpoint para consultar las caches de este proceso.
+    
+    Query params:
+        top (int, optional): Cantidad de claves más consultadas por cache. Default = 10.
+    
+    Returns:
+        Response: Entradas, memoria estimada, tasa de aciertos, desalojos y claves más consultadas
+        de las caches de la PokeAPI y de la introspección de Okta
+    """
+    try:
+        top = int(request.args.get('top', 10))
+        if not 0 <= top <= 100:
+            raise ValueError("top debe estar entre 0 y 100")
+    except ValueError as e:
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Probá con /admin/caches?top=10"
+        }, 400)
+    
+    return create_response({
+        "mensaje": f"Caches del proceso {os.getpid()}",
+        "generacion": invalidation_bus.generation,
+        "caches": {**pokemon_service.cache_report(top), "token": token_cache.report(top)}
+    })
+
+@admin_bp.route('/caches/invalidate', methods=['POST'])
+@requires_admin
+@handle_api_errors
+def invalidate_caches():
+    """
+    Endpoint para invalidar entradas de cache en todos los workers.
+    
+    Body (JSON), una de:
+        key (str): Clave exacta, ej: 'pokemon/pikachu'
+        prefix (str): Prefijo, ej: 'type/' (todos los tipos)
+        all (bool): true para invalidar todas las caches
+    
+    Returns:
+        Response: Patrón publicado, generación y entradas invalidadas en este proceso
+        (los demás workers la aplican antes de su próxima request)
+    """
+    data = request.get_json(silent=True) or {}
+    if data.get('all') is True:
+        pattern = '*'
+    elif isinstance(data.get('key'), str) and data['key']:
+        pattern = data['key'].lower()
+    elif isinstance(data.get('prefix'), str) and data['prefix']:
+        pattern = f"{data['prefix'].lower()}*"
+    else:
+        pattern = None
+    
+    if pattern is None or not (pattern == '*' or pattern.startswith(CACHE_NAMESPACES)):
+        return create_response({
+            "error": "¡Ups! No entendí qué invalidar",
+            "sugerencia": f"Enviá {{\"key\": \"pokemon/pikachu\"}}, {{\"prefix\": \"type/\"}} o {{\"all\": true}}; "
+                          f"las claves empiezan con {', '.join(CACHE_NAMESPACES)}"
+        }, 400)
+    
+    try:
+        generation = invalidation_bus.publish(pattern)
+    except ValueError as e:
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Usá un prefijo más corto"
+        }, 400)
+    
+    # Este proceso la aplica ya; los demás, antes de su próxima request
+    invalidated = sum(invalidate_local_caches(pending) for pending in invalidation_bus.poll())
+    logger.info(f"Invalidación publicada ('{pattern}', generación {generation})")
+    return create_response({
+        "mensaje": f"Invalidación '{pattern}' publicada para todos los workers",
+        "generacion": generation,
+        "invalidadas": invalidated
+    })
@@ -3,9 +3,23 @@ Módulo de rutas de la Pokedex.
 Define los endpoints para las diferentes funcionalidades de la API.
 """
 
-from flask import Blueprint, current_app
-from app.services.pokemon_service import PokemonService
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import requests
+from flask import Blueprint, Response, current_app, request, send_file
+from app.services.pokemon_service import PokemonService, POKEMON_FIELDS
+from app.services.pokedex_store import PokedexStore, ROW_FIELDS, parse_query_args
+from app.services.similarity_index import SimilarityIndex
+from app.services.type_chart import TypeChart
+from app.services.evolution_index import EvolutionIndex
+from app.services.ability_index import AbilityIndex
+from app.services.refresh_service import RefreshService
+from app.services.export_service import ExportService, EXPORT_FORMATS
+from app.services.sprite_cache import sprite_cache
+from app.services.type_members_index import TypeMembersIndex
+from app.services.type_stats import TypeStatsIndex
+from app.utils.admission import DeadlineExceeded, request_timeout
 from app.utils.decorators import handle_api_errors, requires_auth
+from app.utils.fields import FieldSet
 from app.utils.responses import (
     create_response,
     get_welcome_message,
@@ -15,8 +29,31 @@ from app.utils.logger import get_logger
 
 pokemon_bp = Blueprint('pokemon', __name__, url_prefix='/') #Organiza el grupo de paths en un blueprint
 pokemon_service = PokemonService() #Inicia el servicio /../services/pokemon_service.py
+pokedex_store = PokedexStore(pokemon_service) #Almacén columnar alimentado por la cache del servicio
+similarity_index = SimilarityIndex(pokedex_store) #Vecinos más cercanos por stats base
+type_chart = TypeChart(pokedex_store) #Matriz de efectividad de tipos
+evolution_index = EvolutionIndex(pokedex_store) #Grafo de evoluciones en memoria
+ability_index = AbilityIndex(pokedex_store) #Índice invertido de habilidades y tipos
+refresh_service = RefreshService(pokedex_store) #Actualización incremental de la cache contra la PokeAPI
+export_service = ExportService(pokedex_store) #Exportación masiva en streaming
+type_members_index = TypeMembersIndex(pokedex_store) #Integrantes de cada tipo, precalculados y ordenados
+type_stats_index = TypeStatsIndex(pokedex_store) #Estadísticas por tipo, actualizadas con cada cambio de la cache
 logger = get_logger()
 
+def invalid_fields_response(error: ValueError, field_set: FieldSet) -> Response:
+    """
+    Respuesta 400 para un parámetro `fields` inválido.
+    
+    Args:
+        error (ValueError): Error devuelto por FieldSet.parse
+        field_set (FieldSet): Campos disponibles en la ruta
+    """
+    logger.warning(f'Campos inválidos: {str(error)}')
+    return create_response({
+        "error": f"¡Ups! {str(error)}",
+        "sugerencia": f"Campos disponibles: {field_set.describe()}"
+    }, 400)
+
 @pokemon_bp.route('/', methods=['GET'], strict_slashes=False)
 @handle_api_errors
 def welcome():
@@ -43,6 +80,201 @@ def instructions():
     logger.info('Acceso a las instrucciones de la Pokedex')
     return create_response(get_pokedex_instructions())
 
+@pokemon_bp.route('/pokedex/query', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def query_pokedex():
+    """
+    Endpoint para consultar la Pokedex con filtros, orden y top-k.
+    
+    Query params:
+        type: Tipos a filtrar (repetible o separados por coma)
+        type_mode: 'all' (default) o 'any'
+        min_<columna> / max_<columna>: Rango sobre stats, total, altura, peso o número_pokedex
+        sort: Columna de orden
+        order: 'desc' (default) o 'asc'
+        limit: Cantidad máxima de resultados
+        default_only: Solo formas default
+        fields: Campos de cada ficha, separados por coma (default: todos)
+    
+    Returns:
+        Response: Pokemon que cumplen la consulta
+        
+    Status codes:
+        200: Consulta resuelta
+        400: Parámetros inválidos
+    """
+    logger.info(f'Consultando la Pokedex con parámetros: {dict(request.args)}')
+    try:
+        fields = ROW_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, ROW_FIELDS)
+    try:
+        params = parse_query_args(request.args)
+        result = pokedex_store.query(**params, fields=fields)
+    except ValueError as e:
+        logger.warning(f'Consulta inválida: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/query?type=water&sort=velocidad&limit=10"
+        }, 400)
+    
+    logger.info(f'Consulta resuelta: {result["total"]} Pokemon encontrados')
+    return create_response({
+        "mensaje": "¡Estos son los Pokemon que cumplen tu búsqueda!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/team/coverage', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def team_coverage():
+    """
+    Endpoint para analizar la cobertura ofensiva y defensiva de un equipo.
+    
+    Query params:
+        team: Nombres de hasta 6 Pokemon separados por coma (también repetible)
+    
+    Returns:
+        Response: Debilidades, resistencias y cobertura del equipo
+        
+    Status codes:
+        200: Cobertura calculada
+        400: Equipo vacío o con más de 6 integrantes
+        404: Algún Pokemon no existe
+    """
+    team = [name for value in request.args.getlist('team') for name in value.split(',') if name]
+    logger.info(f'Calculando cobertura del equipo: {team}')
+    try:
+        result = type_chart.team_coverage(team)
+    except ValueError as e:
+        logger.warning(f'Equipo inválido: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/team/coverage?team=garchomp,rotom-wash,ferrothorn"
+        }, 400)
+    except KeyError as e:
+        logger.warning(f'Pokemon del equipo no encontrado: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! No conozco a '{e.args[0]}' en tu equipo... ¿es uno de los nuevos?",
+            "sugerencia": "Revisá que los nombres estén bien escritos."
+        }, 404)
+    
+    return create_response({
+        "mensaje": "¡Este es el análisis de tu equipo!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/abilities/<ability>', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def pokemon_by_ability(ability):
+    """
+    Endpoint para obtener los Pokemon que pueden tener una o más habilidades.
+    
+    Args:
+        ability (str): Habilidad (ej: levitate). Se pueden indicar varias separadas por coma.
+    
+    Query params:
+        mode: 'all' (tienen todas las habilidades, default) o 'any' (alguna de ellas)
+        type: Uno o dos tipos que también deben tener (separados por coma)
+        default_only: Solo formas default
+        fields: Campos de cada ficha, separados por coma (default: todos)
+    
+    Returns:
+        Response: Pokemon con esas habilidades
+        
+    Status codes:
+        200: Búsqueda resuelta
+        400: Parámetros inválidos
+        404: Habilidad desconocida
+    """
+    logger.info(f'Buscando Pokemon con habilidad: {ability}')
+    abilities = [name for name in ability.split(',') if name]
+    try:
+        fields = ROW_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, ROW_FIELDS)
+    try:
+        mode = request.args.get('mode', 'all')
+        if mode not in ('all', 'any'):
+            raise ValueError("mode debe ser 'all' o 'any'")
+        types = [t for t in request.args.get('type', '').split(',') if t]
+        default_only = request.args.get('default_only', 'false').lower() in ('1', 'true', 'si', 'sí')
+        result = ability_index.search(abilities, ability_mode=mode, types=types, default_only=default_only, fields=fields)
+    except ValueError as e:
+        logger.warning(f'Búsqueda por habilidad inválida: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/abilities/levitate?type=ghost"
+        }, 400)
+    except KeyError as e:
+        logger.warning(f'Habilidad desconocida: {e.args[0]}')
+        return create_response({
+            "error": f"¡Ups! No conozco la habilidad '{e.args[0]}'",
+            "sugerencia": "Probá con habilidades como 'levitate', 'intimidate' o 'swift-swim'."
+        }, 404)
+    
+    logger.info(f'Encontrados {result["total"]} Pokemon con habilidad {ability}')
+    return create_response({
+        "mensaje": f"¡Estos Pokemon pueden tener {ability.replace('-', ' ')}!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/export', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def export_pokedex():
+    """
+    Endpoint para exportar la Pokedex completa en streaming.
+    
+    Query params:
+        format: 'ndjson' (default, una ficha por línea) o 'csv'
+        type: Tipos a filtrar (repetible o separados por coma; deben tenerlos todos)
+        cursor: Exportar solo los Pokemon con número de Pokedex mayor a este (para retomar)
+        limit: Cantidad máxima de Pokemon
+        default_only: Solo formas default
+        fields: Campos de cada ficha, separados por coma (default: todos)
+    
+    Returns:
+        Response: Fichas (las mismas que /pokedex/<name>) ordenadas por número de Pokedex.
+        El header X-Pokedex-Export-Total indica cuántas se van a enviar.
+        
+    Status codes:
+        200: Exportación en curso
+        400: Parámetros inválidos
+    """
+    logger.info(f'Exportando la Pokedex con parámetros: {dict(request.args)}')
+    try:
+        fields = POKEMON_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, POKEMON_FIELDS)
+    try:
+        export_format = request.args.get('format', 'ndjson').lower()
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"format debe ser {' o '.join(EXPORT_FORMATS)}")
+        types = [t for value in request.args.getlist('type') for t in value.split(',') if t]
+        try:
+            cursor = int(request.args.get('cursor', 0))
+            limit = int(request.args['limit']) if 'limit' in request.args else None
+        except ValueError:
+            raise ValueError("cursor y limit deben ser números enteros")
+        if limit is not None and limit < 1:
+            raise ValueError("limit debe ser mayor a 0")
+        default_only = request.args.get('default_only', 'false').lower() in ('1', 'true', 'si', 'sí')
+        documents = export_service.resolve(export_service.select(types=types, cursor=cursor, limit=limit, default_only=default_only))
+    except ValueError as e:
+        logger.warning(f'Exportación inválida: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/export?format=csv&type=fire&cursor=150"
+        }, 400)
+    
+    response = Response(export_service.stream(documents, export_format, fields), mimetype=EXPORT_FORMATS[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename=pokedex.{export_format}'
+    response.headers['X-Pokedex-Export-Total'] = str(len(documents))
+    return response
+
 @pokemon_bp.route('/pokedex/<name>', methods=['GET'], strict_slashes=False)
 @requires_auth
 @handle_api_errors
@@ -53,18 +285,28 @@ def get_pokemon(name):
     Args:
         name (str): Nombre del Pokemon a buscar
     
+    Query params:
+        fields: Campos de la ficha, separados por coma (ej: nombre,tipos; default: ficha completa)
+    
     Returns:
         Response: Información detallada del Pokemon o mensaje de error
         
     Status codes:
         200: Pokemon encontrado
+        400: Campos inválidos
         404: Pokemon no encontrado
     """
     logger.info(f'Buscando información del Pokemon: {name}')
     try:
-        pokemon_data = pokemon_service.get_pokemon_by_name(name)
+        fields = POKEMON_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, POKEMON_FIELDS)
+    try:
+        pokemon_data = pokemon_service.get_pokemon_by_name(name, fields)
         logger.info(f'Información obtenida exitosamente para: {name}')
         return create_response(pokemon_data)
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f'Error al buscar Pokemon {name}: {str(e)}')
         return create_response({
@@ -72,6 +314,153 @@ def get_pokemon(name):
             "sugerencia": "Revisá que el nombre esté bien escrito."
         }, 404)
 
+@pokemon_bp.route('/pokedex/<name>/similar', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def similar_pokemon(name):
+    """
+    Endpoint para obtener los Pokemon con stats base más parecidos a otro.
+    
+    Args:
+        name (str): Nombre del Pokemon de referencia
+    
+    Query params:
+        k: Cantidad de Pokemon similares (default 10, máximo 100)
+        type: Restringe los resultados a uno o más tipos (separados por coma)
+        default_only: Solo formas default
+        fields: Campos de cada ficha, separados por coma (default: todos)
+    
+    Returns:
+        Response: Pokemon de referencia y sus vecinos más cercanos
+        
+    Status codes:
+        200: Pokemon similares encontrados
+        400: Parámetros inválidos
+        404: Pokemon no encontrado
+    """
+    logger.info(f'Buscando Pokemon similares a: {name}')
+    try:
+        fields = ROW_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, ROW_FIELDS)
+    try:
+        k = int(request.args.get('k', 10))
+        if not 1 <= k <= 100:
+            raise ValueError("k debe estar entre 1 y 100")
+        types = [t for t in request.args.get('type', '').split(',') if t]
+        default_only = request.args.get('default_only', 'false').lower() in ('1', 'true', 'si', 'sí')
+        result = similarity_index.nearest(name, k=k, types=types, default_only=default_only, fields=fields)
+    except ValueError as e:
+        logger.warning(f'Consulta de similares inválida: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/garchomp/similar?k=5&type=dragon"
+        }, 400)
+    except KeyError:
+        logger.warning(f'Pokemon no encontrado para similares: {name}')
+        return create_response({
+            "error": "¡Ups! No conozco ese Pokemon... ¿es uno de los nuevos?",
+            "sugerencia": "Revisá que el nombre esté bien escrito."
+        }, 404)
+    
+    logger.info(f'Encontrados {len(result["similares"])} Pokemon similares a {name}')
+    return create_response({
+        "mensaje": f"¡Estos Pokemon juegan parecido a {name.capitalize()}!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/<name>/sprite', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def pokemon_sprite(name):
+    """
+    Endpoint para obtener el sprite de un Pokemon desde la cache en disco.
+    
+    Args:
+        name (str): Nombre o número de Pokedex
+    
+    Query params:
+        variant: Sprite a devolver (default: front_default; ej: back_default, front_shiny)
+    
+    Returns:
+        Response: Imagen, con ETag y soporte de Range (el archivo se envía sin pasar por Python
+        cuando el servidor lo permite, ej: sendfile en gunicorn)
+        
+    Status codes:
+        200: Imagen (206 para un rango, 304 si el ETag no cambió)
+        400: Variante inválida
+        404: Pokemon o sprite no encontrado
+        502: No se pudo descargar el sprite
+    """
+    variant = request.args.get('variant', 'front_default')
+    try:
+        sprites = pokemon_service.get_pokemon_document(name).get('sprites', {})
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        logger.error(f'Error al buscar Pokemon {name}: {str(e)}')
+        return create_response({
+            "error": "¡Ups! No conozco ese Pokemon... ¿es uno de los nuevos?",
+            "sugerencia": "Revisá que el nombre esté bien escrito."
+        }, 404)
+    
+    if variant not in sprites:
+        return create_response({
+            "error": f"¡Ups! {name.capitalize()} no tiene el sprite '{variant}'",
+            "sugerencia": f"Variantes disponibles: {', '.join(sorted(sprites)) or 'ninguna'}"
+        }, 400 if sprites else 404)
+    
+    for _ in range(2):
+        try:
+            sprite = sprite_cache.get(sprites[variant], timeout=request_timeout(10))
+        except DeadlineExceeded:
+            raise
+        except (requests.exceptions.RequestException, ValueError, FutureTimeoutError) as e:
+            logger.error(f'Error al descargar el sprite de {name}: {str(e) or type(e).__name__}')
+            break
+        try:
+            return send_file(sprite.path, mimetype=sprite.mimetype, conditional=True, etag=sprite.digest, max_age=86400)
+        except FileNotFoundError: #evict() la borró entre get() y send_file(): se vuelve a descargar
+            logger.warning(f'El sprite de {name} se descartó antes de enviarlo, se descarga de nuevo')
+
+    return create_response({
+        "error": "¡Ups! No pude traer la imagen de ese Pokemon.",
+        "sugerencia": "Intentalo de nuevo en unos momentos."
+    }, 502)
+
+@pokemon_bp.route('/pokedex/<name>/evolutions', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def pokemon_evolutions(name):
+    """
+    Endpoint para obtener la línea evolutiva de un Pokemon.
+    
+    Args:
+        name (str): Nombre del Pokemon
+    
+    Returns:
+        Response: Ancestros, descendientes y ramificaciones de la cadena evolutiva
+        
+    Status codes:
+        200: Línea evolutiva encontrada
+        404: Pokemon no encontrado
+    """
+    logger.info(f'Buscando línea evolutiva de: {name}')
+    try:
+        result = evolution_index.lineage(name)
+    except KeyError:
+        logger.warning(f'Pokemon no encontrado para evoluciones: {name}')
+        return create_response({
+            "error": "¡Ups! No conozco ese Pokemon... ¿es uno de los nuevos?",
+            "sugerencia": "Revisá que el nombre esté bien escrito."
+        }, 404)
+    
+    logger.info(f'Línea evolutiva de {name} obtenida: raíz {result["raiz"]}')
+    return create_response({
+        "mensaje": f"¡Esta es la línea evolutiva de {name.capitalize()}!",
+        **result
+    })
+
 @pokemon_bp.route('/pokedex/types', methods=['GET'], strict_slashes=False)
 @requires_auth
 @handle_api_errors
@@ -93,6 +482,8 @@ def get_available_types():
             logger.info('Tipos de Pokemon obtenidos exitosamente')
             return create_response(types_data)
         raise Exception("No se obtuvieron datos de tipos")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f'Error al obtener tipos de Pokemon: {str(e)}')
         return create_response({
@@ -100,6 +491,188 @@ def get_available_types():
             "sugerencia": "Intentalo de nuevo en unos momentos."
         }, 500)
 
+@pokemon_bp.route('/pokedex/types/<type_name>/members', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def type_members(type_name):
+    """
+    Endpoint para listar de a páginas los Pokemon de un tipo.
+    
+    Args:
+        type_name (str): Tipo de Pokemon (ej: fire, water, electric)
+    
+    Query params:
+        limit: Pokemon por página (default 50, máximo 200)
+        cursor: Valor de "siguiente" de la página anterior
+        sort: 'id' (default) o 'name_length'
+        order: 'asc' (default) o 'desc'
+        default_only: Solo formas default
+        fields: Campos de cada Pokemon, separados por coma (default: nombre y número)
+    
+    Returns:
+        Response: Total de integrantes, la página y el cursor de la siguiente
+        
+    Status codes:
+        200: Página obtenida
+        400: Parámetros inválidos
+        404: Tipo de Pokemon no válido
+    """
+    logger.info(f'Listando integrantes del tipo {type_name}: {dict(request.args)}')
+    try:
+        fields = ROW_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, ROW_FIELDS)
+    try:
+        try:
+            limit = int(request.args.get('limit', 50))
+        except ValueError:
+            raise ValueError("limit debe ser un número entero")
+        default_only = request.args.get('default_only', 'false').lower() in ('1', 'true', 'si', 'sí')
+        result = type_members_index.page(
+            type_name,
+            limit=limit,
+            cursor=request.args.get('cursor'),
+            sort=request.args.get('sort', 'id'),
+            order=request.args.get('order', 'asc'),
+            default_only=default_only,
+            fields=fields
+        )
+    except ValueError as e:
+        logger.warning(f'Listado de integrantes inválido: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/types/dragon/members?limit=20&sort=name_length&order=desc"
+        }, 400)
+    except KeyError:
+        logger.warning(f'Tipo desconocido: {type_name}')
+        return create_response({
+            "error": f"¡Ups! No conozco el tipo '{type_name}'",
+            "sugerencia": "Probá con tipos como 'fire', 'water', 'electric', etc."
+        }, 404)
+    
+    return create_response({
+        "mensaje": f"¡Estos son los Pokemon de tipo {result['tipo']}!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/types/<type_name>/stats', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def type_stats(type_name):
+    """
+    Endpoint para obtener las estadísticas de un tipo.
+    
+    Args:
+        type_name (str): Tipo de Pokemon (ej: fire, water, electric)
+    
+    Returns:
+        Response: Cantidad de integrantes y promedio, mínimo y máximo de cada stat base y del total
+        
+    Status codes:
+        200: Estadísticas obtenidas
+        404: Tipo de Pokemon no válido
+    """
+    logger.info(f'Consultando estadísticas del tipo: {type_name}')
+    try:
+        result = type_stats_index.summary(type_name)
+    except KeyError:
+        logger.warning(f'Tipo desconocido: {type_name}')
+        return create_response({
+            "error": f"¡Ups! No conozco el tipo '{type_name}'",
+            "sugerencia": "Probá con tipos como 'fire', 'water', 'electric', etc."
+        }, 404)
+    
+    return create_response({
+        "mensaje": f"¡Estas son las estadísticas del tipo {result['tipo']}!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/types/<type_name>/leaderboard', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def type_leaderboard(type_name):
+    """
+    Endpoint para obtener el ranking de un stat dentro de un tipo.
+    
+    Args:
+        type_name (str): Tipo de Pokemon (ej: fire, water, electric)
+    
+    Query params:
+        stat: hp, ataque, defensa, ataque_especial, defensa_especial, velocidad o total (default)
+        k: Cantidad de Pokemon (default 10, máximo 100)
+        order: 'desc' (los más altos, default) o 'asc'
+    
+    Returns:
+        Response: Ranking de Pokemon del tipo
+        
+    Status codes:
+        200: Ranking obtenido
+        400: Parámetros inválidos
+        404: Tipo de Pokemon no válido
+    """
+    logger.info(f'Consultando ranking del tipo {type_name}: {dict(request.args)}')
+    try:
+        try:
+            k = int(request.args.get('k', 10))
+        except ValueError:
+            raise ValueError("k debe ser un número entero")
+        if not 1 <= k <= 100:
+            raise ValueError("k debe estar entre 1 y 100")
+        result = type_stats_index.leaderboard(type_name, request.args.get('stat', 'total'), k=k,
+                                              order=request.args.get('order', 'desc'))
+    except ValueError as e:
+        logger.warning(f'Ranking inválido: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/types/fire/leaderboard?stat=hp&k=5"
+        }, 400)
+    except KeyError:
+        logger.warning(f'Tipo desconocido: {type_name}')
+        return create_response({
+            "error": f"¡Ups! No conozco el tipo '{type_name}'",
+            "sugerencia": "Probá con tipos como 'fire', 'water', 'electric', etc."
+        }, 404)
+    
+    return create_response({
+        "mensaje": f"¡Estos son los mejores Pokemon de tipo {result['tipo']} en {result['stat']}!",
+        **result
+    })
+
+@pokemon_bp.route('/pokedex/leaderboards/<stat>', methods=['GET'], strict_slashes=False)
+@requires_auth
+@handle_api_errors
+def leaderboard_by_type(stat):
+    """
+    Endpoint para ordenar los tipos por el promedio de un stat.
+    
+    Args:
+        stat (str): hp, ataque, defensa, ataque_especial, defensa_especial, velocidad o total
+    
+    Query params:
+        order: 'desc' (promedio más alto primero, default) o 'asc'
+    
+    Returns:
+        Response: Tipos con su promedio y su mejor Pokemon en ese stat
+        
+    Status codes:
+        200: Ranking obtenido
+        400: Parámetros inválidos
+    """
+    logger.info(f'Consultando ranking de tipos por: {stat}')
+    try:
+        result = type_stats_index.type_leaderboard(stat, order=request.args.get('order', 'desc'))
+    except ValueError as e:
+        logger.warning(f'Ranking inválido: {str(e)}')
+        return create_response({
+            "error": f"¡Ups! {str(e)}",
+            "sugerencia": "Ejemplo: /pokedex/leaderboards/velocidad"
+        }, 400)
+    
+    return create_response({
+        "mensaje": f"¡Así se ordenan los tipos por {stat}!",
+        **result
+    })
+
 @pokemon_bp.route('pokedex/whos-that-pokemon', methods=['GET'], strict_slashes=False)
 @requires_auth
 @handle_api_errors
@@ -107,20 +680,30 @@ def random_pokemon():
     """
     Endpoint para obtener un Pokemon aleatorio.
     
+    Query params:
+        fields: Campos de la ficha, separados por coma (default: nombre, tipos, altura, peso y número)
+    
     Returns:
         Response: Información del Pokemon aleatorio o mensaje de error
         
     Status codes:
         200: Pokemon obtenido correctamente
+        400: Campos inválidos
         500: Error interno
     """
     logger.info('Solicitando Pokemon aleatorio')
     try:
-        pokemon_data = pokemon_service.get_random_pokemon()
+        fields = POKEMON_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, POKEMON_FIELDS)
+    try:
+        pokemon_data = pokemon_service.get_random_pokemon(fields)
         if pokemon_data:
-            logger.info(f'Pokemon aleatorio obtenido: {pokemon_data["pokemon"]["nombre"]}')
+            logger.info(f'Pokemon aleatorio obtenido: {pokemon_data["pokemon"].get("nombre")}')
             return create_response(pokemon_data)
         raise Exception("No se obtuvieron datos del Pokemon aleatorio")
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f'Error al obtener Pokemon aleatorio: {str(e)}')
         return create_response({
@@ -138,18 +721,28 @@ def random_pokemon_by_type(type):
     Args:
         type (str): Tipo de Pokemon (ej: fire, water, electric)
     
+    Query params:
+        fields: Campos de la ficha, separados por coma (default: nombre, tipos, altura, peso y número)
+    
     Returns:
         Response: Información del Pokemon aleatorio del tipo especificado o mensaje de error
         
     Status codes:
         200: Pokemon encontrado
+        400: Campos inválidos
         404: Tipo de Pokemon no válido
     """
     logger.info(f'Solicitando Pokemon aleatorio de tipo: {type}')
     try:
-        pokemon_data = pokemon_service.get_random_pokemon_by_type(type)
-        logger.info(f'Pokemon aleatorio de tipo {type} obtenido: {pokemon_data["pokemon"]["nombre"]}')
+        fields = POKEMON_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, POKEMON_FIELDS)
+    try:
+        pokemon_data = pokemon_service.get_random_pokemon_by_type(type, fields)
+        logger.info(f'Pokemon aleatorio de tipo {type} obtenido: {pokemon_data["pokemon"].get("nombre")}')
         return create_response(pokemon_data)
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f'Error al obtener Pokemon aleatorio de tipo {type}: {str(e)}')
         return create_response({
@@ -167,18 +760,28 @@ def longest_name_pokemon(type):
     Args:
         type (str): Tipo de Pokemon (ej: fire, water, electric)
     
+    Query params:
+        fields: Campos de la ficha, separados por coma (default: nombre, tipos, longitud del nombre y número)
+    
     Returns:
         Response: Información del Pokemon con el nombre más largo del tipo especificado
         
     Status codes:
         200: Pokemon encontrado
+        400: Campos inválidos
         404: Tipo de Pokemon no válido
     """
     logger.info(f'Buscando Pokemon con nombre más largo de tipo: {type}')
     try:
-        pokemon_data = pokemon_service.get_longest_name_pokemon_by_type(type)
-        logger.info(f'Encontrado Pokemon con nombre más largo de tipo {type}: {pokemon_data["pokemon"]["nombre"]}')
+        fields = POKEMON_FIELDS.parse(request.args.get('fields'))
+    except ValueError as e:
+        return invalid_fields_response(e, POKEMON_FIELDS)
+    try:
+        pokemon_data = pokemon_service.get_longest_name_pokemon_by_type(type, fields)
+        logger.info(f'Encontrado Pokemon con nombre más largo de tipo {type}: {pokemon_data["pokemon"].get("nombre")}')
         return create_response(pokemon_data)
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logger.error(f'Error al buscar Pokemon con nombre más largo de tipo {type}: {str(e)}')
         return create_response({
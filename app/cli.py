@@ -0,0 +1,45 @@
+"""
+Módulo de comandos de línea de comandos de la aplicación.
+Registra comandos `flask` para tareas de mantenimiento de la Pokedex.
+
+Ejemplo:
+    flask --app run pokedex-snapshot
+    flask --app run pokedex-refresh
+"""
+
+import click
+from flask import Flask
+from app.services.pokemon_service import PokemonService
+from app.services.pokedex_store import PokedexStore
+from app.services.refresh_service import RefreshService
+from app.services.snapshot_service import SnapshotService
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+def register_commands(app: Flask) -> None:
+    """
+    Registra los comandos de mantenimiento en la aplicación Flask.
+
+    Args:
+        app (Flask): Instancia de la aplicación Flask
+    """
+
+    @app.cli.command('pokedex-snapshot')
+    @click.option('--path', default=None, help='Ruta de salida del snapshot (default: POKEDEX_SNAPSHOT_PATH)')
+    def pokedex_snapshot(path):
+        """Descarga todos los Pokemon de la PokeAPI y guarda el snapshot local."""
+        snapshot_service = SnapshotService(path) if path else SnapshotService()
+        snapshot = snapshot_service.build(PokemonService())
+        snapshot_service.save(snapshot)
+        click.echo(f'Snapshot con {len(snapshot["pokemon"])} Pokemon guardado en {snapshot_service.path}')
+
+    @app.cli.command('pokedex-refresh')
+    @click.option('--path', default=None, help='Snapshot a actualizar (default: POKEDEX_SNAPSHOT_PATH)')
+    def pokedex_refresh(path):
+        """Actualiza el snapshot local descargando solo lo que cambió en la PokeAPI."""
+        snapshot_service = SnapshotService(path) if path else SnapshotService()
+        pokemon_service = PokemonService()
+        summary = RefreshService(PokedexStore(pokemon_service, snapshot_service)).run()
+        snapshot_service.save(snapshot_service.capture(pokemon_service))
+        click.echo(f'Snapshot actualizado en {snapshot_service.path}: {summary}')
@@ -1,6 +1,12 @@
 """
 Importa desde settings las variables de entorno y las dispone como paquete python para ser consumidas en init de app
 """
-from .settings import OKTA_DOMAIN, OKTA_CLIENT_ID, OKTA_CLIENT_SECRET, load_config
+from .settings import (
+    OKTA_DOMAIN, OKTA_CLIENT_ID, OKTA_CLIENT_SECRET, OKTA_AUTH_SERVER_URL,
+    POKEAPI_BASE_URL, POKEDEX_SNAPSHOT_PATH, load_config
+)
 
-__all__ = ['OKTA_DOMAIN', 'OKTA_CLIENT_ID', 'OKTA_CLIENT_SECRET', 'load_config']
\ No newline at end of file
+__all__ = [
+    'OKTA_DOMAIN', 'OKTA_CLIENT_ID', 'OKTA_CLIENT_SECRET', 'OKTA_AUTH_SERVER_URL',
+    'POKEAPI_BASE_URL', 'POKEDEX_SNAPSHOT_PATH', 'load_config'
+]
\ No newline at end of file
@@ -19,6 +19,77 @@ OKTA_DOMAIN = os.getenv('OKTA_DOMAIN')
 OKTA_CLIENT_ID = os.getenv('OKTA_CLIENT_ID')
 OKTA_CLIENT_SECRET = os.getenv('OKTA_CLIENT_SECRET')
 
+# Modo debug de Flask y logs en nivel DEBUG (gunicorn.conf.py lo desactiva en producción)
+DEBUG = os.getenv('POKEDEX_DEBUG', 'true').lower() in ('1', 'true', 'yes')
+
+# URLs de los servicios externos (se pueden apuntar a stubs locales para pruebas de carga)
+POKEAPI_BASE_URL = os.getenv('POKEAPI_BASE_URL', 'https://pokeapi.co/api/v2')
+OKTA_AUTH_SERVER_URL = os.getenv('OKTA_AUTH_SERVER_URL', f'https://{OKTA_DOMAIN}/oauth2/default')
+
+# Token para endpoints de administración y para pedir el perfilado de una request.
+# Si no está definido, los endpoints /admin quedan deshabilitados.
+ADMIN_TOKEN = os.getenv('ADMIN_TOKEN')
+
+# Perfilado de requests: proporción muestreada (0 = solo a pedido), modo ('sampling' o 'cprofile'),
+# directorio y cantidad máxima de perfiles guardados (los más viejos se borran)
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+PROFILE_MODE = os.getenv('PROFILE_MODE', 'sampling')
+PROFILE_DIR = os.getenv('PROFILE_DIR', 'logs/profiles')
+PROFILE_MAX_FILES = int(os.getenv('PROFILE_MAX_FILES', '50'))
+
+# Control de admisión (por proceso): máximo de requests concurrentes por clase de ruta
+# (el límite adaptativo se mueve entre 1 y este máximo), espera máxima en cola antes de
+# responder 503 y presupuesto de tiempo de cada request, en segundos
+ADMISSION_CONTROL = os.getenv('ADMISSION_CONTROL', 'true').lower() in ('1', 'true', 'yes')
+ADMISSION_LIMITS = {
+    'upstream': int(os.getenv('ADMISSION_LIMIT_UPSTREAM', '32')), #Rutas que consultan la PokeAPI en cada request
+    'cached': int(os.getenv('ADMISSION_LIMIT_CACHED', '64')), #Rutas servidas desde la cache de documentos
+    'local': int(os.getenv('ADMISSION_LIMIT_LOCAL', '64')), #Rutas servidas desde los índices en memoria
+    'export': int(os.getenv('ADMISSION_LIMIT_EXPORT', '4')), #Exportaciones (el lugar se ocupa hasta terminar de enviarlas)
+    'auth': int(os.getenv('ADMISSION_LIMIT_AUTH', '16')) #Obtención de tokens en Okta
+}
+ADMISSION_QUEUE_TIMEOUT = float(os.getenv('ADMISSION_QUEUE_TIMEOUT', '0.5'))
+REQUEST_DEADLINE = float(os.getenv('REQUEST_DEADLINE', '10'))
+
+# Hedging de GETs a la PokeAPI: si una request tarda más que el p95 de su endpoint se lanza
+# una segunda. Presupuesto de requests adicionales, espera mínima antes del hedge (segundos) y
+# muestras necesarias por endpoint antes de empezar
+HEDGE_REQUESTS = os.getenv('HEDGE_REQUESTS', 'false').lower() in ('1', 'true', 'yes')
+HEDGE_BUDGET = float(os.getenv('HEDGE_BUDGET', '0.05'))
+HEDGE_MIN_DELAY = float(os.getenv('HEDGE_MIN_DELAY', '0.005'))
+HEDGE_MIN_SAMPLES = int(os.getenv('HEDGE_MIN_SAMPLES', '20'))
+
+# Actualización en segundo plano: cada cuántos segundos se compara la cache con la PokeAPI
+# (0 = deshabilitada), requests simultáneas a la PokeAPI y Pokemon ya conocidos que se
+# vuelven a verificar en cada pasada (para detectar correcciones de datos)
+REFRESH_INTERVAL = float(os.getenv('REFRESH_INTERVAL', '0'))
+REFRESH_CONCURRENCY = int(os.getenv('REFRESH_CONCURRENCY', '8'))
+REFRESH_RECHECK_BATCH = int(os.getenv('REFRESH_RECHECK_BATCH', '50'))
+
+# Segundos que se recuerda un token validado por la introspección de Okta (0 = desactivada, default).
+# Atención: mientras un token está en cache no se consulta a Okta, así que un token revocado se sigue
+# aceptando hasta este tiempo (o hasta invalidar 'token/*' en /admin/caches)
+TOKEN_CACHE_TTL = float(os.getenv('TOKEN_CACHE_TTL', '0'))
+# Tokens que se recuerdan como máximo (se descartan los menos usados)
+TOKEN_CACHE_MAX_ENTRIES = int(os.getenv('TOKEN_CACHE_MAX_ENTRIES', '10000'))
+
+# Cache en disco de sprites (/pokedex/<name>/sprite): directorio, tamaño máximo en bytes
+# (se descartan los sprites usados hace más tiempo) y descargas simultáneas de sprites faltantes
+SPRITE_CACHE_DIR = os.getenv('SPRITE_CACHE_DIR', 'data/sprites')
+SPRITE_CACHE_MAX_BYTES = int(os.getenv('SPRITE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+SPRITE_FETCH_CONCURRENCY = int(os.getenv('SPRITE_FETCH_CONCURRENCY', '4'))
+
+# Ruta del snapshot local de la Pokedex (se genera con `flask --app run pokedex-snapshot`)
+POKEDEX_SNAPSHOT_PATH = os.getenv('POKEDEX_SNAPSHOT_PATH', 'data/pokedex_snapshot.json')
+
+# Procesos con los que la precarga construye columnas e índice invertido (1 = en el proceso
+# principal; con más, los documentos se reparten en un pool de procesos, ver app/services/bulk_build.py)
+INDEX_BUILD_PROCESSES = int(os.getenv('INDEX_BUILD_PROCESSES', '1'))
+
+# Si está activo, create_app carga el snapshot y construye los índices antes de atender requests
+# (con un servidor que hace fork después de crear la app, los workers los comparten copy-on-write)
+PRELOAD_POKEDEX = os.getenv('PRELOAD_POKEDEX', 'true').lower() in ('1', 'true', 'yes')
+
 def load_config(app: Flask) -> None:
     """
     Carga y valida la configuración inicial en la aplicación Flask.
@@ -35,7 +106,7 @@ def load_config(app: Flask) -> None:
     """
     # Configuración básica
     app.config['JSON_AS_ASCII'] = False #Permite caracteres especiales en las respuestas JSON.
-    app.config['DEBUG'] = True #Setea el nivel de la app en debug, mostrando mensajes logger en este nivel.
+    app.config['DEBUG'] = DEBUG #Setea el nivel de la app en debug, mostrando mensajes logger en este nivel.
     
     # Configurar logging
     setup_logging(app)
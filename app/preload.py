@@ -0,0 +1,105 @@
+"""
+Módulo de precarga de la Pokedex.
+Construye el estado pesado (caches, almacén columnar e índices) una sola vez, antes de
+atender requests. Con un servidor que hace fork después de crear la app (ej: gunicorn
+--preload), los workers heredan este estado y lo comparten copy-on-write.
+
+Los recursos propios de cada proceso (sesiones HTTP y archivos de log) se crean
+después del fork: ver app/utils/http.py y app/utils/logger.py.
+"""
+
+import gc
+import time
+from typing import Dict
+from app.config.settings import INDEX_BUILD_PROCESSES
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+def build_indexes() -> Dict[str, float]:
+    """
+    Construye (o reconstruye, si la cache cambió) el almacén columnar y los índices.
+    También se usa después de cada actualización en segundo plano, para que las
+    consultas no tengan que reconstruirlos.
+
+    Returns:
+        Dict[str, float]: Milisegundos que tardó cada etapa
+    """
+    #Lazy import: las instancias compartidas viven en el módulo de rutas
+    from app.api.routes import pokemon as routes
+
+    stages = {
+        "almacen": lambda: routes.pokedex_store.get_columns(wait=True),
+        "similitud": lambda: routes.similarity_index.get_state(wait=True),
+        "tipos": routes.type_chart.get_matrix,
+        "evoluciones": routes.evolution_index.get_graph,
+        "habilidades": routes.ability_index.get_state,
+        "integrantes": lambda: routes.type_members_index.get_state(wait=True),
+        "estadisticas": lambda: routes.type_stats_index.summary('normal'),
+    }
+    timings = {}
+    for stage, build in stages.items():
+        start = time.perf_counter()
+        build()
+        timings[stage] = round((time.perf_counter() - start) * 1000, 1)
+    return timings
+
+def bulk_build_indexes(processes: int) -> Dict[str, float]:
+    """
+    Construye columnas e índice invertido repartiendo los documentos entre procesos
+    (ver app/services/bulk_build.py) y los instala en las instancias compartidas.
+
+    Args:
+        processes (int): Procesos del pool
+
+    Returns:
+        Dict[str, float]: Milisegundos de cada etapa (carga del snapshot, reparto, proyección y fusión)
+    """
+    #Lazy import: las instancias compartidas viven en el módulo de rutas
+    from app.api.routes import pokemon as routes
+    from app.services.bulk_build import build_bulk
+
+    start = time.perf_counter()
+    routes.pokedex_store.load_snapshot()
+    pokemon_service = routes.pokedex_store.pokemon_service
+    version = pokemon_service.cache_version
+    documents = pokemon_service.get_cached_documents()
+    snapshot_ms = round((time.perf_counter() - start) * 1000, 1)
+
+    result = build_bulk(documents, processes=processes, version=version)
+    routes.pokedex_store.install_columns(result.columns, version)
+    routes.ability_index.install_state(result.inverted)
+    return {"snapshot": snapshot_ms, **result.timings}
+
+def preload_pokedex() -> Dict[str, float]:
+    """
+    Carga el snapshot local y construye los índices de la Pokedex.
+
+    Si no hay snapshot no hace nada: los índices se construyen a demanda en la primera consulta,
+    como antes, para no descargar la Pokedex entera desde la PokeAPI al iniciar.
+
+    Returns:
+        Dict[str, float]: Milisegundos que tardó cada etapa (vacío si no hay snapshot)
+
+    Ejemplo:
+        >>> preload_pokedex()
+        {'almacen': 41.2, 'similitud': 1.3, 'tipos': 0.4, 'evoluciones': 6.1, 'habilidades': 3.8}
+    """
+    #Lazy import: las instancias compartidas viven en el módulo de rutas
+    from app.api.routes import pokemon as routes
+
+    if not routes.pokedex_store.snapshot_service.exists():
+        logger.info('Sin snapshot local: los índices se construirán a demanda')
+        return {}
+
+    timings = {}
+    if INDEX_BUILD_PROCESSES > 1:
+        timings.update(bulk_build_indexes(INDEX_BUILD_PROCESSES))
+    timings.update(build_indexes()) #Con la construcción en bloque, columnas y habilidades ya están al día
+
+    # Mueve lo construido a la generación permanente: el GC deja de recorrer (y escribir)
+    # esos objetos, así las páginas heredadas por los workers no se copian
+    gc.collect()
+    gc.freeze()
+    logger.info(f'Pokedex precargada: {timings}')
+    return timings
@@ -0,0 +1,36 @@
+"""
+Módulo de tareas periódicas de la aplicación.
+Registra la actualización incremental de la Pokedex en segundo plano (ver
+app/services/refresh_service.py) cuando REFRESH_INTERVAL es mayor a cero.
+"""
+
+from flask import Flask
+from app.config.settings import REFRESH_INTERVAL
+from app.services.refresh_service import RefreshScheduler
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+def register_refresh_scheduler(app: Flask) -> None:
+    """
+    Registra la actualización en segundo plano en la aplicación Flask.
+
+    El thread se inicia con la primera request de cada proceso: así corre en los workers
+    y no en el master que los crea con fork (los threads no sobreviven al fork).
+
+    Args:
+        app (Flask): Instancia de la aplicación Flask
+    """
+    if REFRESH_INTERVAL <= 0:
+        return
+
+    #Lazy import: las instancias compartidas viven en el módulo de rutas
+    from app.api.routes.pokemon import refresh_service
+    from app.preload import build_indexes
+
+    scheduler = RefreshScheduler(refresh_service, REFRESH_INTERVAL, on_refresh=build_indexes)
+    app.extensions['pokedex_refresh'] = scheduler
+
+    @app.before_request
+    def start_refresh_scheduler():
+        scheduler.ensure_started()
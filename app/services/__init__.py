@@ -3,9 +3,31 @@ Módulo de inicialización de servicios.
 Exporta las clases de servicios disponibles para la aplicación:
     AuthService para autenticación
     PokemonService para operaciones con Pokemon.
+    SnapshotService para el snapshot local de la Pokedex.
+    PokedexStore para consultas vectorizadas sobre la Pokedex.
+    SimilarityIndex para buscar Pokemon con stats parecidos.
+    TypeChart para efectividad de tipos y cobertura de equipos.
+    EvolutionIndex para consultas de líneas evolutivas.
+    AbilityIndex para búsquedas inversas por habilidad y tipo.
+    RefreshService para la actualización incremental de la cache.
+    ExportService para la exportación masiva en NDJSON o CSV.
+    SpriteCache para la cache de sprites en disco.
+    TypeMembersIndex para el listado paginado de integrantes por tipo.
+    TypeStatsIndex para estadísticas y rankings por tipo.
 """
 
 from .auth_service import AuthService
 from .pokemon_service import PokemonService
+from .snapshot_service import SnapshotService
+from .pokedex_store import PokedexStore
+from .similarity_index import SimilarityIndex
+from .type_chart import TypeChart
+from .evolution_index import EvolutionIndex
+from .ability_index import AbilityIndex
+from .refresh_service import RefreshService
+from .export_service import ExportService
+from .sprite_cache import SpriteCache
+from .type_members_index import TypeMembersIndex
+from .type_stats import TypeStatsIndex
 
-__all__ = ['AuthService', 'PokemonService']
\ No newline at end of file
+__all__ = ['AuthService', 'PokemonService', 'SnapshotService', 'PokedexStore', 'SimilarityIndex', 'TypeChart', 'EvolutionIndex', 'AbilityIndex', 'RefreshService', 'ExportService', 'SpriteCache', 'TypeMembersIndex', 'TypeStatsIndex']
\ No newline at end of file
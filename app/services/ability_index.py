@@ -0,0 +1,189 @@
+"""
+Módulo de índice invertido de la Pokedex.
+Relaciona cada habilidad, cada tipo y cada par de tipos con un array ordenado de
+números de Pokedex, para resolver búsquedas como "Pokemon fantasma con levitate"
+con intersecciones y uniones de arrays ordenados.
+"""
+
+import threading
+import numpy as np
+from functools import reduce
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+from app.services.pokedex_store import PokedexStore, TYPE_INDEX
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+EMPTY_IDS = np.empty(0, dtype=np.int32)
+
+def normalize_ability(name: str) -> str:
+    """
+    Normaliza el nombre de una habilidad al formato de la PokeAPI.
+
+    Ejemplo:
+        >>> normalize_ability('Swift Swim')
+        'swift-swim'
+    """
+    return name.strip().lower().replace(' ', '-')
+
+def type_key(type_names: Iterable[str]) -> Tuple[str, ...]:
+    """Clave del índice para un tipo o un par de tipos (sin importar el orden)."""
+    return tuple(sorted(type_name.lower() for type_name in type_names))
+
+class InvertedIndexState(NamedTuple):
+    """
+    Estado del índice invertido.
+
+    Attr:
+        abilities (Dict[str, np.ndarray]): Habilidad -> números de Pokedex ordenados (int32)
+        types (Dict[Tuple[str, ...], np.ndarray]): Tipo o par de tipos -> números de Pokedex ordenados
+        version (int): Versión de la cache del PokemonService con la que se construyó
+    """
+    abilities: Dict[str, np.ndarray]
+    types: Dict[Tuple[str, ...], np.ndarray]
+    version: int
+
+def build_inverted_index(documents: Iterable[Dict], version: int = 0) -> InvertedIndexState:
+    """
+    Construye el índice invertido a partir de documentos /pokemon/<x>.
+
+    Args:
+        documents (Iterable[Dict]): Documentos completos o recortados
+        version (int, optional): Versión de la cache de origen
+
+    Returns:
+        InvertedIndexState: Índice con arrays ordenados y sin duplicados
+    """
+    abilities: Dict[str, List[int]] = {}
+    types: Dict[Tuple[str, ...], List[int]] = {}
+    for data in documents:
+        pokemon_id = data['id']
+        for ability in data['abilities']:
+            abilities.setdefault(ability['ability']['name'], []).append(pokemon_id)
+        type_names = [t['type']['name'] for t in data['types']]
+        for type_name in type_names:
+            types.setdefault((type_name,), []).append(pokemon_id)
+        if len(type_names) > 1:
+            types.setdefault(type_key(type_names[:2]), []).append(pokemon_id)
+
+    def compact(postings: Dict) -> Dict:
+        return {key: np.unique(np.array(ids, dtype=np.int32)) for key, ids in postings.items()}
+
+    return InvertedIndexState(abilities=compact(abilities), types=compact(types), version=version)
+
+class AbilityIndex:
+    """
+    Índice invertido de habilidades y tipos sobre la cache del PokemonService.
+
+    Se reconstruye cuando cambia la versión de la cache, sin consultas adicionales a la PokeAPI.
+
+    Attributes:
+        store (PokedexStore): Almacén de la Pokedex (provee cache y columnas para las fichas)
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa el índice vacío. Se construye en la primera consulta.
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._state: Optional[InvertedIndexState] = None
+        self._lock = threading.Lock()
+
+    def get_state(self) -> InvertedIndexState:
+        """
+        Obtiene el índice, reconstruyéndolo si la cache cambió.
+        Si otro thread ya lo está reconstruyendo, devuelve el anterior sin esperar.
+
+        Returns:
+            InvertedIndexState: Índice actual
+        """
+        self.store.load_snapshot()
+        pokemon_service = self.store.pokemon_service
+        state = self._state
+        if state is not None and state.version == pokemon_service.cache_version:
+            return state
+        if state is not None:
+            if not self._lock.acquire(blocking=False):
+                return state
+        else:
+            self._lock.acquire()
+
+        try:
+            version = pokemon_service.cache_version
+            if self._state is None or self._state.version != version:
+                self._state = build_inverted_index(pokemon_service.get_cached_documents(), version)
+                logger.info(f'Índice invertido construido con {len(self._state.abilities)} habilidades')
+            return self._state
+        finally:
+            self._lock.release()
+
+    def install_state(self, state: InvertedIndexState) -> None:
+        """
+        Reemplaza el índice por uno construido afuera (ej: app/services/bulk_build.py).
+        Si la cache cambió después de state.version, se reconstruye en la siguiente consulta.
+        """
+        with self._lock:
+            self._state = state
+        logger.info(f'Índice invertido instalado con {len(state.abilities)} habilidades')
+
+    def search(self, abilities: List[str], ability_mode: str = 'all', types: List[str] = None,
+               default_only: bool = False, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """
+        Busca Pokemon por habilidades y, opcionalmente, tipos.
+
+        Args:
+            abilities (List[str]): Habilidades a buscar
+            ability_mode (str, optional): 'all' (intersección, default) o 'any' (unión)
+            types (List[str], optional): Uno o dos tipos que también deben tener (intersección)
+            default_only (bool, optional): Solo formas default. Default = False.
+            fields (Tuple[str, ...], optional): Campos de cada ficha (ver ROW_FIELDS). Default = todos.
+
+        Returns:
+            Dict: Total de coincidencias y fichas resumidas
+
+        Raises:
+            KeyError: Si alguna habilidad no existe en el índice
+            ValueError: Si algún tipo no existe o se piden más de dos tipos
+
+        Ejemplo:
+            >>> ability_index.search(['levitate'], types=['ghost'])
+        """
+        if not abilities:
+            raise ValueError("Indicá al menos una habilidad")
+        state = self.get_state()
+
+        postings = []
+        for ability in abilities:
+            key = normalize_ability(ability)
+            if key not in state.abilities:
+                raise KeyError(ability)
+            postings.append(state.abilities[key])
+        if ability_mode == 'all':
+            ids = reduce(lambda left, right: np.intersect1d(left, right, assume_unique=True), postings)
+        else:
+            ids = reduce(np.union1d, postings)
+
+        if types:
+            if len(types) > 2:
+                raise ValueError("Se pueden combinar como máximo dos tipos")
+            for type_name in types:
+                if type_name.lower() not in TYPE_INDEX:
+                    raise ValueError(f"No conozco el tipo '{type_name}'")
+            ids = np.intersect1d(ids, state.types.get(type_key(types), EMPTY_IDS), assume_unique=True)
+
+        # Las columnas están ordenadas por número de Pokedex: searchsorted da la fila de cada ID
+        columns = self.store.get_columns()
+        rows = np.searchsorted(columns.ids, ids)
+        found = rows < len(columns.ids)
+        rows, ids = rows[found], ids[found]
+        rows = rows[columns.ids[rows] == ids]
+        if default_only:
+            rows = rows[columns.is_default[rows]]
+
+        return {
+            "total": int(len(rows)),
+            "pokemon": [PokedexStore.row_to_dict(columns, row, fields) for row in rows]
+        }
@@ -3,13 +3,106 @@ Módulo de servicio de autenticación y validación de tokens usando Okta como p
 Proporciona métodos para obtener tokens y validar su estado.
 """
 
+import hashlib
+import threading
+import time
 import requests
-from typing import Union
-from app.config.settings import OKTA_DOMAIN, OKTA_CLIENT_ID, OKTA_CLIENT_SECRET
+from collections import OrderedDict
+from typing import Dict, Union
+from app.config.settings import OKTA_CLIENT_ID, OKTA_CLIENT_SECRET, OKTA_AUTH_SERVER_URL, TOKEN_CACHE_TTL, TOKEN_CACHE_MAX_ENTRIES
+from app.utils.admission import DeadlineExceeded, request_timeout
+from app.utils.cache import CacheStats, deep_sizeof, matches
+from app.utils.http import get_http_session
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
+class TokenCache:
+    """
+    Cache de tokens validados por la introspección de Okta.
+
+    Solo recuerda tokens activos, hasta TOKEN_CACHE_TTL o hasta que vencen (lo que ocurra
+    primero). Las claves son un hash del token: los tokens nunca aparecen en las métricas.
+    Está desactivada por defecto (TOKEN_CACHE_TTL=0): un token revocado en Okta se sigue
+    aceptando mientras está en cache.
+
+    Attributes:
+        ttl (float): Segundos que se recuerda un token (0 desactiva la cache)
+        max_entries (int): Tokens que se recuerdan como máximo
+        stats (CacheStats): Métricas de uso
+    """
+
+    def __init__(self, ttl: float = TOKEN_CACHE_TTL, max_entries: int = TOKEN_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict = OrderedDict() #Clave -> momento en que vence
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(token: str) -> str:
+        return f"token/{hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]}"
+
+    def get(self, token: str) -> bool:
+        """Indica si el token está en cache y sigue vigente."""
+        if self.ttl <= 0:
+            return False
+        key = self.key_for(token)
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is None:
+                self.stats.miss()
+                return False
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.evicted([key])
+                self.stats.miss()
+                return False
+            self._entries.move_to_end(key)
+            self.stats.hit(key)
+            return True
+
+    def put(self, token: str, expires_in: float) -> None:
+        """
+        Recuerda un token activo.
+
+        Args:
+            token (str): Token validado
+            expires_in (float): Segundos hasta que vence el token
+        """
+        ttl = min(self.ttl, expires_in)
+        if ttl <= 0:
+            return
+        key = self.key_for(token)
+        with self._lock:
+            self._entries[key] = time.monotonic() + ttl
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                oldest, _ = self._entries.popitem(last=False)
+                self.stats.evicted([oldest])
+
+    def invalidate(self, pattern: str) -> int:
+        """
+        Elimina los tokens que corresponden a un patrón ('token/<hash>', 'token/*' o '*').
+
+        Returns:
+            int: Tokens eliminados
+        """
+        with self._lock:
+            keys = [key for key in self._entries if matches(pattern, key)]
+            for key in keys:
+                del self._entries[key]
+        self.stats.evicted(keys)
+        return len(keys)
+
+    def report(self, top: int = 10) -> Dict:
+        """Métricas de la cache (ver CacheStats.report)."""
+        with self._lock:
+            entries = dict(self._entries)
+        return self.stats.report(len(entries), deep_sizeof(entries), top)
+
+token_cache = TokenCache()
+
 class AuthService:
     """
     Servicio de autenticación que interactúa con Okta.
@@ -24,8 +117,8 @@ class AuthService:
         Inicia el servicio de autenticación con las URLs de Okta.
         Configura las URLs necesarias para la autenticación y validación.
         """
-        self.token_url = f"https://{OKTA_DOMAIN}/oauth2/default/v1/token"
-        self.introspect_url = f"https://{OKTA_DOMAIN}/oauth2/default/v1/introspect"
+        self.token_url = f"{OKTA_AUTH_SERVER_URL}/v1/token"
+        self.introspect_url = f"{OKTA_AUTH_SERVER_URL}/v1/introspect"
         logger.debug('Servicio de autenticación iniciado.')
         
     def get_auth_token(self, username: str, password: str) -> Union[str, None]:
@@ -63,7 +156,7 @@ class AuthService:
         
         try:
             logger.debug('Enviando solicitud de auth a Okta')
-            response = requests.post(self.token_url, headers=headers, data=data)
+            response = get_http_session().post(self.token_url, headers=headers, data=data, timeout=request_timeout(10))
             
             if response.status_code == 200:
                 logger.info('---Token obtenido exitosamente')
@@ -72,6 +165,8 @@ class AuthService:
             logger.warning(f'Fallo en autenticación. Status code: {response.status_code}')
             return None
             
+        except DeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
             logger.error(f'---Error en solicitud de token: {str(e)}')
             return None
@@ -79,6 +174,8 @@ class AuthService:
     def validate_token(self, token: str) -> bool:
         """
         Valida un token de acceso usando el endpoint de introspección de Okta.
+        Si TOKEN_CACHE_TTL > 0, los tokens activos se recuerdan en `token_cache` para no consultar
+        a Okta en cada request (un token revocado se acepta hasta que sale de la cache).
         
         Args:
             token (str): Token de acceso a validar
@@ -93,6 +190,9 @@ class AuthService:
         """
         logger.debug(f'Validando token: {token[:10]}...')
         
+        if token_cache.get(token):
+            return True
+        
         headers = {
             'Accept': 'application/json',
             'Content-Type': 'application/x-www-form-urlencoded'
@@ -106,16 +206,22 @@ class AuthService:
         }
         
         try:
-            response = requests.post(self.introspect_url, headers=headers, data=data)
+            response = get_http_session().post(self.introspect_url, headers=headers, data=data, timeout=request_timeout(10))
             
             if response.status_code == 200:
-                is_active = response.json().get('active', False)
+                introspection = response.json()
+                is_active = introspection.get('active', False)
+                if is_active:
+                    expires_in = introspection['exp'] - time.time() if 'exp' in introspection else token_cache.ttl
+                    token_cache.put(token, expires_in)
                 logger.info(f'---Token validado. Estado: {"válido" if is_active else "inválido"}')
                 return is_active
             
             logger.warning(f'Error en validación de token. Status code: {response.status_code}')
             return False
             
+        except DeadlineExceeded:
+            raise
         except requests.exceptions.RequestException as e:
             logger.error(f'---Error en validación de token: {str(e)}')
             return False
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Módulo de índice de evoluciones.
+Mantiene en memoria el grafo de evoluciones de todas las especies conocidas como
+arrays de adyacencia indexados por ID de especie, para responder ancestros,
+descendientes y ramificaciones sin consultar /pokemon-species ni /evolution-chain.
+"""
+
+import threading
+from collections import deque
+import numpy as np
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from app.services.pokedex_store import PokedexStore
+from app.services.pokemon_service import id_from_url
+from app.utils.admission import DeadlineExceeded
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+class EvolutionGraph(NamedTuple):
+    """
+    Grafo de evoluciones compilado. Todos los arrays se indexan por ID de especie.
+
+    Attr:
+        parent (np.ndarray): Especie de la que evoluciona, -1 si es raíz o desconocida (int32)
+        root (np.ndarray): Especie raíz de su cadena, -1 si es desconocida (int32)
+        child_offsets (np.ndarray): Inicio de los hijos de cada especie en child_ids (CSR, int32)
+        child_ids (np.ndarray): Hijos de todas las especies, agrupados por padre (int32)
+        names (Dict[int, str]): Nombre de cada especie
+        ids_by_name (Dict[str, int]): ID de cada especie por nombre
+        details (Dict[int, Dict]): Cómo se llega a cada especie desde su padre
+    """
+    parent: np.ndarray
+    root: np.ndarray
+    child_offsets: np.ndarray
+    child_ids: np.ndarray
+    names: Dict[int, str]
+    ids_by_name: Dict[str, int]
+    details: Dict[int, Dict]
+
+def compile_graph(parents: Dict[int, int], names: Dict[int, str], details: Dict[int, Dict]) -> EvolutionGraph:
+    """
+    Compila las aristas del grafo en arrays de adyacencia.
+
+    Args:
+        parents (Dict[int, int]): Padre de cada especie (-1 para las raíces)
+        names (Dict[int, str]): Nombre de cada especie
+        details (Dict[int, Dict]): Detalles de la evolución hacia cada especie
+
+    Returns:
+        EvolutionGraph: Grafo compilado
+    """
+    size = max(parents, default=0) + 1
+    species = np.fromiter(parents.keys(), dtype=np.int32, count=len(parents))
+    parent = np.full(size, -1, dtype=np.int32)
+    parent[species] = np.fromiter(parents.values(), dtype=np.int32, count=len(parents))
+
+    # Raíz de cada especie por saltos de punteros: cada paso duplica la distancia recorrida
+    root = np.full(size, -1, dtype=np.int32)
+    root[species] = species
+    ancestor = np.where(parent >= 0, parent, root)
+    while True:
+        jumped = np.where(ancestor >= 0, ancestor[np.maximum(ancestor, 0)], -1)
+        if np.array_equal(jumped, ancestor):
+            break
+        ancestor = jumped
+    root[species] = ancestor[species]
+
+    # Hijos en formato CSR: los hijos de s son child_ids[child_offsets[s]:child_offsets[s + 1]]
+    children = np.flatnonzero(parent >= 0).astype(np.int32)
+    children = children[np.argsort(parent[children], kind='stable')]
+    counts = np.bincount(parent[children], minlength=size)
+    child_offsets = np.zeros(size + 1, dtype=np.int32)
+    np.cumsum(counts, out=child_offsets[1:])
+
+    return EvolutionGraph(
+        parent=parent,
+        root=root,
+        child_offsets=child_offsets,
+        child_ids=children,
+        names=dict(names),
+        ids_by_name={name: species_id for species_id, name in names.items()},
+        details=dict(details)
+    )
+
+class EvolutionIndex:
+    """
+    Índice de evoluciones en memoria.
+
+    Se construye en bloque con las cadenas evolutivas del snapshot o de la cache del
+    PokemonService. Cuando se consulta una especie desconocida, se descarga solo su cadena
+    y se incorpora al índice de forma incremental. Si cambia una cadena ya conocida (ej: tras
+    una invalidación o una actualización en segundo plano) el grafo se arma de nuevo.
+
+    Attributes:
+        store (PokedexStore): Almacén de la Pokedex (provee snapshot y PokemonService)
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa el índice vacío. Se construye en la primera consulta.
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._parents: Dict[int, int] = {}
+        self._names: Dict[int, str] = {}
+        self._details: Dict[int, Dict] = {}
+        self._chains: Dict[int, Dict] = {} #ID de cadena -> documento incorporado
+        self._graph: Optional[EvolutionGraph] = None
+        self._built_version = -1
+        self._lock = threading.RLock()
+
+    def add_chains(self, chains: Iterable[Dict]) -> None:
+        """
+        Incorpora cadenas evolutivas al índice y recompila los arrays.
+
+        Args:
+            chains (Iterable[Dict]): Documentos /evolution-chain/<id> recortados
+        """
+        with self._lock:
+            for chain in chains:
+                self._chains[chain['id']] = chain
+                pending = [(chain['chain'], -1)]
+                while pending:
+                    link, parent_id = pending.pop()
+                    species_id = id_from_url(link['species']['url'])
+                    self._parents[species_id] = parent_id
+                    self._names[species_id] = link['species']['name']
+                    if link['evolution_details']:
+                        self._details[species_id] = link['evolution_details'][0]
+                    pending.extend((child, species_id) for child in link['evolves_to'])
+            self._graph = compile_graph(self._parents, self._names, self._details)
+        logger.info(f'Índice de evoluciones compilado con {len(self._parents)} especies')
+
+    def get_graph(self) -> EvolutionGraph:
+        """
+        Obtiene el grafo compilado, construyéndolo en bloque si todavía no existe e
+        incorporando las cadenas que cambiaron en la cache del PokemonService.
+
+        Returns:
+            EvolutionGraph: Grafo actual
+        """
+        pokemon_service = self.store.pokemon_service
+        if self._graph is not None and self._built_version == pokemon_service.evolution_chain_cache_version:
+            return self._graph
+
+        with self._lock:
+            self.store.load_snapshot()
+            version = pokemon_service.evolution_chain_cache_version
+            chains = dict(pokemon_service.evolution_chain_cache)
+            changed = [chain for chain_id, chain in chains.items() if self._chains.get(chain_id) is not chain]
+            if any(chain['id'] in self._chains for chain in changed):
+                # Cambió una cadena conocida: puede haber perdido especies, se arma todo de nuevo
+                self._parents, self._names, self._details, self._chains = {}, {}, {}, {}
+                changed = list(chains.values())
+            if changed or self._graph is None:
+                self.add_chains(changed)
+            self._built_version = version
+            return self._graph
+
+    def _species_for(self, name: str) -> int:
+        """
+        Obtiene el ID de especie de un Pokemon, incorporando su cadena si es desconocida.
+
+        Raises:
+            KeyError: Si el Pokemon no existe
+        """
+        graph = self.get_graph()
+        pokemon_service = self.store.pokemon_service
+        try:
+            document = pokemon_service.get_pokemon_document(name)
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            raise KeyError(name) from e
+
+        species_id = id_from_url(document['species']['url'])
+        if species_id >= len(graph.root) or graph.root[species_id] < 0:
+            chain_id = pokemon_service.get_evolution_chain_id(species_id)
+            self.add_chains([pokemon_service.get_evolution_chain_document(chain_id)])
+        return species_id
+
+    def _children(self, graph: EvolutionGraph, species_id: int) -> np.ndarray:
+        """Hijos directos de una especie."""
+        return graph.child_ids[graph.child_offsets[species_id]:graph.child_offsets[species_id + 1]]
+
+    def _describe(self, graph: EvolutionGraph, species_id: int) -> Dict:
+        """Resumen de una especie dentro de su cadena."""
+        description = {"especie": graph.names[species_id], "id_especie": int(species_id)}
+        parent_id = int(graph.parent[species_id])
+        if parent_id >= 0:
+            description["evoluciona_de"] = graph.names[parent_id]
+            details = graph.details.get(species_id)
+            if details:
+                description["como"] = {
+                    "disparador": details.get('trigger'),
+                    "nivel_minimo": details.get('min_level'),
+                    "objeto": details.get('item')
+                }
+        return description
+
+    def lineage(self, name: str) -> Dict:
+        """
+        Obtiene ancestros, descendientes y ramificaciones de un Pokemon.
+
+        Args:
+            name (str): Nombre del Pokemon
+
+        Returns:
+            Dict: Especie, raíz de la cadena, ancestros, descendientes y ramificaciones
+
+        Raises:
+            KeyError: Si el Pokemon no existe
+
+        Ejemplo:
+            >>> evolution_index.lineage('eevee')['descendientes']
+        """
+        species_id = self._species_for(name)
+        graph = self.get_graph()
+
+        ancestors: List[int] = []
+        current = int(graph.parent[species_id])
+        while current >= 0:
+            ancestors.append(current)
+            current = int(graph.parent[current])
+        ancestors.reverse()
+
+        descendants: List[int] = []
+        pending = deque(int(child) for child in self._children(graph, species_id))
+        while pending:
+            current = pending.popleft()
+            descendants.append(current)
+            pending.extend(int(child) for child in self._children(graph, current))
+
+        # Ramificaciones: especies de toda la cadena con más de una evolución posible
+        root_id = int(graph.root[species_id])
+        branches = []
+        pending = deque([root_id])
+        while pending:
+            current = pending.popleft()
+            children = self._children(graph, current)
+            if len(children) > 1:
+                branches.append({
+                    "especie": graph.names[current],
+                    "evoluciones": [graph.names[int(child)] for child in children]
+                })
+            pending.extend(int(child) for child in children)
+
+        return {
+            "especie": self._describe(graph, species_id),
+            "raiz": graph.names[root_id],
+            "ancestros": [self._describe(graph, ancestor) for ancestor in ancestors],
+            "descendientes": [self._describe(graph, descendant) for descendant in descendants],
+            "ramificaciones": branches
+        }
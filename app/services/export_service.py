@@ -0,0 +1,154 @@
+"""
+Módulo de exportación masiva de la Pokedex.
+Genera las fichas de todos los Pokemon (las mismas que /pokedex/<name>) en NDJSON o CSV,
+de a tandas, para enviarlas como respuesta en streaming: la memoria no depende del tamaño
+de la Pokedex y el cliente no necesita una request (ni una introspección de token) por Pokemon.
+
+Las fichas salen ordenadas por número de Pokedex. Para retomar una exportación cortada,
+se pide de nuevo con cursor=<último número_pokedex recibido>. Los documentos se toman de
+una misma versión de la cache antes de empezar a enviar, así la cantidad anunciada
+(X-Pokedex-Export-Total) es exactamente la que se envía.
+"""
+
+import csv
+import io
+import json
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+from app.services.pokedex_store import PokedexStore, STAT_NAMES, types_to_mask
+from app.services.pokemon_service import POKEMON_FIELDS, build_pokemon_record
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+# Orden de los campos en el CSV (la ficha por defecto conserva las columnas de siempre:
+# número_pokedex, nombre, tipos, altura, peso, habilidades y un stat por columna)
+CSV_FIELD_ORDER = ('número_pokedex', 'nombre', 'tipos', 'altura', 'peso', 'habilidades', 'stats', 'longitud_nombre')
+
+class ExportService:
+    """
+    Servicio de exportación de la Pokedex.
+
+    Attributes:
+        store (PokedexStore): Almacén columnar (define qué Pokemon se exportan y en qué orden)
+        batch_size (int): Fichas por cada fragmento de la respuesta
+    """
+
+    def __init__(self, store: PokedexStore, batch_size: int = 100):
+        self.store = store
+        self.batch_size = batch_size
+
+    def select(self, types: List[str] = None, cursor: int = 0, limit: Optional[int] = None,
+               default_only: bool = False) -> np.ndarray:
+        """
+        Elige las filas a exportar (solo índices: las fichas se arman al enviarlas).
+
+        Args:
+            types (List[str], optional): Tipos que deben tener todos los Pokemon exportados
+            cursor (int, optional): Se exportan los Pokemon con número mayor a este. Default = 0.
+            limit (int, optional): Cantidad máxima de Pokemon
+            default_only (bool, optional): Solo formas default. Default = False.
+
+        Returns:
+            np.ndarray: Filas de las columnas, en orden de número de Pokedex
+
+        Raises:
+            ValueError: Si algún tipo no existe
+        """
+        columns = self.store.get_columns()
+        mask = columns.ids > cursor
+        if types:
+            type_mask = np.uint32(types_to_mask(types))
+            mask &= (columns.type_mask & type_mask) == type_mask
+        if default_only:
+            mask &= columns.is_default
+        rows = np.flatnonzero(mask)
+        return rows[:limit] if limit is not None else rows
+
+    def resolve(self, rows: np.ndarray) -> List[Dict]:
+        """
+        Obtiene los documentos de las filas elegidas (referencias, no copias) de una misma
+        versión de la cache. Se omiten los Pokemon que salieron de la cache después de
+        construir las columnas.
+
+        Args:
+            rows (np.ndarray): Filas elegidas con select()
+
+        Returns:
+            List[Dict]: Documentos /pokemon/<x> a exportar, en el orden de las filas
+        """
+        names = self.store.get_columns().names
+        cache = self.store.pokemon_service.pokemon_cache #La cache se reemplaza completa: esta referencia no cambia
+        documents = [cache.get(str(names[row])) for row in rows]
+        return [document for document in documents if document is not None]
+
+    @staticmethod
+    def _csv_fields(fields: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Campos pedidos en el orden de CSV_FIELD_ORDER (las columnas no dependen del orden del parámetro)."""
+        return tuple(field for field in CSV_FIELD_ORDER if field in fields)
+
+    @staticmethod
+    def _csv_header(fields: Tuple[str, ...]) -> List[str]:
+        """Columnas del CSV: los stats van en columnas propias."""
+        return [column for field in fields for column in (STAT_NAMES if field == 'stats' else (field,))]
+
+    @staticmethod
+    def _csv_row(record: Dict, fields: Tuple[str, ...]) -> List:
+        """Fila del CSV, en el orden de las columnas: las listas se unen con '|'."""
+        row = []
+        for field in fields:
+            value = record[field]
+            if field == 'stats':
+                row.extend(value[stat] for stat in STAT_NAMES)
+            elif isinstance(value, list):
+                row.append('|'.join(value))
+            else:
+                row.append(value)
+        return row
+
+    def stream(self, documents: List[Dict], export_format: str = 'ndjson',
+               fields: Optional[Tuple[str, ...]] = None) -> Iterator[bytes]:
+        """
+        Genera el contenido de la exportación en fragmentos de `batch_size` fichas.
+
+        Args:
+            documents (List[Dict]): Documentos obtenidos con resolve()
+            export_format (str, optional): 'ndjson' o 'csv'. Default = 'ndjson'.
+            fields (Tuple[str, ...], optional): Campos de cada ficha (ver POKEMON_FIELDS). Default = ficha completa.
+
+        Returns:
+            Iterator[bytes]: Fragmentos en UTF-8
+
+        Ejemplo:
+            >>> documents = export_service.resolve(export_service.select(types=['fire']))
+            >>> Response(export_service.stream(documents, 'csv'), mimetype='text/csv')
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+        csv_fields = self._csv_fields(fields or POKEMON_FIELDS.default)
+        if export_format == 'csv':
+            writer.writerow(self._csv_header(csv_fields))
+
+        pending = 0
+        for document in documents:
+            record = build_pokemon_record(document, fields)
+            if export_format == 'csv':
+                writer.writerow(self._csv_row(record, csv_fields))
+            else:
+                buffer.write(json.dumps(record, ensure_ascii=False))
+                buffer.write('\n')
+            pending += 1
+            if pending == self.batch_size:
+                yield buffer.getvalue().encode('utf-8')
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+        logger.info(f'Exportación {export_format} completa: {len(documents)} Pokemon')
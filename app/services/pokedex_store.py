@@ -0,0 +1,404 @@
+"""
+Módulo de almacenamiento columnar de la Pokedex.
+Mantiene en arrays de NumPy los stats base, altura, peso, tipos y formas default
+de todos los Pokemon conocidos (cache o snapshot), para resolver consultas como
+"los 10 Pokemon de agua más rápidos" con operaciones vectorizadas.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+from app.services.pokemon_service import PokemonService
+from app.services.snapshot_service import SnapshotService
+from app.utils.fields import FieldSet
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Tipos en el orden de la PokeAPI. La posición define el bit de cada tipo en type_mask.
+TYPE_NAMES = (
+    'normal', 'fighting', 'flying', 'poison', 'ground', 'rock',
+    'bug', 'ghost', 'steel', 'fire', 'water', 'grass',
+    'electric', 'psychic', 'ice', 'dragon', 'dark', 'fairy'
+)
+TYPE_INDEX = {name: index for index, name in enumerate(TYPE_NAMES)}
+
+# Stats en el orden de la PokeAPI, con los nombres que usa la API en sus respuestas
+STAT_NAMES = ('hp', 'ataque', 'defensa', 'ataque_especial', 'defensa_especial', 'velocidad')
+
+# Columnas numéricas por las que se puede filtrar y ordenar
+SORTABLE_COLUMNS = STAT_NAMES + ('total', 'altura', 'peso', 'número_pokedex')
+
+class PokedexColumns(NamedTuple):
+    """
+    Columnas de la Pokedex. Todas las columnas tienen una fila por Pokemon.
+
+    Attr:
+        ids (np.ndarray): Número de Pokedex (int32)
+        names (np.ndarray): Nombre del Pokemon (str)
+        stats (np.ndarray): Matriz (n, 6) de stats base (int16), en el orden de STAT_NAMES
+        height (np.ndarray): Altura en decímetros (int32)
+        weight (np.ndarray): Peso en hectogramos (int32)
+        primary_type (np.ndarray): Índice en TYPE_NAMES del primer tipo (int8)
+        secondary_type (np.ndarray): Índice del segundo tipo, -1 si no tiene (int8)
+        type_mask (np.ndarray): Bitmask de tipos (uint32), bit i = TYPE_NAMES[i]
+        is_default (np.ndarray): True si es la forma base del Pokemon (bool)
+    """
+    ids: np.ndarray
+    names: np.ndarray
+    stats: np.ndarray
+    height: np.ndarray
+    weight: np.ndarray
+    primary_type: np.ndarray
+    secondary_type: np.ndarray
+    type_mask: np.ndarray
+    is_default: np.ndarray
+
+# Campos de la ficha resumida, calculados a partir de una fila de las columnas
+ROW_FIELDS = FieldSet({
+    "nombre": lambda columns, row: str(columns.names[row]),
+    "número_pokedex": lambda columns, row: int(columns.ids[row]),
+    "tipos": lambda columns, row: [TYPE_NAMES[t] for t in (columns.primary_type[row], columns.secondary_type[row]) if t >= 0],
+    "altura": lambda columns, row: f"{columns.height[row]/10} mt",
+    "peso": lambda columns, row: f"{columns.weight[row]/10} kg",
+    "stats": lambda columns, row: {stat: int(value) for stat, value in zip(STAT_NAMES, columns.stats[row])}
+})
+
+def build_columns(documents: Iterable[Dict]) -> PokedexColumns:
+    """
+    Construye las columnas a partir de documentos /pokemon/<x> de la PokeAPI.
+
+    Args:
+        documents (Iterable[Dict]): Documentos completos o recortados
+
+    Returns:
+        PokedexColumns: Columnas ordenadas por número de Pokedex
+    """
+    documents = sorted(documents, key=lambda data: data['id'])
+    size = len(documents)
+
+    ids = np.empty(size, dtype=np.int32)
+    stats = np.zeros((size, len(STAT_NAMES)), dtype=np.int16)
+    height = np.empty(size, dtype=np.int32)
+    weight = np.empty(size, dtype=np.int32)
+    primary_type = np.full(size, -1, dtype=np.int8)
+    secondary_type = np.full(size, -1, dtype=np.int8)
+    type_mask = np.zeros(size, dtype=np.uint32)
+    is_default = np.zeros(size, dtype=bool)
+    names = []
+
+    for row, data in enumerate(documents):
+        ids[row] = data['id']
+        names.append(data['name'])
+        stats[row] = [stat['base_stat'] for stat in data['stats'][:len(STAT_NAMES)]]
+        height[row] = data['height']
+        weight[row] = data['weight']
+        is_default[row] = data.get('is_default', False)
+
+        type_slots = [TYPE_INDEX[t['type']['name']] for t in data['types'] if t['type']['name'] in TYPE_INDEX]
+        if type_slots:
+            primary_type[row] = type_slots[0]
+        if len(type_slots) > 1:
+            secondary_type[row] = type_slots[1]
+        for type_index in type_slots:
+            type_mask[row] |= np.uint32(1 << type_index)
+
+    return PokedexColumns(
+        ids=ids,
+        names=np.array(names, dtype=str),
+        stats=stats,
+        height=height,
+        weight=weight,
+        primary_type=primary_type,
+        secondary_type=secondary_type,
+        type_mask=type_mask,
+        is_default=is_default
+    )
+
+def types_to_mask(type_names: Iterable[str]) -> int:
+    """
+    Convierte una lista de nombres de tipo en su bitmask.
+
+    Args:
+        type_names (Iterable[str]): Nombres de tipo (ej: ['water', 'ground'])
+
+    Returns:
+        int: Bitmask de tipos
+
+    Raises:
+        ValueError: Si algún tipo no existe
+    """
+    mask = 0
+    for type_name in type_names:
+        type_name = type_name.lower()
+        if type_name not in TYPE_INDEX:
+            raise ValueError(f"No conozco el tipo '{type_name}'")
+        mask |= 1 << TYPE_INDEX[type_name]
+    return mask
+
+def parse_query_args(args: Mapping) -> Dict:
+    """
+    Interpreta los parámetros de /pokedex/query.
+
+    Parámetros soportados:
+        type (repetible o separado por comas): Tipos a filtrar
+        type_mode (str): 'all' (debe tener todos los tipos, default) o 'any'
+        min_<columna>, max_<columna>: Rango inclusivo sobre una columna de SORTABLE_COLUMNS
+        sort (str): Columna por la cual ordenar
+        order (str): 'desc' (default) o 'asc'
+        limit (int): Cantidad máxima de resultados (top-k)
+        default_only (bool): Solo formas default
+
+    Args:
+        args (Mapping): Parámetros de la request (request.args)
+
+    Returns:
+        Dict: Argumentos para PokedexStore.query
+
+    Raises:
+        ValueError: Si algún parámetro es inválido
+    """
+    getlist = args.getlist if hasattr(args, 'getlist') else lambda key: [args[key]] if key in args else []
+
+    types = [t for value in getlist('type') for t in value.split(',') if t]
+    type_mode = args.get('type_mode', 'all')
+    if type_mode not in ('all', 'any'):
+        raise ValueError("type_mode debe ser 'all' o 'any'")
+
+    ranges = {}
+    for key, value in args.items():
+        if not (key.startswith('min_') or key.startswith('max_')):
+            continue
+        column = key[4:]
+        if column not in SORTABLE_COLUMNS:
+            raise ValueError(f"No se puede filtrar por '{column}'")
+        try:
+            bound = float(value)
+        except ValueError:
+            raise ValueError(f"El valor de '{key}' debe ser numérico")
+        low, high = ranges.get(column, (None, None))
+        ranges[column] = (bound, high) if key.startswith('min_') else (low, bound)
+
+    sort = args.get('sort')
+    if sort is not None and sort not in SORTABLE_COLUMNS:
+        raise ValueError(f"No se puede ordenar por '{sort}'")
+
+    order = args.get('order', 'desc')
+    if order not in ('asc', 'desc'):
+        raise ValueError("order debe ser 'asc' o 'desc'")
+
+    limit = args.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError("limit debe ser un número entero")
+        if limit < 1:
+            raise ValueError("limit debe ser mayor a 0")
+
+    default_only = str(args.get('default_only', 'false')).lower() in ('1', 'true', 'si', 'sí')
+
+    return {
+        "types": types,
+        "type_mode": type_mode,
+        "ranges": ranges,
+        "sort": sort,
+        "order": order,
+        "limit": limit,
+        "default_only": default_only
+    }
+
+class PokedexStore:
+    """
+    Almacén columnar de la Pokedex.
+
+    Se construye a partir del snapshot local y de los documentos que el PokemonService
+    tiene en cache. Si la cache cambia, las columnas se reconstruyen en la siguiente consulta.
+
+    Attributes:
+        pokemon_service (PokemonService): Servicio cuya cache alimenta el almacén
+        snapshot_service (SnapshotService): Servicio para cargar el snapshot local
+    """
+
+    def __init__(self, pokemon_service: PokemonService, snapshot_service: Optional[SnapshotService] = None):
+        """
+        Inicializa el almacén vacío. Las columnas se construyen en el primer uso.
+
+        Args:
+            pokemon_service (PokemonService): Servicio de Pokemon
+            snapshot_service (SnapshotService, optional): Servicio de snapshot
+        """
+        self.pokemon_service = pokemon_service
+        self.snapshot_service = snapshot_service or SnapshotService()
+        self._columns: Optional[PokedexColumns] = None
+        self._built_version = -1
+        self._snapshot_loaded = False
+        self._lock = threading.RLock()
+        logger.debug('Almacén columnar de la Pokedex inicializado')
+
+    def load_snapshot(self) -> None:
+        """Carga el snapshot local en las caches del PokemonService (una sola vez)."""
+        if self._snapshot_loaded:
+            return
+        with self._lock:
+            if self._snapshot_loaded:
+                return
+            snapshot = self.snapshot_service.load()
+            if snapshot.get('types'):
+                self.pokemon_service.cache_type_documents(snapshot['types'])
+            if snapshot.get('evolution_chains'):
+                self.pokemon_service.cache_evolution_chain_documents(snapshot['evolution_chains'])
+            if snapshot.get('pokemon'):
+                self.pokemon_service.cache_pokemon_documents(snapshot['pokemon'])
+            self._snapshot_loaded = True
+
+    @property
+    def columns(self) -> Optional[PokedexColumns]:
+        """Últimas columnas construidas (sin reconstruir), o None si todavía no se construyeron."""
+        return self._columns
+
+    def install_columns(self, columns: PokedexColumns, version: int) -> None:
+        """
+        Reemplaza las columnas por unas construidas afuera (ej: app/services/bulk_build.py).
+        Si la cache cambió después de `version`, se reconstruyen en la siguiente consulta.
+
+        Args:
+            columns (PokedexColumns): Columnas construidas
+            version (int): Versión de la cache con la que se construyeron
+        """
+        with self._lock:
+            self._columns, self._built_version = columns, version
+        logger.info(f'Almacén columnar instalado con {len(columns.ids)} Pokemon')
+
+    def get_columns(self, wait: bool = False) -> PokedexColumns:
+        """
+        Obtiene las columnas, construyéndolas si la cache cambió desde la última vez.
+
+        Si otro thread ya está reconstruyendo las columnas, devuelve las anteriores en lugar
+        de esperar (salvo que se pida wait=True), así una actualización de la cache nunca
+        bloquea las consultas.
+
+        Args:
+            wait (bool, optional): Esperar la reconstrucción en curso. Default = False.
+
+        Returns:
+            PokedexColumns: Columnas actuales
+        """
+        columns = self._columns
+        if columns is not None and self._built_version == self.pokemon_service.cache_version:
+            return columns
+        if columns is not None and not wait:
+            if not self._lock.acquire(blocking=False):
+                return columns #Otro thread está reconstruyendo: se sirven las columnas anteriores
+        else:
+            self._lock.acquire()
+
+        try:
+            self.load_snapshot()
+            version = self.pokemon_service.cache_version
+            if self._columns is None or self._built_version != version:
+                columns = build_columns(self.pokemon_service.get_cached_documents())
+                self._columns, self._built_version = columns, version
+                logger.info(f'Almacén columnar construido con {len(columns.ids)} Pokemon')
+            return self._columns
+        finally:
+            self._lock.release()
+
+    @staticmethod
+    def _column_values(columns: PokedexColumns, column: str) -> np.ndarray:
+        """Obtiene los valores de una columna de SORTABLE_COLUMNS en las unidades de la API."""
+        if column in STAT_NAMES:
+            return columns.stats[:, STAT_NAMES.index(column)]
+        if column == 'total':
+            return columns.stats.sum(axis=1, dtype=np.int32)
+        if column == 'altura':
+            return columns.height / 10
+        if column == 'peso':
+            return columns.weight / 10
+        return columns.ids
+
+    @staticmethod
+    def row_to_dict(columns: PokedexColumns, row: int, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """
+        Convierte una fila de las columnas en la ficha resumida de un Pokemon.
+
+        Args:
+            columns (PokedexColumns): Columnas
+            row (int): Índice de fila
+            fields (Tuple[str, ...], optional): Campos a calcular (ver ROW_FIELDS). Default = todos.
+
+        Returns:
+            Dict: Ficha con nombre, número, tipos, altura, peso y stats (o solo los campos pedidos)
+        """
+        return ROW_FIELDS.projector(fields)(columns, row)
+
+    def query(self, types: List[str] = None, type_mode: str = 'all', ranges: Dict = None,
+              sort: str = None, order: str = 'desc', limit: int = None, default_only: bool = False,
+              fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """
+        Filtra, ordena y limita la Pokedex con operaciones vectorizadas.
+
+        Args:
+            types (List[str], optional): Tipos a filtrar
+            type_mode (str, optional): 'all' o 'any'. Default = 'all'.
+            ranges (Dict, optional): {columna: (mínimo, máximo)}, extremos inclusivos o None
+            sort (str, optional): Columna de orden
+            order (str, optional): 'desc' o 'asc'. Default = 'desc'.
+            limit (int, optional): Cantidad máxima de resultados
+            default_only (bool, optional): Solo formas default. Default = False.
+            fields (Tuple[str, ...], optional): Campos de cada ficha (ver ROW_FIELDS). Default = todos.
+
+        Returns:
+            Dict: Total de coincidencias y las fichas resultantes
+
+        Raises:
+            ValueError: Si algún tipo no existe
+
+        Ejemplo:
+            >>> store.query(types=['water'], sort='velocidad', limit=10)
+        """
+        columns = self.get_columns()
+        mask = np.ones(len(columns.ids), dtype=bool)
+
+        if types:
+            type_mask = np.uint32(types_to_mask(types))
+            if type_mode == 'all':
+                mask &= (columns.type_mask & type_mask) == type_mask
+            else:
+                mask &= (columns.type_mask & type_mask) != 0
+
+        for column, (low, high) in (ranges or {}).items():
+            values = self._column_values(columns, column)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+
+        if default_only:
+            mask &= columns.is_default
+
+        rows = np.flatnonzero(mask)
+        total = len(rows)
+
+        if sort is not None and total:
+            keys = self._column_values(columns, sort)[rows].astype(np.float64)
+            if order == 'desc':
+                keys = -keys
+            if limit is not None and limit < total:
+                # Top-k: argpartition en O(n) encuentra el k-ésimo valor; se conservan
+                # también los empates con él para que el desempate por número sea exacto
+                kth = keys[np.argpartition(keys, limit - 1)[limit - 1]]
+                selected = keys <= kth
+                rows, keys = rows[selected], keys[selected]
+            # Orden estable por la clave y, ante empates, por número de Pokedex
+            rows = rows[np.lexsort((columns.ids[rows], keys))]
+
+        if limit is not None:
+            rows = rows[:limit]
+
+        project = ROW_FIELDS.projector(fields)
+        return {
+            "total": int(total),
+            "indexados": int(len(columns.ids)),
+            "pokemon": [project(columns, row) for row in rows]
+        }
@@ -6,22 +6,162 @@ sobre diferentes Pokemon y sus características.
 
 import requests
 import random
-from typing import Dict, List, Optional
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from app.config.settings import POKEAPI_BASE_URL, HEDGE_REQUESTS
+from app.utils.admission import request_timeout
+from app.utils.cache import CacheStats, deep_sizeof, matches
+from app.utils.fields import FieldSet
+from app.utils.hedging import hedger
+from app.utils.http import get_http_session
 from app.utils.logger import get_logger
 
 logger = get_logger()
 
+# Claves del documento /pokemon/<x> que se conservan en cache y snapshot.
+# El resto (moves, game_indices, etc.) es muy pesado y la API no lo utiliza.
+POKEMON_DOCUMENT_KEYS = ('id', 'name', 'height', 'weight', 'is_default', 'types', 'abilities', 'stats', 'species')
+
+def trim_pokemon_document(data: Dict) -> Dict:
+    """
+    Reduce un documento /pokemon/<x> de la PokeAPI a las claves que usa la API.
+    
+    Args:
+        data (Dict): Documento completo devuelto por la PokeAPI
+        
+    Returns:
+        Dict: Documento con la misma estructura pero solo con las claves necesarias
+    """
+    trimmed = {key: data[key] for key in POKEMON_DOCUMENT_KEYS if key in data}
+    sprites = data.get('sprites') or {}
+    trimmed['sprites'] = {key: value for key, value in sprites.items() if isinstance(value, str)}
+    return trimmed
+
+def trim_type_document(data: Dict) -> Dict:
+    """
+    Reduce un documento /type/<t> de la PokeAPI a su nombre, relaciones de daño y miembros.
+    
+    Args:
+        data (Dict): Documento completo devuelto por la PokeAPI
+        
+    Returns:
+        Dict: Documento con las claves id, name, damage_relations y pokemon
+    """
+    return {
+        "id": data.get("id"),
+        "name": data["name"],
+        "damage_relations": {
+            relation: [{"name": t["name"]} for t in types]
+            for relation, types in (data.get("damage_relations") or {}).items()
+        },
+        "pokemon": [{"pokemon": {"name": p["pokemon"]["name"]}} for p in data.get("pokemon", [])]
+    }
+
+def trim_evolution_chain_document(data: Dict) -> Dict:
+    """
+    Reduce un documento /evolution-chain/<id> de la PokeAPI a especies, evoluciones y
+    los datos principales de cada evolución (disparador, nivel mínimo y objeto).
+    
+    Args:
+        data (Dict): Documento completo devuelto por la PokeAPI
+        
+    Returns:
+        Dict: Documento con las claves id y chain (anidada)
+    """
+    def name_of(value) -> Optional[str]:
+        # Los documentos ya recortados guardan directamente el nombre
+        return value.get("name") if isinstance(value, dict) else value
+    
+    def trim_link(link: Dict) -> Dict:
+        return {
+            "species": {"name": link["species"]["name"], "url": link["species"]["url"]},
+            "evolution_details": [{
+                "trigger": name_of(detail.get("trigger")),
+                "min_level": detail.get("min_level"),
+                "item": name_of(detail.get("item"))
+            } for detail in (link.get("evolution_details") or [])[:1]],
+            "evolves_to": [trim_link(child) for child in link.get("evolves_to", [])]
+        }
+    
+    return {"id": data["id"], "chain": trim_link(data["chain"])}
+
+def id_from_url(url: str) -> int:
+    """
+    Obtiene el ID numérico del final de una URL de la PokeAPI.
+    
+    Ejemplo:
+        >>> id_from_url('https://pokeapi.co/api/v2/pokemon-species/445/')
+        445
+    """
+    return int(url.rstrip('/').rsplit('/', 1)[-1])
+
+# Campos de la ficha de un Pokemon, calculados a partir de su documento /pokemon/<x>
+POKEMON_FIELDS = FieldSet({
+    "nombre": lambda data: data["name"],
+    "tipos": lambda data: [t["type"]["name"] for t in data["types"]],
+    "altura": lambda data: f"{data['height']/10} mt",
+    "peso": lambda data: f"{data['weight']/10} kg",
+    "número_pokedex": lambda data: data["id"],
+    "habilidades": lambda data: [ability["ability"]["name"].replace("-", " ") for ability in data["abilities"]],
+    "stats": lambda data: {
+        "hp": data["stats"][0]["base_stat"],
+        "ataque": data["stats"][1]["base_stat"],
+        "defensa": data["stats"][2]["base_stat"],
+        "ataque_especial": data["stats"][3]["base_stat"],
+        "defensa_especial": data["stats"][4]["base_stat"],
+        "velocidad": data["stats"][5]["base_stat"]
+    },
+    "longitud_nombre": lambda data: f"{len(data['name'])} caracteres"
+}, default=("nombre", "tipos", "altura", "peso", "número_pokedex", "habilidades", "stats"))
+
+# Campos por defecto de las rutas que muestran una ficha resumida
+SUMMARY_FIELDS = ("nombre", "tipos", "altura", "peso", "número_pokedex")
+LONGEST_NAME_FIELDS = ("nombre", "tipos", "longitud_nombre", "número_pokedex")
+
+def build_pokemon_record(data: Dict, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+    """
+    Construye la ficha de un Pokemon a partir de su documento de la PokeAPI.
+    
+    Args:
+        data (Dict): Documento /pokemon/<x> (completo o recortado)
+        fields (Tuple[str, ...], optional): Campos a calcular (ver POKEMON_FIELDS). Default = ficha completa.
+        
+    Returns:
+        Dict: Ficha con nombre, tipos, altura, peso, número, habilidades y stats (o solo los campos pedidos)
+    """
+    return POKEMON_FIELDS.projector(fields)(data)
+
 class PokemonService:
     """
     Servicio para interactuar con la PokeAPI.
     
     Attributes:
         base_url (str): URL base de la PokeAPI
+        pokemon_cache (Dict[str, Dict]): Documentos /pokemon/<x> recortados, por nombre
+        type_cache (Dict[str, Dict]): Documentos /type/<t> recortados, por nombre
+        evolution_chain_cache (Dict[int, Dict]): Documentos /evolution-chain/<id> recortados, por ID
+        cache_version (int): Contador que aumenta cada vez que cambia la cache de Pokemon
+        type_cache_version (int): Contador que aumenta cada vez que cambia la cache de tipos
+        evolution_chain_cache_version (int): Contador que aumenta cada vez que cambia la cache de cadenas evolutivas
+        cache_stats (Dict[str, CacheStats]): Métricas de uso de cada cache
+        stale_keys (frozenset): Claves invalidadas ('pokemon/pikachu', 'type/fire', ...): sus
+            documentos se siguen usando hasta que se vuelven a descargar
     """
     
     def __init__(self):
         """Inicializa el servicio con la URL base de la PokeAPI."""
-        self.base_url = 'https://pokeapi.co/api/v2'
+        self.base_url = POKEAPI_BASE_URL
+        self.pokemon_cache: Dict[str, Dict] = {}
+        self.type_cache: Dict[str, Dict] = {}
+        self.evolution_chain_cache: Dict[int, Dict] = {}
+        self._cache_aliases: Dict[str, str] = {} #Número de Pokedex -> nombre
+        self._cache_lock = threading.Lock()
+        self.cache_version = 0
+        self.type_cache_version = 0
+        self.evolution_chain_cache_version = 0
+        self.cache_stats = {"pokemon": CacheStats(), "type": CacheStats(), "evolution-chain": CacheStats()}
+        self._cache_listeners: List[Callable[[List[Dict], List[Dict]], None]] = []
+        self.stale_keys: frozenset = frozenset()
         logger.debug('Servicio Pokemon inicializado')
      
     def _make_request(self, url: str) -> requests.Response:
@@ -36,7 +176,7 @@ class PokemonService:
             
         Raises:
             requests.exceptions.HTTPError: Si el recurso no existe (404)
-            requests.exceptions.RequestException: Si hay problemas de conexión
+            requests.exceptions.RequestException: Si hay problemas de conexión o se agotó el tiempo de la request
             
         Ejemplo:
             >>> response = self._make_request('https://pokeapi.co/api/v2/pokemon/pikachu')
@@ -44,7 +184,10 @@ class PokemonService:
         """
         logger.debug(f'Realizando petición a: {url}')
         try:
-            response = requests.get(url, timeout=10)
+            if HEDGE_REQUESTS:
+                response = hedger.get(url, timeout=request_timeout(10), endpoint=self._endpoint_key(url))
+            else:
+                response = get_http_session().get(url, timeout=request_timeout(10))
             response.raise_for_status()
             logger.debug(f'Petición exitosa. Status code: {response.status_code}')
             return response
@@ -52,12 +195,332 @@ class PokemonService:
             logger.error(f'---Error en petición a PokeAPI: {str(e)}')
             raise
     
-    def get_pokemon_by_name(self, name: str) -> Dict:
+    def _endpoint_key(self, url: str) -> str:
+        """
+        Agrupa las URLs de la PokeAPI por endpoint para medir su latencia.
+        
+        Ejemplo:
+            >>> self._endpoint_key(f'{self.base_url}/pokemon/pikachu')
+            'pokemon/<x>'
+        """
+        path = url[len(self.base_url):].split('?')[0].strip('/')
+        resource, _, identifier = path.partition('/')
+        return f'{resource}/<x>' if identifier else resource
+    
+    def add_cache_listener(self, listener: Callable[[List[Dict], List[Dict]], None]) -> None:
+        """
+        Registra una función que se llama con cada cambio de la cache de Pokemon.
+        
+        La función recibe (agregados, eliminados): un documento reemplazado aparece como
+        eliminado (versión anterior) y agregado (versión nueva). Se llama con el lock de la
+        cache tomado, así ve los cambios en el mismo orden que la cache; no debe consultar
+        al servicio. Al registrarse recibe los documentos que ya están en cache.
+        
+        Args:
+            listener (Callable): Función (agregados, eliminados) -> None
+        """
+        with self._cache_lock:
+            self._cache_listeners.append(listener)
+            listener(list(self.pokemon_cache.values()), [])
+    
+    def _notify_cache_listeners(self, added: List[Dict], removed: List[Dict]) -> None:
+        for listener in self._cache_listeners:
+            try:
+                listener(added, removed)
+            except Exception as e:
+                logger.error(f'Error al notificar un cambio de la cache: {str(e)}')
+    
+    def cache_pokemon_documents(self, documents: List[Dict]) -> None:
+        """
+        Agrega documentos /pokemon/<x> a la cache (por ejemplo, desde un snapshot).
+        
+        Args:
+            documents (List[Dict]): Documentos completos o recortados
+        """
+        with self._cache_lock:
+            added, removed = [], []
+            for data in documents:
+                trimmed = trim_pokemon_document(data)
+                previous = self.pokemon_cache.get(trimmed['name'])
+                if previous is not None:
+                    removed.append(previous)
+                self.pokemon_cache[trimmed['name']] = trimmed
+                self._cache_aliases[str(trimmed['id'])] = trimmed['name']
+                added.append(trimmed)
+            self.cache_version += 1
+            self._notify_cache_listeners(added, removed)
+        logger.debug(f'Cache de Pokemon actualizada: {len(self.pokemon_cache)} documentos')
+    
+    def swap_pokemon_documents(self, updated: List[Dict], removed: List[str] = None) -> None:
+        """
+        Reemplaza y elimina documentos de la cache en un solo paso.
+        
+        Arma copias nuevas de la cache y las intercambia juntas: quien lee nunca espera ni ve
+        una actualización a medias.
+        
+        Args:
+            updated (List[Dict]): Documentos nuevos o actualizados
+            removed (List[str], optional): Nombres de Pokemon que ya no existen en la PokeAPI
+        """
+        with self._cache_lock:
+            pokemon_cache = dict(self.pokemon_cache)
+            aliases = dict(self._cache_aliases)
+            added_documents, removed_documents = [], []
+            for name in removed or []:
+                document = pokemon_cache.pop(name, None)
+                if document is not None:
+                    aliases.pop(str(document['id']), None)
+                    removed_documents.append(document)
+            for data in updated:
+                trimmed = trim_pokemon_document(data)
+                previous = pokemon_cache.get(trimmed['name'])
+                if previous is not None:
+                    removed_documents.append(previous)
+                pokemon_cache[trimmed['name']] = trimmed
+                aliases[str(trimmed['id'])] = trimmed['name']
+                added_documents.append(trimmed)
+            self.pokemon_cache, self._cache_aliases = pokemon_cache, aliases
+            self.cache_version += 1
+            self._notify_cache_listeners(added_documents, removed_documents)
+        logger.info(f'Cache de Pokemon reemplazada: {len(updated)} actualizados, {len(removed or [])} eliminados')
+    
+    def mark_fresh(self, keys: Iterable[str]) -> None:
+        """
+        Quita claves de stale_keys (sus documentos se acaban de volver a descargar).
+        
+        Args:
+            keys (Iterable[str]): Claves de cache, ej: 'pokemon/pikachu'
+        """
+        keys = set(keys)
+        with self._cache_lock:
+            if keys & self.stale_keys:
+                self.stale_keys = self.stale_keys - keys
+    
+    def _refetch_stale(self, key: str, url: str) -> Optional[Dict]:
+        """
+        Vuelve a descargar un documento invalidado.
+        
+        Args:
+            key (str): Clave de cache del documento
+            url (str): URL del documento en la PokeAPI
+            
+        Returns:
+            Optional[Dict]: Documento descargado, o None si la PokeAPI falló (se sigue usando el de la cache)
+        """
+        self.cache_stats[key.split('/', 1)[0]].miss()
+        try:
+            return self._make_request(url).json()
+        except requests.exceptions.RequestException as e:
+            logger.warning(f'No se pudo actualizar {key}, se usa el documento en cache: {str(e)}')
+            return None
+    
+    def get_cached_documents(self) -> List[Dict]:
+        """
+        Obtiene una copia de la lista de documentos en cache.
+        
+        Returns:
+            List[Dict]: Documentos /pokemon/<x> recortados
+        """
+        with self._cache_lock:
+            return list(self.pokemon_cache.values())
+    
+    def get_pokemon_document(self, name: str) -> Dict:
+        """
+        Obtiene el documento /pokemon/<x> de un Pokemon, primero desde la cache.
+        
+        Args:
+            name (str): Nombre o número de Pokedex
+            
+        Returns:
+            Dict: Documento recortado del Pokemon
+        """
+        key = str(name).lower()
+        cached_name = self._cache_aliases.get(key, key)
+        cached = self.pokemon_cache.get(cached_name)
+        if cached is not None:
+            if f'pokemon/{cached_name}' not in self.stale_keys:
+                self.cache_stats['pokemon'].hit(f'pokemon/{cached_name}')
+                return cached
+            data = self._refetch_stale(f'pokemon/{cached_name}', f'{self.base_url}/pokemon/{cached_name}')
+            if data is None:
+                return cached
+            if trim_pokemon_document(data) != cached:
+                self.swap_pokemon_documents([data])
+            self.mark_fresh([f'pokemon/{cached_name}'])
+            return self.pokemon_cache.get(data['name'], cached)
+        
+        self.cache_stats['pokemon'].miss()
+        response = self._make_request(f'{self.base_url}/pokemon/{key}')
+        data = response.json()
+        self.cache_pokemon_documents([data])
+        return self.pokemon_cache[data['name']]
+    
+    def cache_type_documents(self, documents: List[Dict]) -> None:
+        """
+        Agrega documentos /type/<t> a la cache (por ejemplo, desde un snapshot).
+        
+        Args:
+            documents (List[Dict]): Documentos completos o recortados
+        """
+        with self._cache_lock:
+            for data in documents:
+                trimmed = trim_type_document(data)
+                self.type_cache[trimmed['name']] = trimmed
+            self.type_cache_version += 1
+        logger.debug(f'Cache de tipos actualizada: {len(self.type_cache)} documentos')
+    
+    def get_type_document(self, type_name: str) -> Dict:
+        """
+        Obtiene el documento /type/<t> de un tipo, primero desde la cache.
+        
+        Args:
+            type_name (str): Nombre del tipo
+            
+        Returns:
+            Dict: Documento recortado del tipo (relaciones de daño y miembros)
+        """
+        key = type_name.lower()
+        cached = self.type_cache.get(key)
+        if cached is not None:
+            if f'type/{key}' not in self.stale_keys:
+                self.cache_stats['type'].hit(f'type/{key}')
+                return cached
+            data = self._refetch_stale(f'type/{key}', f'{self.base_url}/type/{key}')
+            if data is None:
+                return cached
+            self.cache_type_documents([data])
+            self.mark_fresh([f'type/{key}'])
+            return self.type_cache[data['name']]
+        
+        self.cache_stats['type'].miss()
+        response = self._make_request(f'{self.base_url}/type/{key}')
+        data = response.json()
+        self.cache_type_documents([data])
+        return self.type_cache[data['name']]
+    
+    def cache_evolution_chain_documents(self, documents: List[Dict]) -> None:
+        """
+        Agrega documentos /evolution-chain/<id> a la cache (por ejemplo, desde un snapshot).
+        
+        Args:
+            documents (List[Dict]): Documentos completos o recortados
+        """
+        with self._cache_lock:
+            for data in documents:
+                trimmed = trim_evolution_chain_document(data)
+                self.evolution_chain_cache[trimmed['id']] = trimmed
+            self.evolution_chain_cache_version += 1
+        logger.debug(f'Cache de cadenas evolutivas actualizada: {len(self.evolution_chain_cache)} documentos')
+    
+    def get_evolution_chain_document(self, chain_id: int) -> Dict:
+        """
+        Obtiene el documento /evolution-chain/<id> de una cadena, primero desde la cache.
+        
+        Args:
+            chain_id (int): ID de la cadena evolutiva
+            
+        Returns:
+            Dict: Documento recortado de la cadena
+        """
+        cached = self.evolution_chain_cache.get(chain_id)
+        if cached is not None:
+            if f'evolution-chain/{chain_id}' not in self.stale_keys:
+                self.cache_stats['evolution-chain'].hit(f'evolution-chain/{chain_id}')
+                return cached
+            data = self._refetch_stale(f'evolution-chain/{chain_id}', f'{self.base_url}/evolution-chain/{chain_id}')
+            if data is None:
+                return cached
+            self.cache_evolution_chain_documents([data])
+            self.mark_fresh([f'evolution-chain/{chain_id}'])
+            return self.evolution_chain_cache[chain_id]
+        
+        self.cache_stats['evolution-chain'].miss()
+        response = self._make_request(f'{self.base_url}/evolution-chain/{chain_id}')
+        self.cache_evolution_chain_documents([response.json()])
+        return self.evolution_chain_cache[chain_id]
+    
+    def cache_report(self, top: int = 10) -> Dict[str, Dict]:
+        """
+        Arma las métricas de las caches de documentos de la PokeAPI.
+        
+        Args:
+            top (int, optional): Cantidad de claves más consultadas por cache. Default = 10.
+            
+        Returns:
+            Dict[str, Dict]: Métricas por cache (ver CacheStats.report) y entradas invalidadas pendientes de descarga
+        """
+        caches = {"pokemon": self.pokemon_cache, "type": self.type_cache, "evolution-chain": self.evolution_chain_cache}
+        stale_keys = self.stale_keys
+        return {
+            name: {
+                **self.cache_stats[name].report(len(cache), deep_sizeof(cache), top),
+                "obsoletas": sum(1 for key in stale_keys if key.startswith(f'{name}/'))
+            }
+            for name, cache in caches.items()
+        }
+    
+    def invalidate_cache(self, pattern: str) -> int:
+        """
+        Marca como obsoletos los documentos que corresponden a un patrón: se vuelven a
+        descargar de la PokeAPI la próxima vez que se consulten (o en la próxima pasada del
+        RefreshService). Hasta entonces se siguen usando, así los índices derivados
+        (PokedexStore, AbilityIndex, TypeStatsIndex, ...) nunca pierden Pokemon; la versión
+        nueva los actualiza al entrar a la cache.
+        
+        Args:
+            pattern (str): Clave ('pokemon/pikachu', 'pokemon/25', 'type/fire', 'evolution-chain/10'),
+                prefijo terminado en '*' ('type/*') o '*' para invalidar todas las caches
+            
+        Returns:
+            int: Documentos invalidados
+            
+        Ejemplo:
+            >>> pokemon_service.invalidate_cache('type/*')
+            18
+        """
+        with self._cache_lock:
+            keys = [f'pokemon/{name}' for name, document in self.pokemon_cache.items()
+                    if matches(pattern, f'pokemon/{name}') or matches(pattern, f'pokemon/{document["id"]}')]
+            keys += [f'type/{name}' for name in self.type_cache if matches(pattern, f'type/{name}')]
+            keys += [f'evolution-chain/{chain_id}' for chain_id in self.evolution_chain_cache
+                     if matches(pattern, f'evolution-chain/{chain_id}')]
+            if keys:
+                self.stale_keys = self.stale_keys | set(keys) #Copia nueva: quien lee nunca ve el set a medias
+        
+        logger.info(f"Cache invalidada ('{pattern}'): {len(keys)} documentos para volver a descargar")
+        return len(keys)
+    
+    def get_evolution_chain_id(self, species_id: int) -> int:
+        """
+        Obtiene el ID de la cadena evolutiva de una especie consultando /pokemon-species/<id>.
+        
+        Args:
+            species_id (int): ID de la especie
+            
+        Returns:
+            int: ID de la cadena evolutiva
+        """
+        response = self._make_request(f'{self.base_url}/pokemon-species/{species_id}')
+        return id_from_url(response.json()['evolution_chain']['url'])
+    
+    def get_pokemon_listing(self) -> List[str]:
+        """
+        Obtiene los nombres de todos los Pokemon (incluyendo formas) de la PokeAPI.
+        
+        Returns:
+            List[str]: Lista de nombres
+        """
+        response = self._make_request(f'{self.base_url}/pokemon?limit=100000')
+        data = response.json()
+        return [pokemon['name'] for pokemon in data['results']]
+    
+    def get_pokemon_by_name(self, name: str, fields: Optional[Tuple[str, ...]] = None) -> Dict:
         """
         Obtiene información detallada de un Pokemon por su nombre.
         
         Args:
             name (str): Nombre del Pokemon
+            fields (Tuple[str, ...], optional): Campos de la ficha (ver POKEMON_FIELDS). Default = ficha completa.
             
         Returns:
             Dict: Información detallada del Pokemon incluyendo tipos, stats y habilidades
@@ -67,30 +530,11 @@ class PokemonService:
             >>> print(pokemon_info['pokemon']['tipos'])
         """
         logger.info(f'---Buscando información del Pokemon: {name}')
-        response = self._make_request(f'{self.base_url}/pokemon/{name.lower()}')
-        data = response.json()
+        data = self.get_pokemon_document(name)
         
         return {
             "mensaje": f"¡Atrapaste a {name.capitalize()}! A continuación, te presento su información:",
-            "pokemon": {
-                "nombre": data["name"],
-                "tipos": [t["type"]["name"] for t in data["types"]],
-                "altura": f"{data['height']/10} mt",
-                "peso": f"{data['weight']/10} kg",
-                "número_pokedex": data["id"],
-                "habilidades": [
-                    ability["ability"]["name"].replace("-", " ")
-                    for ability in data["abilities"]
-                ],
-                "stats": {
-                    "hp": data["stats"][0]["base_stat"],
-                    "ataque": data["stats"][1]["base_stat"],
-                    "defensa": data["stats"][2]["base_stat"],
-                    "ataque_especial": data["stats"][3]["base_stat"],
-                    "defensa_especial": data["stats"][4]["base_stat"],
-                    "velocidad": data["stats"][5]["base_stat"]
-                }
-            }
+            "pokemon": build_pokemon_record(data, fields)
         }
         logger.info(f'---Información obtenida exitosamente para: {name}')
 
@@ -126,14 +570,16 @@ class PokemonService:
         Returns:
             List[str]: Lista de nombres de Pokemon
         """
-        response = self._make_request(f'{self.base_url}/type/{type_name.lower()}')
-        data = response.json()
+        data = self.get_type_document(type_name)
         return [pokemon['pokemon']['name'] for pokemon in data['pokemon']]
     
-    def get_random_pokemon(self) -> Dict:
+    def get_random_pokemon(self, fields: Optional[Tuple[str, ...]] = None) -> Dict:
         """
         Obtiene un Pokemon aleatorio
         
+        Args:
+            fields (Tuple[str, ...], optional): Campos de la ficha. Default = SUMMARY_FIELDS.
+        
         Returns:
             Dict: Información del Pokemon aleatorio
         """
@@ -143,21 +589,16 @@ class PokemonService:
         
         return {
             "mensaje": "¡Un Pokemon salvaje apareció!",
-            "pokemon": {
-                "nombre": data["name"],
-                "tipos": [t["type"]["name"] for t in data["types"]],
-                "altura": f"{data['height']/10} mt",
-                "peso": f"{data['weight']/10} kg",
-                "número_pokedex": data["id"]
-            }
+            "pokemon": build_pokemon_record(data, fields or SUMMARY_FIELDS)
         }
     
-    def get_random_pokemon_by_type(self, type_name: str) -> Dict:
+    def get_random_pokemon_by_type(self, type_name: str, fields: Optional[Tuple[str, ...]] = None) -> Dict:
         """
         Obtiene un Pokemon aleatorio de un tipo específico (solo formas default)
         
         Args:
             type_name (str): Nombre del tipo
+            fields (Tuple[str, ...], optional): Campos de la ficha. Default = SUMMARY_FIELDS.
                 
         Returns:
             Dict: Información del Pokemon aleatorio
@@ -172,21 +613,16 @@ class PokemonService:
             if data.get("is_default", False): #Verifica que sea un Pokemon base (no variaciones)
                 return {
                     "mensaje": f"¡Un Pokemon salvaje de tipo {type_name} apareció!",
-                    "pokemon": {
-                        "nombre": data["name"],
-                        "tipos": [t["type"]["name"] for t in data["types"]],
-                        "altura": f"{data['height']/10} mt",
-                        "peso": f"{data['weight']/10} kg",
-                        "número_pokedex": data["id"]
-                    }
+                    "pokemon": build_pokemon_record(data, fields or SUMMARY_FIELDS)
                 }
     
-    def get_longest_name_pokemon_by_type(self, type_name: str) -> Dict:
+    def get_longest_name_pokemon_by_type(self, type_name: str, fields: Optional[Tuple[str, ...]] = None) -> Dict:
         """
         Obtiene el Pokemon con el nombre más largo de un tipo específico (solo formas default)
         
         Args:
             type_name (str): Nombre del tipo
+            fields (Tuple[str, ...], optional): Campos de la ficha. Default = LONGEST_NAME_FIELDS.
                 
         Returns:
             Dict: Información del Pokemon
@@ -204,10 +640,5 @@ class PokemonService:
             if data.get("is_default", False):
                 return {
                     "mensaje": f"¡El Pokemon de tipo {type_name} con el nombre más largo es...",
-                    "pokemon": {
-                        "nombre": data["name"],
-                        "tipos": [t["type"]["name"] for t in data["types"]],
-                        "longitud_nombre": f"{len(data['name'])} caracteres",
-                        "número_pokedex": data["id"]
-                    }
+                    "pokemon": build_pokemon_record(data, fields or LONGEST_NAME_FIELDS)
                 }
\ No newline at end of file
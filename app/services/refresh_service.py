@@ -0,0 +1,221 @@
+"""
+Módulo de actualización incremental de la Pokedex.
+Compara los listados /type y /pokemon?limit= de la PokeAPI con lo que hay en cache,
+descarga solo lo nuevo y lo invalidado (más una tanda rotativa de Pokemon conocidos, para
+detectar correcciones) con concurrencia acotada e intercambia la cache en un solo paso.
+
+Se puede ejecutar periódicamente dentro de la app (RefreshScheduler, con REFRESH_INTERVAL)
+o como proceso aparte sobre el snapshot (`flask --app run pokedex-refresh`).
+"""
+
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+import requests
+from app.config.settings import REFRESH_CONCURRENCY, REFRESH_RECHECK_BATCH
+from app.services.pokedex_store import PokedexStore
+from app.services.pokemon_service import trim_pokemon_document, trim_type_document
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+class RefreshPlan(NamedTuple):
+    """
+    Diferencias entre la PokeAPI y la cache.
+
+    Attr:
+        new_pokemon (List[str]): Pokemon del listado que no están en cache
+        removed_pokemon (List[str]): Pokemon en cache que ya no están en el listado
+        new_types (List[str]): Tipos del listado que no están en cache o fueron invalidados
+        recheck (List[str]): Pokemon conocidos que se vuelven a descargar en esta pasada
+            (todos los invalidados, más la tanda rotativa)
+    """
+    new_pokemon: List[str]
+    removed_pokemon: List[str]
+    new_types: List[str]
+    recheck: List[str]
+
+class RefreshService:
+    """
+    Servicio de actualización incremental de la cache del PokemonService.
+
+    Attributes:
+        store (PokedexStore): Almacén cuya cache (y snapshot) se actualiza
+        concurrency (int): Requests simultáneas a la PokeAPI
+        recheck_batch (int): Pokemon conocidos que se verifican en cada pasada
+    """
+
+    def __init__(self, store: PokedexStore, concurrency: int = REFRESH_CONCURRENCY,
+                 recheck_batch: int = REFRESH_RECHECK_BATCH):
+        self.store = store
+        self.concurrency = concurrency
+        self.recheck_batch = recheck_batch
+        self._recheck_cursor = 0
+        self._lock = threading.Lock()
+
+    def plan(self) -> RefreshPlan:
+        """
+        Compara los listados de la PokeAPI con la cache.
+
+        Returns:
+            RefreshPlan: Qué hay que descargar o eliminar
+        """
+        self.store.load_snapshot()
+        pokemon_service = self.store.pokemon_service
+        held = pokemon_service.pokemon_cache
+        listing = pokemon_service.get_pokemon_listing()
+        listed = set(listing)
+
+        stale_keys = pokemon_service.stale_keys
+        known = sorted(name for name in held if name in listed)
+        recheck = [name for name in known if f'pokemon/{name}' in stale_keys]
+        if known and self.recheck_batch > 0:
+            start = self._recheck_cursor % len(known)
+            batch = (known[start:] + known[:start])[:self.recheck_batch]
+            self._recheck_cursor = start + len(batch)
+            stale = set(recheck)
+            recheck += [name for name in batch if name not in stale]
+
+        return RefreshPlan(
+            new_pokemon=[name for name in listing if name not in held],
+            removed_pokemon=sorted(name for name in held if name not in listed),
+            new_types=[name for name in pokemon_service.get_pokemon_types()['tipos']
+                       if name not in pokemon_service.type_cache or f'type/{name}' in stale_keys],
+            recheck=recheck
+        )
+
+    def _fetch_all(self, resource: str, names: List[str]) -> Tuple[List[Dict], List[str]]:
+        """
+        Descarga documentos de un recurso con concurrencia acotada.
+
+        Un documento que falla (404, error de conexión, respuesta inválida) se omite: el resto
+        de la pasada sigue y se vuelve a intentar en la próxima.
+
+        Returns:
+            Tuple[List[Dict], List[str]]: Documentos descargados y claves de los que fallaron ('pokemon/x')
+        """
+        if not names:
+            return [], []
+        pokemon_service = self.store.pokemon_service
+
+        def fetch(name: str) -> Optional[Dict]:
+            try:
+                return pokemon_service._make_request(f'{pokemon_service.base_url}/{resource}/{name}').json()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning(f'Actualización: se omite {resource}/{name}: {str(e)}')
+                return None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='pokedex-refresh') as executor:
+            results = list(executor.map(fetch, names))
+        documents = [document for document in results if document is not None]
+        failed = [f'{resource}/{name}' for name, document in zip(names, results) if document is None]
+        return documents, failed
+
+    def run(self) -> Dict:
+        """
+        Ejecuta una pasada de actualización.
+
+        Returns:
+            Dict: Cantidad de Pokemon nuevos, actualizados y eliminados, de tipos y cadenas evolutivas
+            actualizados y claves de los documentos que no se pudieron descargar
+
+        Ejemplo:
+            >>> refresh_service.run()
+            {'nuevos': 3, 'actualizados': 1, 'eliminados': 0, 'tipos': 2, 'cadenas': 0, 'fallidos': [], 'segundos': 1.8}
+        """
+        with self._lock:
+            start = time.perf_counter()
+            pokemon_service = self.store.pokemon_service
+            plan = self.plan()
+
+            fetched, failed = self._fetch_all('pokemon', plan.new_pokemon + plan.recheck)
+            fetched = [trim_pokemon_document(data) for data in fetched]
+            held = pokemon_service.pokemon_cache
+            changed = [document for document in fetched if held.get(document['name']) != document]
+
+            # Los tipos de los Pokemon nuevos o modificados cambiaron su lista de miembros
+            type_names = set(plan.new_types)
+            for document in changed:
+                type_names.update(t['type']['name'] for t in document['types'])
+            type_names.update(t['type']['name'] for name in plan.removed_pokemon for t in held[name]['types'])
+            types, failed_types = self._fetch_all('type', sorted(type_names))
+            types = [trim_type_document(data) for data in types]
+
+            # Las cadenas evolutivas no tienen listado: se vuelven a descargar las invalidadas
+            # (las de especies nuevas se incorporan al consultarlas, ver EvolutionIndex)
+            chain_ids = sorted(int(key.split('/', 1)[1]) for key in pokemon_service.stale_keys
+                               if key.startswith('evolution-chain/'))
+            chains, failed_chains = self._fetch_all('evolution-chain', chain_ids)
+
+            if types:
+                pokemon_service.cache_type_documents(types)
+            if chains:
+                pokemon_service.cache_evolution_chain_documents(chains)
+            if changed or plan.removed_pokemon:
+                pokemon_service.swap_pokemon_documents(changed, plan.removed_pokemon)
+            pokemon_service.mark_fresh([f'pokemon/{document["name"]}' for document in fetched] +
+                                       [f'type/{document["name"]}' for document in types] +
+                                       [f'evolution-chain/{document["id"]}' for document in chains])
+
+            new_names = set(plan.new_pokemon)
+            added = sum(1 for document in changed if document['name'] in new_names)
+            summary = {
+                "nuevos": added,
+                "actualizados": len(changed) - added,
+                "eliminados": len(plan.removed_pokemon),
+                "tipos": len(types),
+                "cadenas": len(chains),
+                "fallidos": failed + failed_types + failed_chains,
+                "segundos": round(time.perf_counter() - start, 2)
+            }
+            logger.info(f'Actualización de la Pokedex: {summary}')
+            return summary
+
+class RefreshScheduler:
+    """
+    Ejecuta el RefreshService periódicamente en un thread de fondo.
+
+    El thread se inicia en el proceso que atiende requests (después del fork de los workers),
+    y cada pasada tiene un desfase al azar para que los workers no consulten todos a la vez.
+
+    Attributes:
+        refresh_service (RefreshService): Servicio a ejecutar
+        interval (float): Segundos entre pasadas
+        on_refresh (Callable): Se llama tras una pasada con cambios (ej: reconstruir índices,
+            incluida la tabla de tipos y el índice de evoluciones)
+    """
+
+    def __init__(self, refresh_service: RefreshService, interval: float, on_refresh: Optional[Callable[[], object]] = None):
+        self.refresh_service = refresh_service
+        self.interval = interval
+        self.on_refresh = on_refresh
+        self._pid: Optional[int] = None
+        self._stop = threading.Event()
+        self._start_lock = threading.Lock()
+
+    def ensure_started(self) -> None:
+        """Inicia el thread si todavía no corre en este proceso (idempotente)."""
+        if self._pid == os.getpid():
+            return
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            self._stop = threading.Event()
+            threading.Thread(target=self._run, name='pokedex-refresh', daemon=True).start()
+            self._pid = os.getpid()
+            logger.info(f'Actualización en segundo plano cada {self.interval:.0f} s (pid {self._pid})')
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval * random.uniform(0.9, 1.1)):
+            try:
+                summary = self.refresh_service.run()
+                if self.on_refresh and any(summary[key] for key in ('nuevos', 'actualizados', 'eliminados', 'tipos', 'cadenas')):
+                    self.on_refresh()
+            except Exception as e:
+                logger.error(f'Error en la actualización de la Pokedex: {str(e)}')
@@ -0,0 +1,155 @@
+"""
+Módulo de similitud entre Pokemon.
+Encuentra los Pokemon que "juegan parecido" a otro comparando sus stats base
+normalizados, con una matriz precalculada y distancias calculadas en lote.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from app.services.pokedex_store import PokedexStore, PokedexColumns, ROW_FIELDS, types_to_mask
+from app.utils.admission import DeadlineExceeded
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+class _SimilarityState(NamedTuple):
+    """Estado del índice. Se reemplaza completo para que los lectores nunca vean uno a medio construir."""
+    columns: PokedexColumns
+    matrix: np.ndarray
+    sq_norms: np.ndarray
+    rows_by_name: Dict[str, int]
+
+class SimilarityIndex:
+    """
+    Índice de vecinos más cercanos sobre los stats base normalizados (z-score).
+
+    La matriz normalizada y las normas al cuadrado de cada fila se calculan una sola vez
+    por versión de las columnas del PokedexStore, de modo que cada consulta se resuelve
+    con un producto matriz-vector y un argpartition.
+
+    Attributes:
+        store (PokedexStore): Almacén columnar del que se leen los stats
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa el índice vacío. Se construye en la primera consulta.
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._state: Optional[_SimilarityState] = None
+        self._lock = threading.Lock()
+
+    def get_state(self, wait: bool = False) -> _SimilarityState:
+        """
+        Obtiene la matriz normalizada, reconstruyéndola si las columnas del almacén cambiaron.
+
+        Si otro thread ya la está reconstruyendo devuelve la anterior, salvo que se pida wait=True.
+        """
+        columns = self.store.get_columns(wait=wait)
+        state = self._state
+        if state is not None and (state.columns is columns or columns is not self.store.columns):
+            return state #Al día, o las columnas recibidas ya quedaron viejas (el almacén se está reconstruyendo)
+        if state is not None and not wait:
+            if not self._lock.acquire(blocking=False):
+                return state
+        else:
+            self._lock.acquire()
+
+        try:
+            if self._state is None or self._state.columns is not columns:
+                stats = columns.stats.astype(np.float32)
+                std = stats.std(axis=0)
+                std[std == 0] = 1
+                matrix = np.ascontiguousarray((stats - stats.mean(axis=0)) / std, dtype=np.float32)
+
+                self._state = _SimilarityState(
+                    columns=columns,
+                    matrix=matrix,
+                    sq_norms=np.einsum('ij,ij->i', matrix, matrix),
+                    rows_by_name={str(name): row for row, name in enumerate(columns.names)}
+                )
+                logger.info(f'Índice de similitud construido con {len(columns.ids)} Pokemon')
+            return self._state
+        finally:
+            self._lock.release()
+
+    def _find_row(self, name: str) -> Tuple[_SimilarityState, int]:
+        """
+        Obtiene la fila de un Pokemon, consultando la PokeAPI si todavía no está en cache.
+
+        Raises:
+            KeyError: Si el Pokemon no existe
+        """
+        state = self.get_state()
+        key = name.lower()
+        if key not in state.rows_by_name:
+            try:
+                document = self.store.pokemon_service.get_pokemon_document(key)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                raise KeyError(name) from e
+            key = document['name']
+            state = self.get_state(wait=True) #El documento recién traído tiene que estar en el índice
+        if key not in state.rows_by_name:
+            raise KeyError(name)
+        return state, state.rows_by_name[key]
+
+    def nearest(self, name: str, k: int = 10, types: List[str] = None, default_only: bool = False,
+                fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """
+        Busca los k Pokemon con stats más parecidos a los de un Pokemon.
+
+        Args:
+            name (str): Nombre del Pokemon de referencia
+            k (int, optional): Cantidad de vecinos. Default = 10.
+            types (List[str], optional): Restringe los vecinos a Pokemon con alguno de estos tipos
+            default_only (bool, optional): Solo formas default. Default = False.
+            fields (Tuple[str, ...], optional): Campos de cada ficha (ver ROW_FIELDS). Default = todos.
+
+        Returns:
+            Dict: Ficha del Pokemon de referencia y lista de vecinos con su distancia
+
+        Raises:
+            KeyError: Si el Pokemon no existe
+            ValueError: Si algún tipo no existe
+
+        Ejemplo:
+            >>> index.nearest('garchomp', k=5, types=['dragon'])
+        """
+        state, row = self._find_row(name)
+        columns, matrix, sq_norms = state.columns, state.matrix, state.sq_norms
+
+        query = matrix[row]
+        distances = sq_norms - 2 * (matrix @ query) + sq_norms[row]
+        np.maximum(distances, 0, out=distances)
+        distances[row] = np.inf
+
+        if types:
+            type_mask = np.uint32(types_to_mask(types))
+            distances[(columns.type_mask & type_mask) == 0] = np.inf
+        if default_only:
+            distances[~columns.is_default] = np.inf
+
+        candidates = int(np.count_nonzero(np.isfinite(distances)))
+        k = min(k, candidates)
+        if k == 0:
+            neighbours = np.empty(0, dtype=np.int64)
+        elif k < len(distances):
+            neighbours = np.argpartition(distances, k - 1)[:k]
+            neighbours = neighbours[np.argsort(distances[neighbours], kind='stable')]
+        else:
+            neighbours = np.argsort(distances, kind='stable')[:k]
+
+        project = ROW_FIELDS.projector(fields)
+        return {
+            "pokemon": project(columns, row),
+            "similares": [
+                {**project(columns, neighbour), "distancia": round(float(np.sqrt(distances[neighbour])), 4)}
+                for neighbour in neighbours
+            ]
+        }
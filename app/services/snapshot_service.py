@@ -0,0 +1,138 @@
+"""
+Módulo de snapshot de la Pokedex.
+Permite guardar en disco los documentos de la PokeAPI que usa la API y
+volver a cargarlos al iniciar, sin tener que consultar la PokeAPI Pokemon por Pokemon.
+"""
+
+import os
+import json
+import time
+from typing import Dict, List
+from app.config.settings import POKEDEX_SNAPSHOT_PATH
+from app.services.pokemon_service import PokemonService, trim_pokemon_document, trim_type_document, trim_evolution_chain_document
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+SNAPSHOT_VERSION = 1
+
+class SnapshotService:
+    """
+    Servicio para leer y escribir el snapshot local de la Pokedex.
+
+    El snapshot es un JSON con la forma:
+        {
+            "version": int,
+            "generado": float (timestamp),
+            "pokemon": [documentos /pokemon/<x> recortados],
+            "types": [documentos /type/<t> recortados],
+            "evolution_chains": [documentos /evolution-chain/<id> recortados]
+        }
+
+    Attributes:
+        path (str): Ruta del archivo de snapshot
+    """
+
+    def __init__(self, path: str = POKEDEX_SNAPSHOT_PATH):
+        """
+        Inicializa el servicio con la ruta del snapshot.
+
+        Args:
+            path (str, optional): Ruta del archivo. Default = POKEDEX_SNAPSHOT_PATH.
+        """
+        self.path = path
+
+    def exists(self) -> bool:
+        """Indica si existe un snapshot en disco."""
+        return os.path.exists(self.path)
+
+    def load(self) -> Dict:
+        """
+        Carga el snapshot desde disco.
+
+        Returns:
+            Dict: Contenido del snapshot, o un snapshot vacío si no existe
+        """
+        if not self.exists():
+            logger.info(f'No se encontró snapshot en {self.path}')
+            return {"version": SNAPSHOT_VERSION, "generado": None, "pokemon": [], "types": [], "evolution_chains": []}
+
+        with open(self.path, encoding='utf-8') as snapshot_file:
+            snapshot = json.load(snapshot_file)
+        logger.info(f'Snapshot cargado desde {self.path}: {len(snapshot.get("pokemon", []))} Pokemon')
+        return snapshot
+
+    def save(self, snapshot: Dict) -> None:
+        """
+        Guarda el snapshot en disco de forma atómica (archivo temporal + rename).
+
+        Args:
+            snapshot (Dict): Contenido del snapshot
+        """
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as snapshot_file:
+            json.dump(snapshot, snapshot_file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        logger.info(f'Snapshot guardado en {self.path}')
+
+    def build(self, pokemon_service: PokemonService) -> Dict:
+        """
+        Genera un snapshot nuevo consultando todos los Pokemon de la PokeAPI.
+
+        Args:
+            pokemon_service (PokemonService): Servicio usado para las consultas
+
+        Returns:
+            Dict: Snapshot generado
+        """
+        names = pokemon_service.get_pokemon_listing()
+        logger.info(f'Generando snapshot de {len(names)} Pokemon')
+
+        documents: List[Dict] = []
+        for index, name in enumerate(names, start=1):
+            response = pokemon_service._make_request(f'{pokemon_service.base_url}/pokemon/{name}')
+            documents.append(trim_pokemon_document(response.json()))
+            if index % 100 == 0:
+                logger.info(f'Snapshot: {index}/{len(names)} Pokemon descargados')
+
+        types: List[Dict] = []
+        for type_name in pokemon_service.get_pokemon_types()['tipos']:
+            response = pokemon_service._make_request(f'{pokemon_service.base_url}/type/{type_name}')
+            types.append(trim_type_document(response.json()))
+
+        response = pokemon_service._make_request(f'{pokemon_service.base_url}/evolution-chain?limit=100000')
+        chain_urls = [chain['url'] for chain in response.json()['results']]
+        evolution_chains: List[Dict] = []
+        for chain_url in chain_urls:
+            response = pokemon_service._make_request(chain_url)
+            evolution_chains.append(trim_evolution_chain_document(response.json()))
+
+        return {
+            "version": SNAPSHOT_VERSION,
+            "generado": time.time(),
+            "pokemon": documents,
+            "types": types,
+            "evolution_chains": evolution_chains
+        }
+
+    def capture(self, pokemon_service: PokemonService) -> Dict:
+        """
+        Genera un snapshot con lo que el servicio tiene en cache, sin consultar la PokeAPI.
+
+        Args:
+            pokemon_service (PokemonService): Servicio cuyas caches se guardan
+
+        Returns:
+            Dict: Snapshot generado
+        """
+        return {
+            "version": SNAPSHOT_VERSION,
+            "generado": time.time(),
+            "pokemon": pokemon_service.get_cached_documents(),
+            "types": list(pokemon_service.type_cache.values()),
+            "evolution_chains": list(pokemon_service.evolution_chain_cache.values())
+        }
@@ -0,0 +1,244 @@
+"""
+Módulo de cache de sprites en disco.
+Guarda las imágenes que referencian los documentos /pokemon/<x> (sprites de
+raw.githubusercontent.com) para servirlas desde /pokedex/<name>/sprite.
+
+    - Las imágenes se guardan por el SHA-256 de su contenido (blobs/<ab>/<hash>), así
+      sprites idénticos ocupan un solo archivo y el hash sirve como ETag.
+    - Cada URL apunta a su imagen con un archivo chico (refs/<hash de la URL>).
+    - El tamaño total está acotado: al superarlo se borran las imágenes usadas hace
+      más tiempo (LRU por fecha de modificación, que se actualiza al servirlas).
+    - Las imágenes faltantes se descargan en un pool de threads acotado; varias requests
+      por la misma imagen esperan una sola descarga.
+
+El directorio se comparte entre los workers: las escrituras son atómicas (os.replace).
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional
+from app.config.settings import SPRITE_CACHE_DIR, SPRITE_CACHE_MAX_BYTES, SPRITE_FETCH_CONCURRENCY
+from app.utils.http import get_http_session
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+# Tamaño máximo de un sprite descargado
+MAX_SPRITE_BYTES = 2 * 1024 * 1024
+# Cada cuántos segundos, como mucho, se actualiza la fecha de uso de una imagen servida
+TOUCH_INTERVAL = 60
+
+class SpriteFile(NamedTuple):
+    """
+    Imagen en la cache.
+
+    Attr:
+        path (str): Ruta absoluta del archivo
+        digest (str): SHA-256 del contenido
+        mimetype (str): Content-Type de la imagen
+    """
+    path: str
+    digest: str
+    mimetype: str
+
+class SpriteCache:
+    """
+    Cache de sprites en disco direccionada por contenido.
+
+    Attributes:
+        directory (str): Directorio de la cache
+        max_bytes (int): Tamaño máximo de las imágenes guardadas
+        concurrency (int): Descargas simultáneas
+    """
+
+    def __init__(self, directory: str = SPRITE_CACHE_DIR, max_bytes: int = SPRITE_CACHE_MAX_BYTES,
+                 concurrency: int = SPRITE_FETCH_CONCURRENCY):
+        self.directory = os.path.abspath(directory)
+        self.max_bytes = max_bytes
+        self.concurrency = concurrency
+        self._total_bytes: Optional[int] = None #Se calcula en la primera escritura
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def reset_after_fork(self) -> None:
+        """Descarta el pool de threads y las descargas heredadas: los threads no sobreviven al fork."""
+        self._executor = None
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, 'blobs', digest[:2], digest)
+
+    def _ref_path(self, url: str) -> str:
+        return os.path.join(self.directory, 'refs', hashlib.sha256(url.encode('utf-8')).hexdigest()[:32])
+
+    @staticmethod
+    def _write_atomic(path: str, content: bytes) -> None:
+        """Escribe un archivo de modo que nadie vea una versión a medias."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp-')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(content)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def lookup(self, url: str) -> Optional[SpriteFile]:
+        """
+        Busca la imagen de una URL en la cache, sin descargarla.
+
+        Args:
+            url (str): URL del sprite
+
+        Returns:
+            Optional[SpriteFile]: Imagen guardada, o None si no está
+        """
+        try:
+            with open(self._ref_path(url), 'r', encoding='utf-8') as file:
+                digest, mimetype = file.read().split()
+            path = self._blob_path(digest)
+            modified = os.stat(path).st_mtime
+        except (OSError, ValueError):
+            return None #Sin referencia, o la imagen se descartó
+
+        now = time.time()
+        if now - modified > TOUCH_INTERVAL:
+            try:
+                os.utime(path, (now, now)) #Marca el uso para el LRU
+            except OSError:
+                pass
+        return SpriteFile(path, digest, mimetype)
+
+    def get(self, url: str, timeout: float = 10) -> SpriteFile:
+        """
+        Obtiene la imagen de una URL, descargándola si no está en la cache.
+
+        Args:
+            url (str): URL del sprite
+            timeout (float, optional): Segundos máximos de espera. Default = 10.
+
+        Returns:
+            SpriteFile: Imagen guardada
+
+        Raises:
+            requests.exceptions.RequestException: Si la descarga falla
+            ValueError: Si la respuesta no es una imagen válida
+            concurrent.futures.TimeoutError: Si la descarga no terminó a tiempo
+
+        Ejemplo:
+            >>> sprite = sprite_cache.get(document['sprites']['front_default'])
+            >>> send_file(sprite.path, mimetype=sprite.mimetype, etag=sprite.digest)
+        """
+        cached = self.lookup(url)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            future = self._inflight.get(url)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='sprite-fetch')
+                future = self._executor.submit(self._download, url, timeout)
+                self._inflight[url] = future
+                future.add_done_callback(lambda _, url=url: self._inflight.pop(url, None))
+        return future.result(timeout=timeout)
+
+    def _download(self, url: str, timeout: float) -> SpriteFile:
+        """Descarga una imagen y la guarda en la cache."""
+        cached = self.lookup(url) #Otro worker pudo haberla guardado mientras tanto
+        if cached is not None:
+            return cached
+
+        logger.debug(f'Descargando sprite: {url}')
+        with get_http_session().get(url, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            mimetype = response.headers.get('Content-Type', '').split(';')[0].strip()
+            if not mimetype.startswith('image/'):
+                raise ValueError(f"La respuesta no es una imagen ({mimetype or 'sin Content-Type'})")
+            content = self._read_limited(response)
+
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            self._write_atomic(path, content)
+            self._account(len(content))
+        self._write_atomic(self._ref_path(url), f'{digest} {mimetype}'.encode('utf-8'))
+        return SpriteFile(path, digest, mimetype)
+
+    @staticmethod
+    def _read_limited(response) -> bytes:
+        """Lee el cuerpo de la respuesta por partes y corta apenas supera MAX_SPRITE_BYTES."""
+        if int(response.headers.get('Content-Length') or 0) > MAX_SPRITE_BYTES:
+            raise ValueError(f"La imagen supera los {MAX_SPRITE_BYTES} bytes")
+        content = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            content += chunk
+            if len(content) > MAX_SPRITE_BYTES:
+                raise ValueError(f"La imagen supera los {MAX_SPRITE_BYTES} bytes")
+        return bytes(content)
+
+    def _account(self, added: int) -> None:
+        """Suma una imagen nueva al total y descarta las más viejas si se superó el límite."""
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self.size()
+            else:
+                self._total_bytes += added
+            if self._total_bytes > self.max_bytes:
+                self._total_bytes = self.evict()
+
+    def size(self) -> int:
+        """Bytes ocupados por las imágenes guardadas (de todos los workers)."""
+        total = 0
+        for root, _, files in os.walk(os.path.join(self.directory, 'blobs')):
+            for name in files:
+                try:
+                    total += os.stat(os.path.join(root, name)).st_size
+                except OSError:
+                    pass
+        return total
+
+    def evict(self) -> int:
+        """
+        Borra las imágenes usadas hace más tiempo hasta quedar en el 90% del límite.
+        Las referencias que quedan apuntando a imágenes borradas se tratan como faltantes.
+
+        Returns:
+            int: Bytes ocupados después de borrar
+        """
+        blobs = []
+        for root, _, files in os.walk(os.path.join(self.directory, 'blobs')):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in blobs)
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+        for _, size, path in sorted(blobs):
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        logger.info(f'Cache de sprites: {removed} imágenes descartadas, {total} bytes en uso')
+        return total
+
+sprite_cache = SpriteCache()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=sprite_cache.reset_after_fork)
@@ -0,0 +1,172 @@
+"""
+Módulo de tabla de tipos.
+Construye la matriz de efectividad 18x18 a partir de las damage_relations de
+/type/<t> (y la reconstruye si cambian los documentos de tipo, ej: tras una
+actualización en segundo plano) y calcula la cobertura ofensiva y defensiva
+de un equipo con operaciones matriciales.
+"""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from app.services.pokedex_store import PokedexStore, TYPE_NAMES, TYPE_INDEX
+from app.utils.admission import DeadlineExceeded
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+MAX_TEAM_SIZE = 6
+
+# Multiplicador de daño según la relación de /type/<t> (del lado del tipo atacante)
+DAMAGE_RELATION_MULTIPLIERS = {
+    'double_damage_to': 2.0,
+    'half_damage_to': 0.5,
+    'no_damage_to': 0.0
+}
+
+def build_effectiveness_matrix(type_documents: Dict[str, Dict]) -> np.ndarray:
+    """
+    Construye la matriz de efectividad a partir de los documentos /type/<t>.
+
+    Args:
+        type_documents (Dict[str, Dict]): Documentos de tipo por nombre (deben estar los 18 tipos)
+
+    Returns:
+        np.ndarray: Matriz (18, 18) float32, fila = tipo atacante, columna = tipo defensor
+    """
+    matrix = np.ones((len(TYPE_NAMES), len(TYPE_NAMES)), dtype=np.float32)
+    for attacker, row in TYPE_INDEX.items():
+        relations = type_documents[attacker]['damage_relations']
+        for relation, multiplier in DAMAGE_RELATION_MULTIPLIERS.items():
+            for defender in relations.get(relation, []):
+                if defender['name'] in TYPE_INDEX:
+                    matrix[row, TYPE_INDEX[defender['name']]] = multiplier
+    return matrix
+
+class TypeChart:
+    """
+    Tabla de efectividad de tipos y análisis de cobertura de equipos.
+
+    La matriz se construye con los documentos de tipo del snapshot o de la cache del
+    PokemonService (solo se consultan a la PokeAPI los tipos que falten) y se reconstruye
+    cuando esa cache cambia (PokemonService.type_cache_version).
+
+    Attributes:
+        store (PokedexStore): Almacén de la Pokedex (provee snapshot y PokemonService)
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa la tabla vacía. La matriz se construye en el primer uso.
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._matrix: Optional[np.ndarray] = None
+        self._padded: Optional[np.ndarray] = None
+        self._built_version = -1
+        self._lock = threading.Lock()
+
+    def get_matrix(self) -> np.ndarray:
+        """
+        Obtiene la matriz de efectividad, construyéndola si no existe o si cambiaron los documentos de tipo.
+
+        Returns:
+            np.ndarray: Matriz (18, 18), fila = atacante, columna = defensor
+        """
+        pokemon_service = self.store.pokemon_service
+        if self._matrix is not None and self._built_version == pokemon_service.type_cache_version:
+            return self._matrix
+
+        with self._lock:
+            if self._matrix is None or self._built_version != pokemon_service.type_cache_version:
+                self.store.load_snapshot()
+                version = pokemon_service.type_cache_version
+                documents = {type_name: pokemon_service.get_type_document(type_name) for type_name in TYPE_NAMES}
+                matrix = build_effectiveness_matrix(documents)
+                # Columna extra de unos para los integrantes con un solo tipo (índice -1)
+                self._padded = np.hstack([matrix, np.ones((len(TYPE_NAMES), 1), dtype=np.float32)])
+                self._matrix, self._built_version = matrix, version
+                logger.info('Matriz de efectividad de tipos construida')
+        return self._matrix
+
+    def _team_types(self, team: List[str]) -> Tuple[List[Dict], np.ndarray]:
+        """
+        Obtiene los tipos de cada integrante del equipo.
+
+        Returns:
+            Tuple[List[Dict], np.ndarray]: Integrantes (nombre y tipos) y matriz (n, 2) de índices de tipo,
+            con -1 si el integrante tiene un solo tipo
+
+        Raises:
+            KeyError: Si algún Pokemon no existe
+        """
+        members = []
+        type_slots = np.full((len(team), 2), -1, dtype=np.int64)
+        for position, name in enumerate(team):
+            try:
+                document = self.store.pokemon_service.get_pokemon_document(name)
+            except DeadlineExceeded:
+                raise
+            except Exception as e:
+                raise KeyError(name) from e
+            types = [t['type']['name'] for t in document['types'] if t['type']['name'] in TYPE_INDEX]
+            members.append({"nombre": document['name'], "tipos": types})
+            for slot, type_name in enumerate(types[:2]):
+                type_slots[position, slot] = TYPE_INDEX[type_name]
+        return members, type_slots
+
+    def team_coverage(self, team: List[str]) -> Dict:
+        """
+        Calcula la cobertura ofensiva (por STAB) y defensiva de un equipo.
+
+        Args:
+            team (List[str]): Nombres de hasta 6 Pokemon
+
+        Returns:
+            Dict: Integrantes, resumen defensivo por tipo atacante y cobertura ofensiva por tipo defensor
+
+        Raises:
+            ValueError: Si el equipo está vacío o tiene más de 6 integrantes
+            KeyError: Si algún Pokemon no existe
+
+        Ejemplo:
+            >>> type_chart.team_coverage(['garchomp', 'rotom-wash', 'ferrothorn'])
+        """
+        if not team:
+            raise ValueError("El equipo debe tener al menos un Pokemon")
+        if len(team) > MAX_TEAM_SIZE:
+            raise ValueError(f"El equipo puede tener como máximo {MAX_TEAM_SIZE} Pokemon")
+
+        matrix = self.get_matrix()
+        padded = self._padded
+        members, type_slots = self._team_types(team)
+
+        # Defensa: multiplicador recibido por cada integrante (columna) desde cada tipo atacante (fila)
+        defensive = padded[:, type_slots[:, 0]] * padded[:, type_slots[:, 1]]
+        weak = (defensive > 1).sum(axis=1)
+        resist = ((defensive < 1) & (defensive > 0)).sum(axis=1)
+        immune = (defensive == 0).sum(axis=1)
+
+        # Ofensiva: mejor multiplicador de los tipos del equipo contra cada tipo defensor
+        # Sin tipos conocidos en el equipo no hay ataques con STAB: ningún tipo queda cubierto
+        attack_types = np.unique(type_slots[type_slots >= 0])
+        best_offense = matrix[attack_types].max(axis=0) if attack_types.size else np.zeros(len(TYPE_NAMES))
+
+        return {
+            "equipo": members,
+            "defensa": {
+                "por_tipo": {
+                    type_name: {"debiles": int(weak[i]), "resistentes": int(resist[i]), "inmunes": int(immune[i])}
+                    for i, type_name in enumerate(TYPE_NAMES)
+                },
+                "debilidades": [TYPE_NAMES[i] for i in np.flatnonzero(weak > resist + immune)],
+                "resistencias": [TYPE_NAMES[i] for i in np.flatnonzero(resist + immune > weak)]
+            },
+            "ofensiva": {
+                "super_efectivo_contra": [TYPE_NAMES[i] for i in np.flatnonzero(best_offense > 1)],
+                "neutral_contra": [TYPE_NAMES[i] for i in np.flatnonzero(best_offense == 1)],
+                "sin_cobertura": [TYPE_NAMES[i] for i in np.flatnonzero(best_offense < 1)]
+            }
+        }
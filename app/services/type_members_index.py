@@ -0,0 +1,191 @@
+"""
+Módulo de listado paginado de los integrantes de cada tipo.
+Precalcula, por tipo, arrays de filas del PokedexStore ordenadas por número de Pokedex y
+por largo del nombre (con y sin formas alternativas), junto con la clave de orden de cada
+fila. Cada página se resuelve con una búsqueda binaria de la clave del cursor y un slice:
+cuesta O(log n + página) sin importar cuántos integrantes tenga el tipo, y sin consultar
+la PokeAPI.
+
+Los cursores son opacos y guardan la clave del último integrante devuelto (no su posición),
+así una página no se corre si la Pokedex se actualiza entre dos requests.
+"""
+
+import base64
+import binascii
+import threading
+import numpy as np
+from typing import Dict, NamedTuple, Optional, Tuple
+from app.services.pokedex_store import PokedexColumns, PokedexStore, ROW_FIELDS, TYPE_NAMES
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+SORTS = ('id', 'name_length')
+MAX_PAGE_SIZE = 200
+
+# Campos por defecto de cada integrante
+MEMBER_FIELDS = ('nombre', 'número_pokedex')
+
+class _TypeMembersState(NamedTuple):
+    """
+    Estado del índice. Se reemplaza completo para que los lectores nunca vean uno a medio construir.
+
+    Attr:
+        columns (PokedexColumns): Columnas con las que se construyó
+        orders (Dict): (tipo, orden, default_only) -> (filas, claves), ambos ordenados por clave
+    """
+    columns: PokedexColumns
+    orders: Dict[Tuple[str, str, bool], Tuple[np.ndarray, np.ndarray]]
+
+def build_type_members(columns: PokedexColumns) -> Dict[Tuple[str, str, bool], Tuple[np.ndarray, np.ndarray]]:
+    """
+    Construye los arrays ordenados de integrantes de cada tipo.
+
+    La clave de 'name_length' es largo del nombre * 2^32 + número de Pokedex, así los empates
+    de largo se desempatan por número y cada clave es única.
+
+    Args:
+        columns (PokedexColumns): Columnas de la Pokedex
+
+    Returns:
+        Dict: (tipo, orden, default_only) -> (filas, claves)
+    """
+    ids = columns.ids.astype(np.int64)
+    lengths = np.char.str_len(columns.names.astype(str)).astype(np.int64)
+    keys_by_sort = {'id': ids, 'name_length': (lengths << 32) | ids}
+
+    orders = {}
+    for bit, type_name in enumerate(TYPE_NAMES):
+        members = (columns.type_mask & np.uint32(1 << bit)) != 0
+        for default_only in (False, True):
+            rows = np.flatnonzero(members & columns.is_default if default_only else members)
+            for sort, keys in keys_by_sort.items():
+                member_keys = keys[rows]
+                order = np.argsort(member_keys, kind='stable')
+                orders[(type_name, sort, default_only)] = (rows[order], member_keys[order])
+    return orders
+
+def encode_cursor(sort: str, order: str, default_only: bool, key: int) -> str:
+    """Arma un cursor opaco con la clave del último integrante devuelto."""
+    raw = f'{sort}:{order}:{int(default_only)}:{key}'.encode('ascii')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor: str, sort: str, order: str, default_only: bool) -> int:
+    """
+    Obtiene la clave guardada en un cursor.
+
+    Raises:
+        ValueError: Si el cursor es inválido o es de otro orden o filtro
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode('ascii')
+        cursor_sort, cursor_order, cursor_default, key = raw.split(':')
+        key = int(key)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("El cursor es inválido")
+    if (cursor_sort, cursor_order, cursor_default) != (sort, order, str(int(default_only))):
+        raise ValueError("El cursor es de una consulta con otro orden o filtro")
+    return key
+
+class TypeMembersIndex:
+    """
+    Índice de integrantes por tipo sobre las columnas del PokedexStore.
+
+    Attributes:
+        store (PokedexStore): Almacén columnar de la Pokedex
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa el índice vacío. Se construye en la primera consulta.
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._state: Optional[_TypeMembersState] = None
+        self._lock = threading.Lock()
+
+    def get_state(self, wait: bool = False) -> _TypeMembersState:
+        """
+        Obtiene los arrays de integrantes, reconstruyéndolos si las columnas del almacén cambiaron.
+
+        Si otro thread ya los está reconstruyendo devuelve los anteriores, salvo que se pida wait=True.
+        """
+        columns = self.store.get_columns(wait=wait)
+        state = self._state
+        if state is not None and (state.columns is columns or columns is not self.store.columns):
+            return state
+        if state is not None and not wait:
+            if not self._lock.acquire(blocking=False):
+                return state
+        else:
+            self._lock.acquire()
+
+        try:
+            if self._state is None or self._state.columns is not columns:
+                self._state = _TypeMembersState(columns=columns, orders=build_type_members(columns))
+                logger.info(f'Índice de integrantes por tipo construido con {len(columns.ids)} Pokemon')
+            return self._state
+        finally:
+            self._lock.release()
+
+    def page(self, type_name: str, limit: int = 50, cursor: Optional[str] = None, sort: str = 'id',
+             order: str = 'asc', default_only: bool = False, fields: Optional[Tuple[str, ...]] = None) -> Dict:
+        """
+        Obtiene una página de integrantes de un tipo.
+
+        Args:
+            type_name (str): Nombre del tipo
+            limit (int, optional): Integrantes por página (máximo MAX_PAGE_SIZE). Default = 50.
+            cursor (str, optional): Cursor devuelto por la página anterior
+            sort (str, optional): 'id' (default) o 'name_length'
+            order (str, optional): 'asc' (default) o 'desc'
+            default_only (bool, optional): Solo formas default. Default = False.
+            fields (Tuple[str, ...], optional): Campos de cada integrante (ver ROW_FIELDS). Default = MEMBER_FIELDS.
+
+        Returns:
+            Dict: Total de integrantes, la página y el cursor de la siguiente (None si es la última)
+
+        Raises:
+            KeyError: Si el tipo no existe
+            ValueError: Si algún parámetro o el cursor son inválidos
+
+        Ejemplo:
+            >>> index.page('dragon', limit=20, sort='name_length', order='desc')
+        """
+        type_name = type_name.lower()
+        if type_name not in TYPE_NAMES:
+            raise KeyError(type_name)
+        if sort not in SORTS:
+            raise ValueError(f"sort debe ser {' o '.join(SORTS)}")
+        if order not in ('asc', 'desc'):
+            raise ValueError("order debe ser 'asc' o 'desc'")
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit debe estar entre 1 y {MAX_PAGE_SIZE}")
+
+        state = self.get_state()
+        rows, keys = state.orders[(type_name, sort, default_only)]
+        if order == 'asc':
+            start = 0 if cursor is None else int(np.searchsorted(keys, decode_cursor(cursor, sort, order, default_only), side='right'))
+            end = min(start + limit, len(rows))
+            selected = range(start, end)
+            has_more = end < len(rows)
+        else:
+            end = len(rows) if cursor is None else int(np.searchsorted(keys, decode_cursor(cursor, sort, order, default_only), side='left'))
+            start = max(end - limit, 0)
+            selected = range(end - 1, start - 1, -1)
+            has_more = start > 0
+
+        project = ROW_FIELDS.projector(fields or MEMBER_FIELDS)
+        members = [project(state.columns, rows[position]) for position in selected]
+        next_cursor = None
+        if has_more and members:
+            next_cursor = encode_cursor(sort, order, default_only, int(keys[selected[-1]]))
+
+        return {
+            "tipo": type_name,
+            "total": int(len(rows)),
+            "pokemon": members,
+            "siguiente": next_cursor
+        }
@@ -0,0 +1,222 @@
+"""
+Módulo de estadísticas por tipo.
+Mantiene, para cada tipo, la cantidad de integrantes y, por cada stat base (y el total),
+la suma y la lista ordenada de valores. Se actualiza de a un documento cada vez que un
+Pokemon entra, cambia o sale de la cache del PokemonService (ver add_cache_listener),
+así las consultas no recorren a los integrantes:
+    - promedio, mínimo y máximo: O(1)
+    - top-k de un stat: O(k)
+Una tanda grande de documentos (ej: la carga del snapshot) se ordena una sola vez.
+Invalidar la cache no saca documentos (ver PokemonService.invalidate_cache): los agregados
+no cambian hasta que entra la versión nueva de cada Pokemon.
+"""
+
+import bisect
+import threading
+from typing import Dict, Iterable, List, Tuple
+from app.services.pokedex_store import PokedexStore, STAT_NAMES, TYPE_NAMES
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+AGGREGATE_STATS = STAT_NAMES + ('total',)
+# Tandas de al menos este tamaño se agregan al final y se ordenan de una vez
+BULK_THRESHOLD = 32
+
+def stat_entries(document: Dict) -> Tuple[List[str], Tuple[int, ...], int, str]:
+    """
+    Extrae de un documento /pokemon/<x> lo que guardan los agregados.
+
+    Returns:
+        Tuple: Tipos, valores de AGGREGATE_STATS, número de Pokedex y nombre
+    """
+    stats = tuple(document['stats'][position]['base_stat'] for position in range(len(STAT_NAMES)))
+    types = [t['type']['name'] for t in document['types'] if t['type']['name'] in TYPE_NAMES]
+    return types, stats + (sum(stats),), document['id'], document['name']
+
+class _TypeAggregate:
+    """
+    Agregados de un tipo.
+
+    Attributes:
+        count (int): Cantidad de integrantes
+        sums (List[int]): Suma de cada stat de AGGREGATE_STATS
+        ranked (List[List[Tuple[int, int, str]]]): Por stat, (valor, número, nombre) ordenados de menor a mayor
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sums = [0] * len(AGGREGATE_STATS)
+        self.ranked: List[List[Tuple[int, int, str]]] = [[] for _ in AGGREGATE_STATS]
+
+    def add(self, values: Tuple[int, ...], pokemon_id: int, name: str, bulk: bool) -> None:
+        self.count += 1
+        for position, value in enumerate(values):
+            self.sums[position] += value
+            if bulk:
+                self.ranked[position].append((value, pokemon_id, name))
+            else:
+                bisect.insort(self.ranked[position], (value, pokemon_id, name))
+
+    def remove(self, values: Tuple[int, ...], pokemon_id: int, name: str) -> None:
+        self.count -= 1
+        for position, value in enumerate(values):
+            self.sums[position] -= value
+            ranked = self.ranked[position]
+            index = bisect.bisect_left(ranked, (value, pokemon_id, name))
+            if index < len(ranked) and ranked[index] == (value, pokemon_id, name):
+                del ranked[index]
+
+class TypeStatsIndex:
+    """
+    Estadísticas por tipo, mantenidas de forma incremental sobre la cache del PokemonService.
+
+    Attributes:
+        store (PokedexStore): Almacén de la Pokedex (provee la cache y el snapshot)
+    """
+
+    def __init__(self, store: PokedexStore):
+        """
+        Inicializa los agregados y se suscribe a los cambios de la cache
+        (recibiendo primero los documentos que ya están en ella).
+
+        Args:
+            store (PokedexStore): Almacén columnar de la Pokedex
+        """
+        self.store = store
+        self._aggregates = {type_name: _TypeAggregate() for type_name in TYPE_NAMES}
+        self._lock = threading.Lock()
+        store.pokemon_service.add_cache_listener(self.apply)
+
+    def apply(self, added: Iterable[Dict], removed: Iterable[Dict]) -> None:
+        """
+        Actualiza los agregados con un cambio de la cache.
+
+        Args:
+            added (Iterable[Dict]): Documentos que entraron (o versión nueva de los que cambiaron)
+            removed (Iterable[Dict]): Documentos que salieron (o versión anterior de los que cambiaron)
+        """
+        added, removed = list(added), list(removed)
+        bulk = len(added) >= BULK_THRESHOLD
+        with self._lock:
+            for document in removed:
+                types, values, pokemon_id, name = stat_entries(document)
+                for type_name in types:
+                    self._aggregates[type_name].remove(values, pokemon_id, name)
+            touched = set()
+            for document in added:
+                types, values, pokemon_id, name = stat_entries(document)
+                for type_name in types:
+                    self._aggregates[type_name].add(values, pokemon_id, name, bulk)
+                    touched.add(type_name)
+            if bulk:
+                for type_name in touched:
+                    for ranked in self._aggregates[type_name].ranked:
+                        ranked.sort()
+        if bulk:
+            logger.info(f'Estadísticas por tipo recalculadas con {len(added)} Pokemon')
+
+    @staticmethod
+    def _entry(entry: Tuple[int, int, str]) -> Dict:
+        value, pokemon_id, name = entry
+        return {"nombre": name, "número_pokedex": pokemon_id, "valor": value}
+
+    def _aggregate(self, type_name: str) -> _TypeAggregate:
+        """Agregados de un tipo (llamar con el lock tomado)."""
+        type_name = type_name.lower()
+        if type_name not in self._aggregates:
+            raise KeyError(type_name)
+        return self._aggregates[type_name]
+
+    def summary(self, type_name: str) -> Dict:
+        """
+        Obtiene cantidad, promedio, mínimo y máximo de cada stat de un tipo.
+
+        Args:
+            type_name (str): Nombre del tipo
+
+        Returns:
+            Dict: Cantidad de integrantes y, por stat, promedio, mínimo y máximo (con su Pokemon)
+
+        Raises:
+            KeyError: Si el tipo no existe
+
+        Ejemplo:
+            >>> type_stats_index.summary('dragon')['stats']['total']['promedio']
+        """
+        self.store.load_snapshot() #Una sola vez: los documentos entran a los agregados por add_cache_listener
+        with self._lock:
+            aggregate = self._aggregate(type_name)
+            stats = {}
+            for position, stat in enumerate(AGGREGATE_STATS):
+                ranked = aggregate.ranked[position]
+                stats[stat] = {
+                    "promedio": round(aggregate.sums[position] / aggregate.count, 2) if aggregate.count else None,
+                    "minimo": self._entry(ranked[0]) if ranked else None,
+                    "maximo": self._entry(ranked[-1]) if ranked else None
+                }
+            return {"tipo": type_name.lower(), "cantidad": aggregate.count, "stats": stats}
+
+    def leaderboard(self, type_name: str, stat: str, k: int = 10, order: str = 'desc') -> Dict:
+        """
+        Obtiene los k Pokemon de un tipo con el valor más alto (o más bajo) de un stat.
+
+        Args:
+            type_name (str): Nombre del tipo
+            stat (str): Stat de AGGREGATE_STATS
+            k (int, optional): Cantidad de Pokemon. Default = 10.
+            order (str, optional): 'desc' (los más altos, default) o 'asc'
+
+        Returns:
+            Dict: Ranking, de mejor a peor
+
+        Raises:
+            KeyError: Si el tipo no existe
+            ValueError: Si el stat u order son inválidos
+        """
+        if stat not in AGGREGATE_STATS:
+            raise ValueError(f"No conozco el stat '{stat}'")
+        if order not in ('asc', 'desc'):
+            raise ValueError("order debe ser 'asc' o 'desc'")
+        self.store.load_snapshot()
+        with self._lock:
+            ranked = self._aggregate(type_name).ranked[AGGREGATE_STATS.index(stat)]
+            top = ranked[:-k - 1:-1] if order == 'desc' else ranked[:k]
+            return {"tipo": type_name.lower(), "stat": stat, "ranking": [self._entry(entry) for entry in top]}
+
+    def type_leaderboard(self, stat: str, order: str = 'desc') -> Dict:
+        """
+        Ordena los tipos por el promedio de un stat, con el mejor Pokemon de cada uno.
+
+        Args:
+            stat (str): Stat de AGGREGATE_STATS
+            order (str, optional): 'desc' (promedio más alto primero, default) o 'asc'
+
+        Returns:
+            Dict: Ranking de tipos
+
+        Raises:
+            ValueError: Si el stat u order son inválidos
+
+        Ejemplo:
+            >>> type_stats_index.type_leaderboard('total')['ranking'][0]['tipo']
+            'dragon'
+        """
+        if stat not in AGGREGATE_STATS:
+            raise ValueError(f"No conozco el stat '{stat}'")
+        if order not in ('asc', 'desc'):
+            raise ValueError("order debe ser 'asc' o 'desc'")
+        position = AGGREGATE_STATS.index(stat)
+        self.store.load_snapshot()
+        with self._lock:
+            ranking = [
+                {
+                    "tipo": type_name,
+                    "cantidad": aggregate.count,
+                    "promedio": round(aggregate.sums[position] / aggregate.count, 2),
+                    "mejor": self._entry(aggregate.ranked[position][-1])
+                }
+                for type_name, aggregate in self._aggregates.items() if aggregate.count
+            ]
+        ranking.sort(key=lambda entry: entry["promedio"], reverse=(order == 'desc'))
+        return {"stat": stat, "ranking": ranking}
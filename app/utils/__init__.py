@@ -1,12 +1,12 @@
 """
 Módulo de inicialización de utilidades.
 Exporta funciones y decoradores incluyendo:
-- Decoradores para manejo de errores y procesos de autenticación
+- Decoradores para manejo de errores y procesos de autenticación y administración
 - Funciones para crear respuestas HTTP
 - Mensajes de la API
 """
 
-from .decorators import handle_api_errors, requires_auth
+from .decorators import handle_api_errors, requires_auth, requires_admin
 from .responses import (
     create_response,
     create_auth_error_response,
@@ -18,6 +18,7 @@ from .responses import (
 __all__ = [
     'handle_api_errors',
     'requires_auth',
+    'requires_admin',
     'create_response',
     'create_auth_error_response',
     'create_invalid_token_response',
@@ -0,0 +1,242 @@
+"""
+Módulo de control de admisión y presupuesto de tiempo de las requests.
+    - Cada clase de ruta tiene un límite de requests concurrentes que se adapta a la latencia
+      observada (AIMD): sube de a poco mientras la latencia se mantiene cerca de la mínima
+      y baja multiplicativamente cuando crece, señal de que la PokeAPI u Okta se saturan.
+    - Una request que no consigue lugar dentro de ADMISSION_QUEUE_TIMEOUT se descarta
+      con un 503 y Retry-After, en lugar de esperar hasta que el cliente abandone.
+    - Cada request admitida recibe un deadline (REQUEST_DEADLINE); request_timeout() lo
+      convierte en el timeout de cada llamada a la PokeAPI u Okta (y cuenta las llamadas).
+      Si ya no queda tiempo, DeadlineExceeded se responde con un 504 (no como un 404 o 500).
+    - Una respuesta en streaming (exportación, sprites) conserva su lugar hasta que el
+      servidor termina de enviarla o el cliente corta, y esa es la latencia que se mide.
+
+Cada limitador compara latencias contra su mínima, así que cada clase agrupa rutas con
+una misma distribución de latencia:
+    - 'local': índices en memoria (/pokedex/query, /abilities, /types/<t>/stats, ...), ~1 ms
+    - 'cached': documentos de la cache del PokemonService (/pokedex/<name>), ~1 ms
+    - 'upstream': rutas que consultan la PokeAPI en cada request (whos-that-pokemon, longest,
+      /pokedex/types, sprites), decenas o cientos de ms. Es la clase de los endpoints no listados.
+    - 'export': exportaciones en streaming, segundos
+    - 'auth': obtención de tokens en Okta
+En 'local' y 'cached' un fallo de cache llama a la PokeAPI: la request ocupa su lugar pero
+su latencia no se usa para ajustar el límite (pertenece a la distribución de 'upstream').
+"""
+
+import math
+import threading
+import time
+from typing import Dict, Optional
+import requests
+from flask import Flask, g, has_request_context, request
+from app.config.settings import ADMISSION_CONTROL, ADMISSION_LIMITS, ADMISSION_QUEUE_TIMEOUT, REQUEST_DEADLINE
+from app.utils.logger import get_logger
+from app.utils.responses import create_response
+
+logger = get_logger()
+
+# Clase de cada endpoint. Los no listados consultan la PokeAPI en cada request ('upstream')
+ROUTE_CLASSES = {
+    'auth.get_token': 'auth',
+    'pokemon.get_pokemon': 'cached',
+    'pokemon.query_pokedex': 'local',
+    'pokemon.team_coverage': 'local',
+    'pokemon.pokemon_by_ability': 'local',
+    'pokemon.similar_pokemon': 'local',
+    'pokemon.pokemon_evolutions': 'local',
+    'pokemon.export_pokedex': 'export',
+    'pokemon.type_members': 'local',
+    'pokemon.type_stats': 'local',
+    'pokemon.type_leaderboard': 'local',
+    'pokemon.leaderboard_by_type': 'local',
+}
+# Endpoints que nunca se descartan: no hacen trabajo pesado
+EXEMPT_ENDPOINTS = {'pokemon.welcome', 'pokemon.instructions', 'static'}
+# Clases servidas desde memoria: sus requests que llamaron a un servicio externo no ajustan el límite
+MEMORY_CLASSES = {'local', 'cached'}
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """El presupuesto de tiempo de la request se agotó antes de llamar a un servicio externo."""
+
+def request_timeout(default: float) -> float:
+    """
+    Calcula el timeout de una llamada a un servicio externo según el deadline de la request.
+
+    Fuera de una request (CLI, snapshot, tareas de fondo) devuelve el default.
+
+    Args:
+        default (float): Timeout máximo de la llamada en segundos
+
+    Returns:
+        float: El menor entre el default y el tiempo que le queda a la request
+
+    Raises:
+        DeadlineExceeded: Si a la request ya no le queda tiempo
+
+    Ejemplo:
+        >>> get_http_session().get(url, timeout=request_timeout(10))
+    """
+    if not has_request_context():
+        return default
+    g.external_calls = g.get('external_calls', 0) + 1
+    deadline = g.get('deadline')
+    if deadline is None:
+        return default
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise DeadlineExceeded('Se agotó el tiempo disponible para la request')
+    return min(default, remaining)
+
+class AdaptiveLimiter:
+    """
+    Límite de concurrencia adaptativo (AIMD) con cola acotada en tiempo.
+
+    Attributes:
+        name (str): Clase de ruta que controla
+        max_limit (int): Límite máximo de requests concurrentes
+        limit (float): Límite actual, entre min_limit y max_limit
+        inflight (int): Requests en curso
+        baseline (float): Latencia de referencia (mínimo con deriva lenta hacia arriba)
+    """
+
+    def __init__(self, name: str, max_limit: int, min_limit: int = 1, tolerance: float = 2.0,
+                 backoff: float = 0.9):
+        """
+        Args:
+            name (str): Clase de ruta
+            max_limit (int): Límite máximo (también es el límite inicial)
+            min_limit (int, optional): Límite mínimo. Default = 1.
+            tolerance (float, optional): Latencia tolerada como múltiplo de la referencia. Default = 2.0.
+            backoff (float, optional): Factor de reducción ante latencia alta. Default = 0.9.
+        """
+        self.name = name
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.tolerance = tolerance
+        self.backoff = backoff
+        self.limit = float(max_limit)
+        self.inflight = 0
+        self.baseline: Optional[float] = None
+        self.shed = 0
+        self._last_decrease = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self, timeout: float) -> bool:
+        """
+        Espera un lugar libre como máximo `timeout` segundos.
+
+        Returns:
+            bool: True si la request fue admitida, False si debe descartarse
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while self.inflight >= int(self.limit):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.shed += 1
+                    return False
+                self._condition.wait(remaining)
+            self.inflight += 1
+            return True
+
+    def release(self, latency: float, sample: bool = True) -> None:
+        """
+        Libera el lugar de una request y ajusta el límite según su latencia.
+
+        Args:
+            latency (float): Duración de la request en segundos
+            sample (bool, optional): False para solo liberar el lugar, sin ajustar el límite. Default = True.
+        """
+        with self._condition:
+            self.inflight -= 1
+            if not sample:
+                self._condition.notify()
+                return
+            if self.baseline is None or latency < self.baseline:
+                self.baseline = latency
+            else:
+                self.baseline += (latency - self.baseline) * 0.01 #Deriva lenta: olvida mínimos viejos
+
+            now = time.monotonic()
+            if latency > self.baseline * self.tolerance:
+                # Como máximo una reducción por ventana de latencia, para no colapsar ante una ráfaga
+                if now - self._last_decrease > latency:
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            self._condition.notify()
+
+    def stats(self) -> Dict:
+        """Estado actual del limitador."""
+        return {
+            "limite": int(self.limit),
+            "maximo": self.max_limit,
+            "en_curso": self.inflight,
+            "latencia_referencia_ms": round(self.baseline * 1000, 1) if self.baseline is not None else None,
+            "descartadas": self.shed
+        }
+
+limiters = {name: AdaptiveLimiter(name, limit) for name, limit in ADMISSION_LIMITS.items()}
+
+def register_admission_control(app: Flask) -> None:
+    """
+    Registra el control de admisión y el deadline de las requests en la aplicación Flask.
+
+    Args:
+        app (Flask): Instancia de la aplicación Flask
+    """
+    retry_after = str(max(1, math.ceil(ADMISSION_QUEUE_TIMEOUT)))
+
+    def is_sample(limiter: AdaptiveLimiter) -> bool:
+        """Si la latencia de la request representa a su clase (ver MEMORY_CLASSES)."""
+        return limiter.name not in MEMORY_CLASSES or not g.get('external_calls')
+
+    @app.before_request
+    def admit_request():
+        g.deadline = time.monotonic() + REQUEST_DEADLINE
+        endpoint = request.endpoint
+        if not ADMISSION_CONTROL or endpoint is None or endpoint in EXEMPT_ENDPOINTS or endpoint.startswith('admin.'):
+            return None
+
+        limiter = limiters[ROUTE_CLASSES.get(endpoint, 'upstream')]
+        if not limiter.acquire(ADMISSION_QUEUE_TIMEOUT):
+            logger.warning(f'Request descartada por sobrecarga ({limiter.name}): {request.path}')
+            response = create_response({
+                "error": "¡Ups! La Pokedex está atendiendo a demasiados entrenadores.",
+                "sugerencia": f"Intentalo de nuevo en {retry_after} segundos."
+            }, 503)
+            response.headers['Retry-After'] = retry_after
+            return response
+        g.admission = (limiter, time.monotonic())
+        return None
+
+    @app.errorhandler(DeadlineExceeded)
+    def handle_deadline_exceeded(error):
+        # No es un fallo de la PokeAPI ni un recurso inexistente: la request se quedó sin tiempo
+        logger.warning(f'Request sin tiempo disponible: {request.path}')
+        response = create_response({
+            "error": "¡Ups! La Pokedex tardó demasiado en responder.",
+            "sugerencia": f"Intentalo de nuevo en {retry_after} segundos."
+        }, 504)
+        response.headers['Retry-After'] = retry_after
+        return response
+
+    @app.after_request
+    def defer_streamed_release(response):
+        # El cuerpo de una respuesta en streaming se genera después de la vista: el lugar se
+        # libera cuando el servidor cierra la respuesta (teardown_request corre antes)
+        if response.is_streamed:
+            admission = g.pop('admission', None)
+            if admission is not None:
+                limiter, start = admission
+                sample = is_sample(limiter)
+                response.call_on_close(lambda: limiter.release(time.monotonic() - start, sample))
+        return response
+
+    @app.teardown_request
+    def release_request(exception=None):
+        admission = g.pop('admission', None)
+        if admission is not None:
+            limiter, start = admission
+            limiter.release(time.monotonic() - start, is_sample(limiter))
@@ -0,0 +1,183 @@
+"""
+Módulo de utilidades de cache.
+    - CacheStats: aciertos, fallos, desalojos y claves más consultadas de una cache
+    - deep_sizeof: estimación de memoria de una cache
+    - InvalidationBus: invalidaciones compartidas entre workers mediante memoria compartida
+
+Las claves de cache tienen forma de ruta de la PokeAPI ('pokemon/pikachu', 'type/fire',
+'evolution-chain/1', 'token/<hash>') y los patrones de invalidación son una clave exacta,
+un prefijo terminado en '*' ('type/*') o '*' para invalidar todo.
+"""
+
+import mmap
+import multiprocessing
+import struct
+import sys
+import threading
+from collections import Counter
+from typing import Dict, List
+
+class CacheStats:
+    """
+    Métricas de uso de una cache.
+
+    Attributes:
+        hits (int): Consultas resueltas desde la cache
+        misses (int): Consultas que tuvieron que ir al servicio externo
+        evictions (int): Entradas eliminadas (invalidación o vencimiento)
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._hot_keys: Counter = Counter()
+
+    def hit(self, key: str) -> None:
+        self.hits += 1
+        self._hot_keys[key] += 1
+
+    def miss(self) -> None:
+        self.misses += 1
+
+    def evicted(self, keys: List[str]) -> None:
+        self.evictions += len(keys)
+        for key in keys:
+            self._hot_keys.pop(key, None)
+
+    def report(self, entries: int, size_bytes: int, top: int = 10) -> Dict:
+        """
+        Arma el reporte de la cache.
+
+        Args:
+            entries (int): Cantidad de entradas actuales
+            size_bytes (int): Memoria estimada en bytes
+            top (int, optional): Cantidad de claves más consultadas. Default = 10.
+
+        Returns:
+            Dict: Métricas de la cache
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entradas": entries,
+            "bytes": size_bytes,
+            "aciertos": self.hits,
+            "fallos": self.misses,
+            "tasa_aciertos": round(self.hits / lookups, 4) if lookups else None,
+            "desalojos": self.evictions,
+            "claves_mas_consultadas": [{"clave": key, "consultas": count} for key, count in self._hot_keys.most_common(top)]
+        }
+
+def deep_sizeof(value: object) -> int:
+    """
+    Estima la memoria que ocupa un objeto recorriendo dicts, listas y tuplas.
+
+    Ejemplo:
+        >>> deep_sizeof({"name": "pikachu", "types": [{"slot": 1}]})
+    """
+    seen = set()
+    pending = [value]
+    total = 0
+    while pending:
+        item = pending.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set)):
+            pending.extend(item)
+    return total
+
+def matches(pattern: str, key: str) -> bool:
+    """Indica si una clave corresponde a un patrón de invalidación."""
+    if pattern.endswith('*'):
+        return key.startswith(pattern[:-1])
+    return key == pattern
+
+class InvalidationBus:
+    """
+    Registro circular de invalidaciones en memoria compartida.
+
+    La memoria se crea al importar el módulo; con un servidor que hace fork después de crear
+    la app (gunicorn con preload_app), todos los workers comparten el mismo registro. Cada
+    worker recuerda la última generación que aplicó y, antes de cada request, aplica las
+    invalidaciones publicadas desde entonces. Si se perdió alguna (más de `slots` nuevas),
+    vacía todas sus caches.
+
+    Attributes:
+        slots (int): Invalidaciones que conserva el registro
+    """
+    HEADER = struct.Struct('q')
+    SLOT_SIZE = 256 #8 bytes de generación + patrón en UTF-8
+
+    def __init__(self, slots: int = 256):
+        self.slots = slots
+        self._memory = mmap.mmap(-1, self.HEADER.size + slots * self.SLOT_SIZE)
+        self._write_lock = multiprocessing.Lock() #Compartido entre procesos
+        self._local_lock = threading.Lock()
+        self._seen = 0
+
+    @property
+    def generation(self) -> int:
+        """Última generación publicada por cualquier worker."""
+        return self.HEADER.unpack_from(self._memory, 0)[0]
+
+    def _slot_offset(self, generation: int) -> int:
+        return self.HEADER.size + (generation % self.slots) * self.SLOT_SIZE
+
+    def publish(self, pattern: str) -> int:
+        """
+        Publica una invalidación para todos los workers.
+
+        Args:
+            pattern (str): Clave, prefijo terminado en '*' o '*'
+
+        Returns:
+            int: Generación asignada
+
+        Raises:
+            ValueError: Si el patrón es demasiado largo
+        """
+        encoded = pattern.encode('utf-8')
+        if len(encoded) > self.SLOT_SIZE - self.HEADER.size - 1:
+            raise ValueError("El patrón de invalidación es demasiado largo")
+        with self._write_lock:
+            generation = self.generation + 1
+            offset = self._slot_offset(generation)
+            self._memory[offset:offset + self.SLOT_SIZE] = b'\0' * self.SLOT_SIZE
+            self._memory[offset + self.HEADER.size:offset + self.HEADER.size + len(encoded)] = encoded
+            self.HEADER.pack_into(self._memory, offset, generation)
+            self.HEADER.pack_into(self._memory, 0, generation) #Se publica al final, con el registro completo
+        return generation
+
+    def poll(self) -> List[str]:
+        """
+        Obtiene las invalidaciones que este proceso todavía no aplicó.
+
+        Returns:
+            List[str]: Patrones pendientes (['*'] si se perdieron invalidaciones)
+        """
+        current = self.generation
+        if current == self._seen:
+            return []
+        with self._local_lock:
+            if current <= self._seen:
+                return []
+            if current - self._seen > self.slots:
+                patterns = ['*']
+            else:
+                patterns = []
+                for generation in range(self._seen + 1, current + 1):
+                    offset = self._slot_offset(generation)
+                    raw = bytes(self._memory[offset:offset + self.SLOT_SIZE])
+                    if self.HEADER.unpack_from(raw, 0)[0] != generation:
+                        patterns = ['*'] #El registro se sobrescribió mientras se leía
+                        break
+                    patterns.append(raw[self.HEADER.size:].rstrip(b'\0').decode('utf-8'))
+            self._seen = current
+            return patterns
+
+invalidation_bus = InvalidationBus()
@@ -35,8 +35,12 @@ def handle_api_errors(f: Callable) -> Callable:
     """
     @wraps(f) #Permite conservar mensajes de la función a la cual se añade el decorador
     def decorated(*args: Any, **kwargs: Any) -> Any:
+        #Lazy import para evitar problemas por importación circular
+        from app.utils.admission import DeadlineExceeded
         try:
             return f(*args, **kwargs)
+        except DeadlineExceeded:
+            raise #Lo responde el handler de la aplicación (504)
         except requests.exceptions.RequestException as e:
             logger.error(f'Error de conexión en solicitud HTTP: {str(e)}')
             error_data = {
@@ -77,9 +81,10 @@ def requires_auth(f: Callable) -> Callable:
             logger.warning('Intento de acceso sin token de autorización')
             return create_response(create_auth_error_response(), 401)
         
+        #Lazy import para evitar problemas por importación circular
+        from app.services.auth_service import AuthService
+        from app.utils.admission import DeadlineExceeded
         try:
-            #Lazy import para evitar problemas por importación circular
-            from app.services.auth_service import AuthService
             auth_service = AuthService()
             
             token = auth_header.split(" ")[1]
@@ -94,6 +99,8 @@ def requires_auth(f: Callable) -> Callable:
             logger.warning(f'Token inválido detectado: {token[:10]}...')
             return create_response(create_invalid_token_response(), 401)
             
+        except DeadlineExceeded:
+            raise #No es un problema del token: lo responde el handler de la aplicación (504)
         except Exception as e:
             logger.error(f'Error en validación de token: {str(e)}')
             return create_response({
@@ -101,4 +108,36 @@ def requires_auth(f: Callable) -> Callable:
                 "sugerencia": "Obtén un nuevo token en /obtener-ficha"
             }, 401)
     
-    return decorated
\ No newline at end of file
+    return decorated
+
+def requires_admin(f: Callable) -> Callable:
+    """
+    Decorador para endpoints de administración.
+    Verifica el header X-Admin-Token contra ADMIN_TOKEN; si ADMIN_TOKEN no está
+    definido, los endpoints quedan deshabilitados.
+    
+    Args:
+        f (Callable): Función a decorar
+        
+    Returns:
+        Callable: Función decorada con validación de token de administración
+        
+    Ejemplo:
+        @requires_admin
+        def list_profiles():
+            # código de la función
+    """
+    @wraps(f)
+    def decorated(*args: Any, **kwargs: Any) -> Any:
+        #Lazy import para evitar problemas por importación circular
+        from app.utils.profiler import is_admin_token
+        
+        if not is_admin_token(request.headers.get('X-Admin-Token')):
+            logger.warning(f'Intento de acceso a administración sin token válido: {request.path}')
+            return create_response({
+                "error": "¡Alto ahí! Esta zona es solo para el Profesor Oak.",
+                "sugerencia": "Enviá un token de administración válido en el header X-Admin-Token"
+            }, 403)
+        return f(*args, **kwargs)
+    
+    return decorated
@@ -0,0 +1,78 @@
+"""
+Módulo de selección de campos (parámetro `fields=` de las rutas de la Pokedex).
+Cada recurso define sus campos con la función que calcula cada uno; para cada combinación
+de campos pedida se compila una sola vez un proyector que calcula solo esos campos.
+
+Ejemplo:
+    /pokedex/pikachu?fields=nombre,tipos
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+
+class FieldSet:
+    """
+    Campos disponibles de un recurso.
+
+    Attributes:
+        builders (Dict[str, Callable]): Función que calcula cada campo, en el orden de la respuesta
+        default (Tuple[str, ...]): Campos que se devuelven si no se pide `fields`
+    """
+
+    def __init__(self, builders: Dict[str, Callable], default: Optional[Tuple[str, ...]] = None):
+        self.builders = builders
+        self.default = tuple(default or builders)
+        self._projectors: Dict[Tuple[str, ...], Callable[..., Dict]] = {}
+        self._lock = threading.Lock()
+
+    def parse(self, value: Optional[str]) -> Optional[Tuple[str, ...]]:
+        """
+        Interpreta el parámetro `fields`.
+
+        Args:
+            value (Optional[str]): Campos separados por coma (None o vacío = default)
+
+        Returns:
+            Optional[Tuple[str, ...]]: Campos en el orden de la respuesta, o None para el default
+
+        Raises:
+            ValueError: Si algún campo no existe
+        """
+        if not value:
+            return None
+        requested = {field.strip() for field in value.split(',') if field.strip()}
+        unknown = sorted(requested - self.builders.keys())
+        if unknown:
+            raise ValueError(f"No conozco el campo '{unknown[0]}'")
+        if not requested:
+            raise ValueError("fields no puede estar vacío")
+        return tuple(field for field in self.builders if field in requested)
+
+    def projector(self, fields: Optional[Tuple[str, ...]] = None) -> Callable[..., Dict]:
+        """
+        Obtiene el proyector de una combinación de campos (se compila en el primer uso).
+
+        Args:
+            fields (Optional[Tuple[str, ...]]): Campos devueltos por parse() (None = default)
+
+        Returns:
+            Callable[..., Dict]: Recibe lo mismo que las funciones de cada campo y devuelve la ficha
+
+        Ejemplo:
+            >>> POKEMON_FIELDS.projector(('nombre', 'tipos'))(document)
+            {'nombre': 'pikachu', 'tipos': ['electric']}
+        """
+        fields = fields or self.default
+        projector = self._projectors.get(fields)
+        if projector is None:
+            with self._lock:
+                projector = self._projectors.get(fields)
+                if projector is None:
+                    items = tuple((field, self.builders[field]) for field in fields)
+                    projector = lambda *args: {field: build(*args) for field, build in items}
+                    self._projectors[fields] = projector
+        return projector
+
+    def describe(self) -> str:
+        """Lista de campos para los mensajes de error."""
+        return ', '.join(self.builders)
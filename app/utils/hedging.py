@@ -0,0 +1,211 @@
+"""
+Módulo de requests "hedged" a la PokeAPI.
+Si un GET no respondió dentro del p95 de latencia de su endpoint (medido en línea), se lanza
+una segunda request idéntica y se usa la primera que responda. Los hedges consumen un
+presupuesto (HEDGE_BUDGET, ej: 5% de requests adicionales), así en una caída general de la
+PokeAPI no se duplica la carga.
+
+La request perdedora no se puede interrumpir a mitad de camino: sigue en un thread del pool
+hasta terminar (acotada por su timeout) y su respuesta se descarta.
+"""
+
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Deque, Dict, Optional
+import requests
+from app.config.settings import HEDGE_BUDGET, HEDGE_MIN_DELAY, HEDGE_MIN_SAMPLES
+from app.utils.http import HTTP_POOL_SIZE, get_http_session
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+class LatencyTracker:
+    """
+    Percentil de latencia de un endpoint sobre una ventana de las últimas muestras.
+
+    Attributes:
+        window (int): Cantidad de muestras que se conservan
+        quantile (float): Percentil calculado (0.95 = p95)
+    """
+
+    def __init__(self, window: int = 256, quantile: float = 0.95, refresh: int = 16):
+        self.window = window
+        self.quantile = quantile
+        self._refresh = refresh
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._pending = 0
+        self._value: Optional[float] = None
+
+    def add(self, latency: float) -> None:
+        """Agrega una muestra; el percentil se recalcula cada `refresh` muestras."""
+        self._samples.append(latency)
+        self._pending += 1
+        if self._pending >= self._refresh:
+            ordered = sorted(self._samples)
+            self._value = ordered[min(len(ordered) - 1, int(len(ordered) * self.quantile))]
+            self._pending = 0
+
+    @property
+    def count(self) -> int:
+        return len(self._samples)
+
+    @property
+    def value(self) -> Optional[float]:
+        """Percentil actual en segundos, o None si todavía no hay suficientes muestras."""
+        return self._value
+
+class HedgeBudget:
+    """
+    Presupuesto de hedges como token bucket: cada request primaria suma `ratio` fichas
+    y cada hedge consume una.
+
+    Attributes:
+        ratio (float): Proporción máxima de requests adicionales
+        capacity (float): Máximo de fichas acumulables (tolera ráfagas cortas)
+    """
+
+    def __init__(self, ratio: float, capacity: float = 10.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = 0.0
+
+    def earn(self) -> None:
+        self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def spend(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+class Hedger:
+    """
+    Ejecuta GETs idempotentes con hedging.
+
+    Attributes:
+        budget (HedgeBudget): Presupuesto de hedges
+        min_delay (float): Espera mínima antes de un hedge, en segundos
+        min_samples (int): Muestras necesarias en un endpoint antes de empezar a hacer hedging
+    """
+
+    def __init__(self, budget: float = HEDGE_BUDGET, min_delay: float = HEDGE_MIN_DELAY,
+                 min_samples: int = HEDGE_MIN_SAMPLES):
+        self.budget = HedgeBudget(budget)
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self._trackers: Dict[str, LatencyTracker] = {}
+        self._counters = {"requests": 0, "hedges": 0, "ganados": 0, "sin_presupuesto": 0}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix='pokeapi-hedge')
+            return self._executor
+
+    def reset_after_fork(self) -> None:
+        """Descarta el pool de threads heredado: los threads no sobreviven al fork."""
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _fetch(self, url: str, timeout: float) -> requests.Response:
+        return get_http_session().get(url, timeout=timeout)
+
+    def get(self, url: str, timeout: float, endpoint: str) -> requests.Response:
+        """
+        GET con hedging.
+
+        Args:
+            url (str): URL a consultar
+            timeout (float): Tiempo máximo total de espera en segundos
+            endpoint (str): Clave del endpoint para el seguimiento de latencia (ej: 'pokemon/<x>')
+
+        Returns:
+            requests.Response: La primera respuesta recibida (de cualquier status)
+
+        Raises:
+            requests.exceptions.Timeout: Si ninguna request respondió dentro del timeout
+            requests.exceptions.RequestException: Si todas las requests lanzadas fallaron
+        """
+        with self._lock:
+            tracker = self._trackers.setdefault(endpoint, LatencyTracker())
+            self._counters['requests'] += 1
+            self.budget.earn()
+            p95 = tracker.value if tracker.count >= self.min_samples else None
+
+        executor = self._get_executor()
+        start = time.monotonic()
+        deadline = start + timeout
+        primary = executor.submit(self._fetch, url, timeout)
+        pending = {primary}
+
+        if p95 is not None:
+            done, _ = wait(pending, timeout=min(timeout, max(p95, self.min_delay)))
+            if not done:
+                with self._lock:
+                    hedge_allowed = self.budget.spend()
+                    self._counters['hedges' if hedge_allowed else 'sin_presupuesto'] += 1
+                if hedge_allowed:
+                    logger.debug(f'Hedge de {endpoint} tras {(time.monotonic() - start) * 1000:.0f} ms')
+                    pending.add(executor.submit(self._fetch, url, max(0.001, deadline - time.monotonic())))
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                self._finish(future, primary, pending | (done - {future}), tracker, time.monotonic() - start)
+                return future.result()
+
+        if error is not None and not pending:
+            raise error
+        for future in pending:
+            future.add_done_callback(_close_response)
+        raise requests.exceptions.Timeout(f'Sin respuesta de {url} en {timeout:.1f} s')
+
+    def _finish(self, winner: Future, primary: Future, pending: set, tracker: LatencyTracker, latency: float) -> None:
+        """Registra la latencia del ganador y descarta la respuesta de la request perdedora."""
+        with self._lock:
+            tracker.add(latency)
+            if winner is not primary:
+                self._counters['ganados'] += 1
+        for future in pending:
+            future.cancel() #Solo tiene efecto si todavía no empezó
+            future.add_done_callback(_close_response)
+
+    def stats(self) -> Dict:
+        """
+        Métricas de hedging.
+
+        Returns:
+            Dict: Contadores, tasa de hedges, tasa de hedges ganados y p95 por endpoint
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            latencies = {endpoint: {"p95_ms": round(tracker.value * 1000, 1) if tracker.value is not None else None,
+                                    "muestras": tracker.count}
+                         for endpoint, tracker in self._trackers.items()}
+        return {
+            **counters,
+            "tasa_hedges": counters['hedges'] / counters['requests'] if counters['requests'] else 0.0,
+            "tasa_ganados": counters['ganados'] / counters['hedges'] if counters['hedges'] else 0.0,
+            "endpoints": latencies
+        }
+
+def _close_response(future: Future) -> None:
+    """Cierra la respuesta de una request perdedora cuando termina, devolviendo la conexión al pool."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+hedger = Hedger()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=hedger.reset_after_fork)
@@ -0,0 +1,47 @@
+"""
+Módulo de sesiones HTTP hacia los servicios externos (PokeAPI y Okta).
+Mantiene una sesión de requests por proceso, con pool de conexiones keep-alive.
+La sesión se crea en el primer uso y se descarta al hacer fork, para que cada
+worker abra sus propias conexiones en lugar de compartir los sockets del proceso padre.
+"""
+
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional
+
+HTTP_POOL_SIZE = 32 #Conexiones keep-alive por host (alcanza para un worker con varios threads)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+def get_http_session() -> requests.Session:
+    """
+    Obtiene la sesión HTTP del proceso actual, creándola si todavía no existe.
+
+    Returns:
+        requests.Session: Sesión con pool de conexiones reutilizables
+
+    Ejemplo:
+        >>> get_http_session().get('https://pokeapi.co/api/v2/pokemon/pikachu', timeout=10)
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=HTTP_POOL_SIZE)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _session = session
+    return _session
+
+def _reset_after_fork() -> None:
+    """Descarta la sesión heredada del proceso padre (sus sockets no se comparten entre workers)."""
+    global _session, _session_lock
+    _session = None
+    _session_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -35,6 +35,12 @@ def setup_logging(app: Flask) -> None:
     """
     global logger
     
+    # create_app puede ejecutarse más de una vez en el mismo proceso: evita duplicar handlers
+    if logger.handlers:
+        app.logger.handlers = logger.handlers
+        app.logger.setLevel(logger.level)
+        return
+    
     # Si no existe, crea el directorio de logs
     if not os.path.exists('logs'):
         os.makedirs('logs')
@@ -48,7 +54,8 @@ def setup_logging(app: Flask) -> None:
     file_handler = RotatingFileHandler(
         'logs/pokedex.log',
         maxBytes=10485760,  # 10MB
-        backupCount=10
+        backupCount=10,
+        delay=True  # El archivo se abre en la primera escritura de cada proceso
     )
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.INFO)
@@ -67,4 +74,16 @@ def setup_logging(app: Flask) -> None:
     app.logger.handlers = logger.handlers
     app.logger.setLevel(logger.level)
     
-    logger.debug('Sistema de logs iniciado.')
\ No newline at end of file
+    logger.debug('Sistema de logs iniciado.')
+
+def _reopen_log_files() -> None:
+    """
+    Cierra en el proceso hijo los archivos de log heredados del padre.
+    FileHandler los vuelve a abrir en la próxima escritura, así cada worker usa su propio descriptor.
+    """
+    for handler in logger.handlers:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reopen_log_files)
@@ -0,0 +1,225 @@
+"""
+Módulo de perfilado de requests a pedido.
+Perfila una request cuando trae el header X-Pokedex-Profile con el token de administración,
+o al azar según PROFILE_SAMPLE_RATE, y guarda el resultado en un anillo acotado en disco:
+    - Modo 'sampling': muestreo de la pila cada milisegundo, en formato de pilas colapsadas
+      (compatible con flamegraph.pl y speedscope)
+    - Modo 'cprofile': estadísticas de cProfile en formato pstats
+Con el worker 'gevent' (ver gunicorn.conf.py) el modo 'sampling' no sirve: los threads son
+greenlets que corren en el mismo thread del sistema operativo, así que el muestreador no corre
+mientras la request ocupa la CPU y sys._current_frames() no conoce sus identificadores. En ese
+caso se usa 'cprofile'.
+En una respuesta en streaming (ej: /pokedex/export) el perfil cubre también el envío del
+cuerpo: se guarda al cerrarse la respuesta y, como los headers ya se enviaron, su
+identificador se consulta en /admin/profiles.
+"""
+
+import os
+import re
+import sys
+import hmac
+import time
+import random
+import cProfile
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+from flask import Flask, g, request
+from app.config.settings import ADMIN_TOKEN, PROFILE_SAMPLE_RATE, PROFILE_MODE, PROFILE_DIR, PROFILE_MAX_FILES
+from app.utils.logger import get_logger
+
+logger = get_logger()
+
+PROFILE_HEADER = 'X-Pokedex-Profile'
+PROFILE_EXTENSIONS = {'sampling': 'collapsed', 'cprofile': 'pstats'}
+
+class SamplingCollector:
+    """
+    Perfilador por muestreo: un thread auxiliar lee la pila del thread de la request
+    a intervalos fijos y cuenta cuántas veces aparece cada pila.
+
+    Attributes:
+        thread_id (int): Identificador del thread a muestrear
+        interval (float): Segundos entre muestras
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def dump(self, path: str) -> None:
+        """Guarda las pilas colapsadas: una línea 'frame;frame;frame cantidad' por pila."""
+        with open(path, 'w', encoding='utf-8') as profile_file:
+            for stack, count in self.stacks.most_common():
+                profile_file.write(f'{stack} {count}\n')
+
+class CProfileCollector:
+    """Perfilador determinístico con cProfile (solo perfila el thread de la request)."""
+
+    def __init__(self, thread_id: int):
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def dump(self, path: str) -> None:
+        self._profile.dump_stats(path)
+
+COLLECTORS = {'sampling': SamplingCollector, 'cprofile': CProfileCollector}
+
+class ProfileRing:
+    """
+    Anillo acotado de perfiles en disco: al superar max_files se borran los más viejos.
+
+    Attributes:
+        directory (str): Directorio de los perfiles
+        max_files (int): Cantidad máxima de perfiles guardados
+    """
+    NAME_PATTERN = re.compile(r'^\d+-[A-Z]+-[\w.-]*-\d+ms\.(collapsed|pstats)$')
+
+    def __init__(self, directory: str = PROFILE_DIR, max_files: int = PROFILE_MAX_FILES):
+        self.directory = directory
+        self.max_files = max_files
+        self._lock = threading.Lock()
+
+    def new_path(self, method: str, path: str, duration_ms: float, extension: str) -> str:
+        """Arma la ruta de un perfil nuevo a partir de la request."""
+        slug = re.sub(r'[^\w.-]+', '_', path.strip('/')) or 'root'
+        name = f'{time.time_ns() // 1000}-{method}-{slug[:80]}-{int(duration_ms)}ms.{extension}'
+        return os.path.join(self.directory, name)
+
+    def save(self, collector, method: str, path: str, duration_ms: float, extension: str) -> str:
+        """
+        Guarda un perfil y descarta los más viejos si se supera el máximo.
+
+        Returns:
+            str: Identificador (nombre de archivo) del perfil guardado
+        """
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            profile_path = self.new_path(method, path, duration_ms, extension)
+            collector.dump(profile_path)
+            for old in self.list()[self.max_files:]:
+                os.remove(os.path.join(self.directory, old['id']))
+        return os.path.basename(profile_path)
+
+    def list(self) -> List[Dict]:
+        """
+        Lista los perfiles guardados, del más reciente al más viejo.
+
+        Returns:
+            List[Dict]: id, formato, tamaño y fecha de cada perfil
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if not self.NAME_PATTERN.match(name):
+                continue
+            stat = os.stat(os.path.join(self.directory, name))
+            profiles.append({
+                "id": name,
+                "formato": name.rsplit('.', 1)[1],
+                "bytes": stat.st_size,
+                "creado": int(name.split('-', 1)[0]) / 1e6
+            })
+        return sorted(profiles, key=lambda profile: profile['creado'], reverse=True)
+
+    def path_for(self, profile_id: str) -> Optional[str]:
+        """Ruta de un perfil existente, o None si el identificador no es válido."""
+        if not self.NAME_PATTERN.match(profile_id):
+            return None
+        profile_path = os.path.join(self.directory, profile_id)
+        return profile_path if os.path.isfile(profile_path) else None
+
+profile_ring = ProfileRing()
+_active_cprofile = threading.Lock() #cProfile admite un solo perfilador activo a la vez
+
+def is_admin_token(token: Optional[str]) -> bool:
+    """Verifica un token contra ADMIN_TOKEN en tiempo constante."""
+    return bool(ADMIN_TOKEN) and token is not None and hmac.compare_digest(token, ADMIN_TOKEN)
+
+def gevent_patched() -> bool:
+    """Si gevent reemplazó el módulo threading (worker 'gevent' de gunicorn.conf.py)."""
+    monkey = sys.modules.get('gevent.monkey')
+    return monkey is not None and monkey.is_module_patched('threading')
+
+def register_profiler(app: Flask) -> None:
+    """
+    Registra los hooks de perfilado en la aplicación Flask.
+
+    Args:
+        app (Flask): Instancia de la aplicación Flask
+    """
+    mode = PROFILE_MODE if PROFILE_MODE in COLLECTORS else 'sampling'
+    if mode == 'sampling' and gevent_patched():
+        logger.warning("El perfilado por muestreo no funciona con gevent: se usa el modo 'cprofile'")
+        mode = 'cprofile'
+
+    @app.before_request
+    def start_profiling():
+        requested = is_admin_token(request.headers.get(PROFILE_HEADER))
+        if not requested and (PROFILE_SAMPLE_RATE <= 0 or random.random() >= PROFILE_SAMPLE_RATE):
+            return
+        if mode == 'cprofile' and not _active_cprofile.acquire(blocking=False):
+            return
+        collector = COLLECTORS[mode](threading.get_ident())
+        collector.start()
+        g.profiler = (collector, time.perf_counter())
+
+    def finish_profile(collector, start: float, method: str, path: str) -> Optional[str]:
+        """Detiene el perfilador y guarda el perfil; devuelve su identificador."""
+        collector.stop()
+        if mode == 'cprofile':
+            _active_cprofile.release()
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        try:
+            profile_id = profile_ring.save(collector, method, path, duration_ms, PROFILE_EXTENSIONS[mode])
+            logger.info(f'Perfil guardado para {method} {path}: {profile_id}')
+            return profile_id
+        except OSError as e:
+            logger.error(f'No se pudo guardar el perfil: {str(e)}')
+            return None
+
+    @app.after_request
+    def stop_profiling(response):
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return response
+        collector, start = profiler
+        if response.is_streamed:
+            # El cuerpo se genera al enviarlo: se perfila hasta que el servidor cierra la respuesta
+            method, path = request.method, request.path
+            response.call_on_close(lambda: finish_profile(collector, start, method, path))
+            return response
+
+        profile_id = finish_profile(collector, start, request.method, request.path)
+        if profile_id is not None:
+            response.headers['X-Pokedex-Profile-Id'] = profile_id
+        return response
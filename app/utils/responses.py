@@ -104,6 +104,72 @@ def get_pokedex_instructions() -> Dict[str, Union[str, list]]:
                 "descripción": "¿Curiosidad? Te digo cuál es el Pokemon con el nombre más largo de un tipo específico.",
                 "ejemplo": "/pokedex/longest/water",
                 "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/query",
+                "descripción": "¿Buscás algo puntual? Filtrá por tipo y stats, ordená y quedate con los mejores.",
+                "ejemplo": "/pokedex/query?type=water&sort=velocidad&limit=10",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/<nombre>/similar",
+                "descripción": "¿Te gusta cómo juega un Pokemon? Te muestro otros con stats parecidos.",
+                "ejemplo": "/pokedex/garchomp/similar?k=5&type=dragon",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/team/coverage",
+                "descripción": "¿Armando tu equipo? Te muestro sus debilidades, resistencias y cobertura (hasta 6 Pokemon).",
+                "ejemplo": "/pokedex/team/coverage?team=garchomp,rotom-wash,ferrothorn",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/<nombre>/evolutions",
+                "descripción": "¿En qué evoluciona? Te muestro toda su línea evolutiva.",
+                "ejemplo": "/pokedex/eevee/evolutions",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/abilities/<habilidad>",
+                "descripción": "¿Buscás una habilidad? Te digo qué Pokemon la tienen (podés filtrar por tipo).",
+                "ejemplo": "/pokedex/abilities/levitate?type=ghost",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/<nombre>/sprite",
+                "descripción": "¿Querés verlo? Te muestro su sprite (podés elegir la variante, ej: front_shiny).",
+                "ejemplo": "/pokedex/pikachu/sprite?variant=front_shiny",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/types/<tipo>/members",
+                "descripción": "¿Querés ver a todos los de un tipo? Te los muestro de a páginas (por número o largo del nombre).",
+                "ejemplo": "/pokedex/types/dragon/members?limit=20&sort=name_length&order=desc",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/types/<tipo>/stats",
+                "descripción": "¿Qué tan fuerte es un tipo? Te muestro el promedio, mínimo y máximo de cada stat.",
+                "ejemplo": "/pokedex/types/dragon/stats",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/types/<tipo>/leaderboard",
+                "descripción": "¿Quién es el mejor de su tipo? Te muestro el ranking de un stat.",
+                "ejemplo": "/pokedex/types/fire/leaderboard?stat=hp&k=5",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/leaderboards/<stat>",
+                "descripción": "¿Qué tipo tiene más velocidad? Te ordeno los tipos por el promedio de un stat.",
+                "ejemplo": "/pokedex/leaderboards/total",
+                "método": "GET"
+            },
+            {
+                "endpoint": "/pokedex/export",
+                "descripción": "¿Querés la Pokedex entera? Te la envío en NDJSON o CSV (podés filtrar por tipo y retomar con cursor).",
+                "ejemplo": "/pokedex/export?format=csv&type=fire",
+                "método": "GET"
             }
         ],
         "recordatorio": "Para usar todas estas funciones, es necesario que presentes tu ficha de entrenador! Podés buscarla en /obtener-ficha presentando tus credenciales.",
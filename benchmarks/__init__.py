@@ -0,0 +1,5 @@
+"""
+Benchmarks de la Pokedex API.
+Cada módulo se ejecuta como script desde la raíz del repositorio, por ejemplo:
+    python -m benchmarks.bench_similarity
+"""
@@ -0,0 +1,72 @@
+"""
+Benchmark de la construcción en bloque de columnas e índice invertido (app/services/bulk_build.py).
+Compara la construcción serial (build_columns + build_inverted_index, como la hacen
+PokedexStore y AbilityIndex) con build_bulk repartiendo los documentos entre 1, 2, 4 y 8
+procesos, con la duración de cada etapa, y verifica que el resultado sea idéntico.
+
+Con pocos documentos o pocos núcleos, el costo de crear el pool puede superar lo que se
+gana repartiendo: conviene correrlo con --size mayores a la Pokedex real.
+
+Uso:
+    python -m benchmarks.bench_index_build [--processes 1 2 4 8] [--size 1302] [--repeat 5]
+"""
+
+import argparse
+import os
+import statistics
+import time
+import numpy as np
+from app.services.ability_index import build_inverted_index
+from app.services.bulk_build import build_bulk
+from app.services.pokedex_store import build_columns
+from app.services.pokemon_service import trim_pokemon_document
+from benchmarks.fixtures import FULL_DEX_SIZE, load_documents
+
+def build_serial(documents):
+    """Construcción serial, en el proceso actual y sin pasar por build_bulk."""
+    trimmed = [trim_pokemon_document(data) for data in documents]
+    return build_columns(trimmed), build_inverted_index(trimmed)
+
+def same_result(serial, result) -> bool:
+    """Compara columnas y listas invertidas de las dos construcciones."""
+    columns, inverted = serial
+    if not all(np.array_equal(a, b) for a, b in zip(columns, result.columns)):
+        return False
+    for expected, merged in ((inverted.abilities, result.inverted.abilities), (inverted.types, result.inverted.types)):
+        if expected.keys() != merged.keys() or not all(np.array_equal(expected[key], merged[key]) for key in expected):
+            return False
+    return True
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--size', type=int, default=FULL_DEX_SIZE)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    documents = load_documents(args.size)
+    print(f'{len(documents)} Pokemon, {os.cpu_count()} CPUs, mediana de {args.repeat} corridas')
+
+    samples = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        serial = build_serial(documents)
+        samples.append((time.perf_counter() - start) * 1000)
+    baseline = statistics.median(samples)
+    print(f'{"serial":>12}: {baseline:8.1f} ms')
+
+    for processes in args.processes:
+        samples, stages = [], {}
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            result = build_bulk(documents, processes=processes)
+            samples.append((time.perf_counter() - start) * 1000)
+            for stage, elapsed in result.timings.items():
+                stages.setdefault(stage, []).append(elapsed)
+        total = statistics.median(samples)
+        detail = '  '.join(f'{stage}={statistics.median(values):.1f}' for stage, values in stages.items())
+        check = 'ok' if same_result(serial, result) else 'DISTINTO'
+        print(f'{processes:>3} procesos: {total:8.1f} ms  (x{baseline / total:.2f})  {detail}  [{check}]')
+
+if __name__ == '__main__':
+    main()
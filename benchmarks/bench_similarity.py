@@ -0,0 +1,53 @@
+"""
+Benchmark del índice de similitud (/pokedex/<nombre>/similar).
+Mide la latencia por consulta sobre la Pokedex completa, sin y con filtro de tipo.
+
+Uso:
+    python -m benchmarks.bench_similarity [--queries 2000] [--k 10]
+"""
+
+import argparse
+import random
+import time
+import numpy as np
+from app.services.pokemon_service import PokemonService
+from app.services.pokedex_store import PokedexStore, TYPE_NAMES
+from app.services.similarity_index import SimilarityIndex
+from app.services.snapshot_service import SnapshotService
+from benchmarks.fixtures import load_documents
+
+def percentiles_ms(samples):
+    """Devuelve p50/p95/p99 en milisegundos."""
+    return {p: float(np.percentile(samples, p)) * 1000 for p in (50, 95, 99)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    pokemon_service = PokemonService()
+    pokemon_service.cache_pokemon_documents(load_documents())
+    store = PokedexStore(pokemon_service, SnapshotService(path='/nonexistent'))
+    index = SimilarityIndex(store)
+
+    start = time.perf_counter()
+    index.nearest(next(iter(pokemon_service.pokemon_cache)), k=args.k)
+    print(f'Construcción del índice: {(time.perf_counter() - start) * 1000:.2f} ms '
+          f'({len(pokemon_service.pokemon_cache)} Pokemon)')
+
+    rng = random.Random(0)
+    names = list(pokemon_service.pokemon_cache)
+    for label, types in (('sin filtro', None), ('filtro de tipo', 'random')):
+        samples = []
+        for _ in range(args.queries):
+            name = rng.choice(names)
+            query_types = [rng.choice(TYPE_NAMES)] if types else None
+            start = time.perf_counter()
+            index.nearest(name, k=args.k, types=query_types)
+            samples.append(time.perf_counter() - start)
+        result = percentiles_ms(samples)
+        print(f'Consulta {label} (k={args.k}): p50={result[50]:.3f} ms  p95={result[95]:.3f} ms  p99={result[99]:.3f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Configuración del entorno para correr la API contra los stubs locales.
+Solo usa la biblioteca estándar: debe importarse antes que cualquier módulo de `app`,
+porque app.config.settings lee las variables de entorno al importarse.
+"""
+
+import os
+import socket
+import tempfile
+from typing import Dict, Optional
+
+def free_port() -> int:
+    """Reserva y libera un puerto TCP libre en localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+def configure_stub_environment(snapshot_path: Optional[str] = None) -> Dict[str, int]:
+    """
+    Elige puertos para los stubs y apunta la API a ellos mediante variables de entorno.
+
+    Args:
+        snapshot_path (str, optional): Snapshot que carga la API (default: ninguno)
+
+    Returns:
+        Dict[str, int]: Puertos elegidos para los stubs de PokeAPI y Okta
+    """
+    ports = {"pokeapi": free_port(), "okta": free_port()}
+    os.environ['POKEAPI_BASE_URL'] = f'http://127.0.0.1:{ports["pokeapi"]}/api/v2'
+    os.environ['OKTA_AUTH_SERVER_URL'] = f'http://127.0.0.1:{ports["okta"]}/oauth2/default'
+    os.environ.setdefault('OKTA_DOMAIN', 'stub.okta.local')
+    os.environ.setdefault('OKTA_CLIENT_ID', 'stub-client')
+    os.environ.setdefault('OKTA_CLIENT_SECRET', 'stub-secret')
+    os.environ['POKEDEX_SNAPSHOT_PATH'] = snapshot_path or os.path.join(tempfile.gettempdir(), 'pokedex-sin-snapshot.json')
+    return ports
@@ -0,0 +1,160 @@
+"""
+Datos de prueba para los benchmarks.
+Usa el snapshot local si existe (datos grabados de la PokeAPI); si no, genera
+documentos sintéticos con la misma estructura que devuelve la PokeAPI (recortada).
+"""
+
+import json
+import random
+from typing import Dict, List
+from app.services.pokedex_store import TYPE_NAMES
+from app.services.snapshot_service import SnapshotService, SNAPSHOT_VERSION
+
+POKEAPI_STAT_NAMES = ('hp', 'attack', 'defense', 'special-attack', 'special-defense', 'speed')
+ABILITY_NAMES = (
+    'levitate', 'overgrow', 'blaze', 'torrent', 'intimidate', 'pressure', 'swift-swim',
+    'static', 'sand-veil', 'rough-skin', 'cursed-body', 'synchronize', 'inner-focus'
+)
+FULL_DEX_SIZE = 1302
+
+def synthetic_pokemon_documents(size: int = FULL_DEX_SIZE, seed: int = 0) -> List[Dict]:
+    """
+    Genera documentos /pokemon/<x> sintéticos y deterministas.
+
+    Args:
+        size (int, optional): Cantidad de Pokemon. Default = FULL_DEX_SIZE.
+        seed (int, optional): Semilla del generador. Default = 0.
+
+    Returns:
+        List[Dict]: Documentos recortados
+    """
+    rng = random.Random(seed)
+    documents = []
+    for pokemon_id in range(1, size + 1):
+        name = f'pokemon-{pokemon_id}'
+        types = rng.sample(TYPE_NAMES, rng.choice((1, 2)))
+        species_id = pokemon_id if pokemon_id <= 1025 else rng.randint(1, 1025)
+        documents.append({
+            "id": pokemon_id,
+            "name": name,
+            "height": rng.randint(1, 200),
+            "weight": rng.randint(1, 9999),
+            "is_default": pokemon_id <= 1025,
+            "types": [
+                {"slot": slot, "type": {"name": type_name, "url": f"https://pokeapi.co/api/v2/type/{TYPE_NAMES.index(type_name) + 1}/"}}
+                for slot, type_name in enumerate(types, start=1)
+            ],
+            "abilities": [
+                {"ability": {"name": ability, "url": ""}, "is_hidden": slot == 3, "slot": slot}
+                for slot, ability in enumerate(rng.sample(ABILITY_NAMES, rng.choice((1, 2, 3))), start=1)
+            ],
+            "stats": [
+                {"base_stat": rng.randint(5, 200), "effort": 0, "stat": {"name": stat_name, "url": ""}}
+                for stat_name in POKEAPI_STAT_NAMES
+            ],
+            "species": {"name": f'species-{species_id}', "url": f"https://pokeapi.co/api/v2/pokemon-species/{species_id}/"},
+            "sprites": {"front_default": f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/{pokemon_id}.png"}
+        })
+    return documents
+
+def synthetic_type_documents(documents: List[Dict], seed: int = 0) -> List[Dict]:
+    """
+    Genera documentos /type/<t> sintéticos con relaciones de daño y miembros.
+
+    Args:
+        documents (List[Dict]): Documentos /pokemon/<x> de los que se toman los miembros
+        seed (int, optional): Semilla del generador. Default = 0.
+
+    Returns:
+        List[Dict]: Documentos recortados, uno por tipo
+    """
+    rng = random.Random(seed)
+    type_documents = []
+    for type_id, type_name in enumerate(TYPE_NAMES, start=1):
+        targets = rng.sample(TYPE_NAMES, 8)
+        type_documents.append({
+            "id": type_id,
+            "name": type_name,
+            "damage_relations": {
+                "double_damage_to": [{"name": t} for t in targets[:3]],
+                "half_damage_to": [{"name": t} for t in targets[3:7]],
+                "no_damage_to": [{"name": t} for t in targets[7:]]
+            },
+            "pokemon": [
+                {"pokemon": {"name": data['name']}}
+                for data in documents
+                if any(t['type']['name'] == type_name for t in data['types'])
+            ]
+        })
+    return type_documents
+
+def synthetic_evolution_chain_documents(species_count: int = 1025) -> List[Dict]:
+    """
+    Genera cadenas evolutivas sintéticas de tres etapas con especies consecutivas.
+
+    Args:
+        species_count (int, optional): Cantidad de especies. Default = 1025.
+
+    Returns:
+        List[Dict]: Documentos /evolution-chain/<id> recortados
+    """
+    def link(species_id: int, evolves_to: List[Dict], min_level: int = None) -> Dict:
+        return {
+            "species": {"name": f'species-{species_id}', "url": f"https://pokeapi.co/api/v2/pokemon-species/{species_id}/"},
+            "evolution_details": [{"trigger": "level-up", "min_level": min_level, "item": None}] if min_level else [],
+            "evolves_to": evolves_to
+        }
+
+    chains = []
+    for chain_id, first in enumerate(range(1, species_count + 1, 3), start=1):
+        stages = list(range(first, min(first + 3, species_count + 1)))
+        chain = None
+        for depth, species_id in reversed(list(enumerate(stages))):
+            chain = link(species_id, [chain] if chain else [], min_level=16 * depth or None)
+        chains.append({"id": chain_id, "chain": chain})
+    return chains
+
+def load_fixtures(path: str = None, size: int = FULL_DEX_SIZE) -> Dict:
+    """
+    Obtiene los datos completos para los stubs: un snapshot grabado o datos sintéticos.
+
+    Args:
+        path (str, optional): Ruta del snapshot (default: POKEDEX_SNAPSHOT_PATH)
+        size (int, optional): Cantidad de Pokemon sintéticos si no hay snapshot
+
+    Returns:
+        Dict: Secciones pokemon, types y evolution_chains con el formato del snapshot
+    """
+    snapshot = (SnapshotService(path) if path else SnapshotService()).load()
+    if snapshot.get('pokemon'):
+        return snapshot
+    documents = synthetic_pokemon_documents(size)
+    return {
+        "pokemon": documents,
+        "types": synthetic_type_documents(documents),
+        "evolution_chains": synthetic_evolution_chain_documents()
+    }
+
+def load_documents(size: int = FULL_DEX_SIZE) -> List[Dict]:
+    """
+    Obtiene los documentos para un benchmark: el snapshot local o documentos sintéticos.
+
+    Args:
+        size (int, optional): Cantidad de documentos sintéticos si no hay snapshot
+
+    Returns:
+        List[Dict]: Documentos /pokemon/<x> recortados
+    """
+    snapshot = SnapshotService().load()
+    return snapshot.get('pokemon') or synthetic_pokemon_documents(size)
+
+def write_fixture_snapshot(path: str, fixtures: Dict) -> None:
+    """
+    Guarda los datos de los stubs como snapshot, para que la API los precargue.
+
+    Args:
+        path (str): Ruta del snapshot
+        fixtures (Dict): Datos devueltos por load_fixtures
+    """
+    with open(path, 'w', encoding='utf-8') as snapshot_file:
+        json.dump({"version": SNAPSHOT_VERSION, "generado": None, **fixtures}, snapshot_file)
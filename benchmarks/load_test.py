@@ -0,0 +1,188 @@
+"""
+Prueba de carga de punta a punta de la Pokedex API contra stubs locales de PokeAPI y Okta.
+Inicia los stubs, levanta la API en un servidor WSGI multi-thread apuntando a ellos
+(o usa una API ya levantada con --target) y reporta throughput y p50/p95/p99 por ruta.
+
+Uso:
+    python -m benchmarks.load_test --duration 30 --concurrency 16
+    python -m benchmarks.load_test --error-rate 0.02 --pokeapi-latency lognormal:80,0.8
+    python -m benchmarks.load_test --target http://127.0.0.1:5000 --routes /pokedex/<name>
+"""
+
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple
+import numpy as np
+import requests
+from benchmarks.environment import configure_stub_environment
+
+# Debe ejecutarse antes de importar `app`: los settings leen el entorno al importarse
+STUB_PORTS = configure_stub_environment()
+
+from benchmarks.fixtures import load_fixtures
+from benchmarks.stub_servers import add_fault_arguments, start_stubs
+
+# Ejemplos de query string para las rutas que los necesitan
+ROUTE_QUERY_STRINGS: Dict[str, Callable[[random.Random, Dict], str]] = {
+    '/pokedex/query': lambda rng, f: f"?type={rng.choice(f['types'])}&sort=velocidad&limit=10",
+    '/pokedex/team/coverage': lambda rng, f: '?team=' + ','.join(rng.sample(f['names'], 6)),
+}
+
+# Valores de ejemplo para cada argumento de ruta
+ROUTE_ARGUMENTS: Dict[str, Callable[[random.Random, Dict], str]] = {
+    'name': lambda rng, f: rng.choice(f['names']),
+    'type': lambda rng, f: rng.choice(f['types']),
+    'ability': lambda rng, f: rng.choice(f['abilities']),
+}
+
+def percentiles_ms(samples: List[float]) -> Dict[str, float]:
+    """Devuelve p50/p95/p99 en milisegundos."""
+    values = np.percentile(samples, (50, 95, 99)) * 1000 if samples else (0.0, 0.0, 0.0)
+    return {"p50": float(values[0]), "p95": float(values[1]), "p99": float(values[2])}
+
+def start_app() -> Tuple[str, object]:
+    """
+    Levanta la API en un servidor WSGI multi-thread apuntando a los stubs.
+
+    Returns:
+        Tuple[str, object]: URL base de la API y servidor (para detenerlo)
+    """
+    from werkzeug.serving import make_server
+    from app import create_app
+
+    app = create_app()
+    logging.getLogger('pokedex').setLevel(logging.WARNING) #Evita que el log en debug domine la medición
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    server.socket.listen(1024)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f'http://127.0.0.1:{server.server_port}', server
+
+def discover_routes(selected: List[str]) -> List[Tuple[str, str]]:
+    """
+    Obtiene las rutas GET registradas en app/api/routes.
+
+    Args:
+        selected (List[str]): Rutas a incluir (vacío para todas)
+
+    Returns:
+        List[Tuple[str, str]]: (regla, método) de cada ruta a medir
+    """
+    from app.api.routes import register_routes
+    from flask import Flask
+
+    app = Flask('rutas')
+    register_routes(app)
+    routes = []
+    for rule in app.url_map.iter_rules():
+        if rule.endpoint == 'static' or rule.endpoint.startswith('admin.') or (selected and rule.rule not in selected):
+            continue
+        method = 'GET' if 'GET' in rule.methods else 'POST'
+        routes.append((rule.rule, method))
+    return sorted(routes)
+
+def build_url(rule: str, rng: random.Random, samples: Dict) -> str:
+    """Reemplaza los argumentos de una regla por valores de ejemplo."""
+    url = rule
+    for argument, generator in ROUTE_ARGUMENTS.items():
+        url = url.replace(f'<{argument}>', generator(rng, samples))
+    return url + ROUTE_QUERY_STRINGS.get(rule, lambda rng, f: '')(rng, samples)
+
+def run_load(target: str, routes: List[Tuple[str, str]], duration: float, concurrency: int, samples: Dict) -> Dict:
+    """
+    Ejecuta la carga: cada worker elige rutas al azar hasta que se cumple la duración.
+
+    Returns:
+        Dict: Resultados por ruta (requests, errores, throughput y percentiles)
+    """
+    token = requests.post(f'{target}/obtener-ficha', json={"username": "ash", "password": "pikachu"}, timeout=30).json()['access_token']
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        session = requests.Session()
+        session.headers['Authorization'] = f'Bearer {token}'
+        while time.perf_counter() < deadline:
+            rule, method = rng.choice(routes)
+            start = time.perf_counter()
+            try:
+                if method == 'POST':
+                    status = session.post(f'{target}{rule}', json={"username": "ash", "password": "pikachu"}, timeout=30).status_code
+                else:
+                    status = session.get(f'{target}{build_url(rule, rng, samples)}', timeout=30).status_code
+            except requests.exceptions.RequestException:
+                status = 0
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies[rule].append(elapsed)
+                statuses[rule][status] += 1
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    results = {}
+    for rule, _ in routes:
+        count = len(latencies[rule])
+        errors = sum(n for status, n in statuses[rule].items() if status == 0 or status >= 500)
+        results[rule] = {
+            "requests": count,
+            "errores": errors,
+            "rps": count / elapsed,
+            **percentiles_ms(latencies[rule]),
+            "status": dict(statuses[rule])
+        }
+    total = sum(result['requests'] for result in results.values())
+    return {"duracion": elapsed, "rps_total": total / elapsed, "rutas": results}
+
+def print_report(report: Dict) -> None:
+    """Imprime los resultados como tabla."""
+    print(f'\nDuración: {report["duracion"]:.1f} s  -  Throughput total: {report["rps_total"]:.1f} req/s\n')
+    print(f'{"ruta":45} {"reqs":>7} {"err":>5} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}')
+    for rule, result in report['rutas'].items():
+        print(f'{rule:45} {result["requests"]:7d} {result["errores"]:5d} {result["rps"]:8.1f} '
+              f'{result["p50"]:8.1f} {result["p95"]:8.1f} {result["p99"]:8.1f}')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--duration', type=float, default=20.0, help='Duración de la carga en segundos')
+    parser.add_argument('--concurrency', type=int, default=8, help='Cantidad de clientes concurrentes')
+    parser.add_argument('--routes', nargs='*', default=[], help='Reglas a medir (default: todas)')
+    parser.add_argument('--target', default=None, help='URL de una API ya levantada (no inicia la API)')
+    parser.add_argument('--output', default=None, help='Archivo JSON donde guardar los resultados')
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    samples = {
+        "names": [data['name'] for data in fixtures['pokemon']],
+        "types": [data['name'] for data in fixtures['types']],
+        "abilities": sorted({a['ability']['name'] for data in fixtures['pokemon'] for a in data['abilities']})
+    }
+
+    target = args.target
+    if target is None:
+        pokeapi, okta = start_stubs(args, STUB_PORTS['pokeapi'], STUB_PORTS['okta'])
+        target, _ = start_app()
+        print(f'Stubs: PokeAPI {pokeapi.url} - Okta {okta.url} - API {target}')
+
+    report = run_load(target, discover_routes(args.routes), args.duration, args.concurrency, samples)
+    report["configuracion"] = vars(args)
+    print_report(report)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
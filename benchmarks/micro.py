@@ -0,0 +1,229 @@
+"""
+Micro-benchmarks de las piezas que atraviesa cada request.
+Mide requires_auth, handle_api_errors, create_response, el armado de la ficha en
+PokemonService.get_pokemon_by_name, las llamadas al logger y una request completa con
+el test client de Flask, siempre con PokeAPI y Okta mockeados.
+
+Los resultados se comparan contra una línea base en JSON versionada en el repo
+(benchmarks/baselines/micro.json) y el script termina con código 1 si algún caso empeora
+más que el umbral configurado, o con código 2 si no hay línea base.
+
+Uso:
+    python -m benchmarks.micro --save-baseline          # Guarda la línea base
+    python -m benchmarks.micro                          # Compara contra la línea base
+    python -m benchmarks.micro --threshold 0.15 --cases create_response
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Callable, Dict, List
+from unittest import mock
+from benchmarks.environment import configure_stub_environment
+
+# Debe ejecutarse antes de importar `app`: los settings leen el entorno al importarse
+configure_stub_environment()
+
+from app import create_app
+from app.services.pokemon_service import PokemonService
+from app.utils.decorators import handle_api_errors, requires_auth
+from app.utils.logger import get_logger
+from app.utils.responses import create_response
+from benchmarks.fixtures import synthetic_pokemon_documents
+
+DEFAULT_BASELINE = os.path.join('benchmarks', 'baselines', 'micro.json')
+
+def measure(function: Callable[[], object], rounds: int = 7, min_round_time: float = 0.05) -> Dict[str, float]:
+    """
+    Mide una función: calibra la cantidad de llamadas por ronda y toma la mediana de las rondas.
+
+    Args:
+        function (Callable): Función sin argumentos a medir
+        rounds (int, optional): Cantidad de rondas. Default = 7.
+        min_round_time (float, optional): Duración mínima de cada ronda en segundos
+
+    Returns:
+        Dict[str, float]: Mediana y mínimo en microsegundos por llamada, y llamadas por ronda
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        if time.perf_counter() - start >= min_round_time:
+            break
+        loops *= 2
+
+    per_call = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(loops):
+            function()
+        per_call.append((time.perf_counter() - start) / loops * 1e6)
+    return {"mediana_us": statistics.median(per_call), "minimo_us": min(per_call), "llamadas": loops}
+
+class FakeResponse:
+    """Respuesta mínima de requests para mockear la PokeAPI y Okta."""
+
+    def __init__(self, payload: Dict, status_code: int = 200):
+        self._payload = payload
+        self.status_code = status_code
+
+    def json(self) -> Dict:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        pass
+
+def build_cases(app, document: Dict) -> Dict[str, Callable[[], object]]:
+    """
+    Arma los casos de benchmark.
+
+    Args:
+        app (Flask): Aplicación creada con create_app
+        document (Dict): Documento /pokemon/<x> usado como respuesta mockeada
+
+    Returns:
+        Dict[str, Callable]: Casos por nombre
+    """
+    logger = get_logger()
+    record = {"mensaje": "¡Atrapaste a Pikachu!", "pokemon": {
+        "nombre": document['name'], "tipos": ["electric"], "altura": "0.4 mt", "peso": "6.0 kg",
+        "número_pokedex": document['id'], "habilidades": ["static", "lightning rod"],
+        "stats": {"hp": 35, "ataque": 55, "defensa": 40, "ataque_especial": 50, "defensa_especial": 50, "velocidad": 90}
+    }}
+
+    @handle_api_errors
+    def wrapped_ok():
+        return None
+
+    @handle_api_errors
+    def wrapped_error():
+        raise ValueError('falla simulada')
+
+    @requires_auth
+    def protected():
+        return None
+
+    service = PokemonService()
+    upstream = FakeResponse(document)
+
+    def pokemon_by_name_uncached():
+        service.pokemon_cache.clear()
+        service._cache_aliases.clear()
+        return service.get_pokemon_by_name(document['name'])
+
+    service_warm = PokemonService()
+    service_warm.cache_pokemon_documents([document])
+    client = app.test_client()
+    headers = {'Authorization': 'Bearer token-de-benchmark'}
+    auth_context = app.test_request_context('/pokedex/pikachu', headers=headers)
+
+    def with_request_context(function):
+        def run():
+            with auth_context:
+                return function()
+        return run
+
+    def client_get_pokemon():
+        from app.api.routes import pokemon as pokemon_routes
+        pokemon_routes.pokemon_service.pokemon_cache.clear()
+        pokemon_routes.pokemon_service._cache_aliases.clear()
+        return client.get(f'/pokedex/{document["name"]}', headers=headers)
+
+    return {
+        "handle_api_errors_ok": wrapped_ok,
+        "handle_api_errors_excepcion": wrapped_error,
+        "requires_auth": with_request_context(protected),
+        "create_response": with_request_context(lambda: create_response(record)),
+        "get_pokemon_by_name_upstream": mock.patch.object(service, '_make_request', new=mock.Mock(return_value=upstream))(pokemon_by_name_uncached),
+        "get_pokemon_by_name_cache": lambda: service_warm.get_pokemon_by_name(document['name']),
+        "logger_debug_deshabilitado": lambda: logger.debug(f'Validando token: {document["name"]}...'),
+        "logger_info": lambda: logger.info(f'Buscando información del Pokemon: {document["name"]}'),
+        "request_pokedex_nombre": mock.patch.object(PokemonService, '_make_request', new=mock.Mock(return_value=upstream))(client_get_pokemon),
+    }
+
+def compare(results: Dict[str, Dict], baseline: Dict, threshold: float) -> List[str]:
+    """
+    Compara los resultados contra la línea base.
+
+    Returns:
+        List[str]: Casos que empeoraron más que el umbral
+    """
+    regressions = []
+    for case, result in results.items():
+        reference = baseline.get('casos', {}).get(case)
+        if reference is None:
+            continue
+        case_threshold = baseline.get('umbrales', {}).get(case, threshold)
+        if result['mediana_us'] > reference['mediana_us'] * (1 + case_threshold):
+            regressions.append(case)
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Archivo JSON con la línea base')
+    parser.add_argument('--save-baseline', action='store_true', help='Guarda los resultados como nueva línea base')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='Empeoramiento tolerado (default: el de la línea base o 0.25 = 25%%)')
+    parser.add_argument('--rounds', type=int, default=7)
+    parser.add_argument('--cases', nargs='*', default=[], help='Casos a ejecutar (default: todos)')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    # Logging como en producción: nivel INFO y solo archivo, para no medir la consola
+    logger = get_logger()
+    log_dir = tempfile.mkdtemp(prefix='pokedex-micro-')
+    file_handler = RotatingFileHandler(os.path.join(log_dir, 'pokedex.log'), maxBytes=10485760, backupCount=1)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(module)s - %(message)s'))
+    logger.handlers = [file_handler]
+    logger.setLevel(logging.INFO)
+
+    document = synthetic_pokemon_documents(25)[-1]
+    introspection = FakeResponse({"active": True})
+    with mock.patch('requests.Session.post', return_value=introspection):
+        cases = build_cases(app, document)
+        results = {}
+        for case, function in cases.items():
+            if args.cases and case not in args.cases:
+                continue
+            results[case] = measure(function, rounds=args.rounds)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    elif not args.save_baseline:
+        print(f'No hay línea base en {args.baseline}: usá --save-baseline para crearla.')
+        sys.exit(2)
+
+    print(f'{"caso":34} {"mediana µs":>12} {"mínimo µs":>12} {"base µs":>10} {"cambio":>8}')
+    for case, result in results.items():
+        reference = baseline.get('casos', {}).get(case, {}).get('mediana_us')
+        change = f'{(result["mediana_us"] / reference - 1) * 100:+7.1f}%' if reference else '       -'
+        print(f'{case:34} {result["mediana_us"]:12.2f} {result["minimo_us"]:12.2f} '
+              f'{reference or 0:10.2f} {change:>8}')
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as baseline_file:
+            json.dump({"umbral": args.threshold or baseline.get('umbral', 0.25), "umbrales": baseline.get('umbrales', {}), "casos": results},
+                      baseline_file, indent=2, ensure_ascii=False)
+        print(f'\nLínea base guardada en {args.baseline}')
+        return
+
+    regressions = compare(results, baseline, args.threshold or baseline.get('umbral', 0.25))
+    if regressions:
+        print(f'\nRegresiones por encima del umbral: {", ".join(regressions)}')
+        sys.exit(1)
+    print('\nSin regresiones.')
+
+if __name__ == '__main__':
+    main()
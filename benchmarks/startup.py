@@ -0,0 +1,164 @@
+"""
+Benchmark de arranque de la Pokedex API.
+Mide dos cosas, siempre contra los stubs locales de PokeAPI y Okta:
+    - Costo de importación por módulo (`python -X importtime -c "import app"`)
+    - Tiempo hasta la primera respuesta: desde que se lanza el proceso hasta el primer 200
+      en `/`, y la latencia de la primera y segunda consulta a /pokedex/query, con y sin
+      precarga (PRELOAD_POKEDEX) y con un worker creado por fork después de la precarga.
+
+Uso:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5 --top 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+from benchmarks.environment import configure_stub_environment, free_port
+
+# Debe ejecutarse antes de importar `app`: los settings leen el entorno al importarse
+STUB_PORTS = configure_stub_environment()
+
+import requests
+from benchmarks.fixtures import load_fixtures, write_fixture_snapshot
+from benchmarks.stub_servers import add_fault_arguments, start_stubs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Proceso servidor: crea la app y atiende con el servidor multi-thread de Werkzeug.
+# Con fork=True la app se crea en el padre y atiende un hijo, como un worker de gunicorn --preload.
+SERVE_SCRIPT = """
+import os, logging
+from werkzeug.serving import make_server
+from app import create_app
+app = create_app()
+logging.getLogger('pokedex').setLevel(logging.WARNING)
+if {fork} and os.fork() != 0:
+    os.wait()
+else:
+    make_server('127.0.0.1', {port}, app, threaded=True).serve_forever()
+"""
+
+SCENARIOS = {
+    "sin_precarga": {"PRELOAD_POKEDEX": "false", "fork": False},
+    "precarga": {"PRELOAD_POKEDEX": "true", "fork": False},
+    "precarga_fork": {"PRELOAD_POKEDEX": "true", "fork": True},
+}
+
+def child_environment(**overrides: str) -> Dict[str, str]:
+    """Entorno de los procesos hijos: el actual (apuntado a los stubs) más el repo en PYTHONPATH."""
+    return dict(os.environ, PYTHONPATH=REPO_ROOT, **overrides)
+
+def import_times(top: int) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Ejecuta `python -X importtime -c "import app"` y agrupa el tiempo propio de cada módulo.
+
+    Los módulos de la app se informan uno por uno; los de terceros y la biblioteca estándar
+    se agrupan por paquete raíz (ej: todo flask.* cuenta como 'flask').
+
+    Args:
+        top (int): Cantidad de entradas a informar
+
+    Returns:
+        Tuple: Tiempo total en ms y las entradas más costosas (nombre, ms)
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import app'],
+                            env=child_environment(PRELOAD_POKEDEX='false'), cwd=tempfile.gettempdir(),
+                            capture_output=True, text=True, check=True)
+    packages: Dict[str, float] = defaultdict(float)
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        packages[name if name.startswith('app') else name.split('.')[0]] += int(self_us) / 1000
+    ranking = sorted(packages.items(), key=lambda entry: entry[1], reverse=True)
+    return sum(packages.values()), ranking[:top]
+
+def time_to_first_response(scenario: Dict, token: str, timeout: float = 60.0) -> Dict[str, float]:
+    """
+    Lanza la API en un proceso nuevo y mide hasta la primera respuesta.
+
+    Returns:
+        Dict[str, float]: ms hasta el primer 200 en '/', y de la primera y segunda consulta pesada
+    """
+    port = free_port()
+    script = SERVE_SCRIPT.format(port=port, fork=scenario['fork'])
+    workdir = tempfile.mkdtemp(prefix='pokedex-startup-')
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, '-c', script], cwd=workdir, start_new_session=True,
+                               env=child_environment(PRELOAD_POKEDEX=scenario['PRELOAD_POKEDEX']),
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    session = requests.Session()
+    base_url = f'http://127.0.0.1:{port}'
+    try:
+        while True:
+            if time.perf_counter() - start > timeout or process.poll() is not None:
+                raise RuntimeError('La API no respondió a tiempo')
+            try:
+                if session.get(f'{base_url}/', timeout=1).status_code == 200:
+                    break
+            except requests.exceptions.ConnectionError:
+                time.sleep(0.005)
+        ready = time.perf_counter() - start
+
+        query = f'{base_url}/pokedex/query?type=fire&sort=velocidad&limit=5'
+        headers = {'Authorization': f'Bearer {token}'}
+        latencies = []
+        for _ in range(2):
+            request_start = time.perf_counter()
+            session.get(query, headers=headers, timeout=timeout).raise_for_status()
+            latencies.append(time.perf_counter() - request_start)
+    finally:
+        os.killpg(process.pid, 15)
+        process.wait()
+    return {"listo_ms": ready * 1000, "primera_consulta_ms": latencies[0] * 1000, "segunda_consulta_ms": latencies[1] * 1000}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='Arranques por escenario (se informa la mediana)')
+    parser.add_argument('--top', type=int, default=15, help='Módulos a mostrar del reporte de importación')
+    parser.add_argument('--output', default=None, help='Archivo JSON donde guardar los resultados')
+    add_fault_arguments(parser)
+    parser.set_defaults(pokeapi_latency='fixed:2', okta_latency='fixed:1')
+    args = parser.parse_args()
+
+    # Snapshot para la precarga, con los mismos datos que sirven los stubs
+    fixtures = load_fixtures(args.fixtures)
+    snapshot_path = os.path.join(tempfile.mkdtemp(prefix='pokedex-startup-'), 'snapshot.json')
+    write_fixture_snapshot(snapshot_path, fixtures)
+    os.environ['POKEDEX_SNAPSHOT_PATH'] = snapshot_path
+
+    pokeapi, okta = start_stubs(args, STUB_PORTS['pokeapi'], STUB_PORTS['okta'])
+    token = requests.post(f'{okta.url}/oauth2/default/v1/token', data={"username": "ash", "password": "pikachu"},
+                          timeout=10).json()['access_token']
+
+    total, modules = import_times(args.top)
+    print(f'\nImportación de `app`: {total:.1f} ms\n')
+    print(f'{"módulo o paquete":45} {"ms":>8}')
+    for name, elapsed in modules:
+        print(f'{name:45} {elapsed:8.1f}')
+
+    report = {"importacion_ms": total, "modulos": modules, "escenarios": {}}
+    print(f'\n{"escenario":16} {"listo ms":>10} {"1ª consulta ms":>15} {"2ª consulta ms":>15}')
+    for name, scenario in SCENARIOS.items():
+        runs = [time_to_first_response(scenario, token) for _ in range(args.repeat)]
+        result = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        report["escenarios"][name] = result
+        print(f'{name:16} {result["listo_ms"]:10.1f} {result["primera_consulta_ms"]:15.1f} {result["segunda_consulta_ms"]:15.1f}')
+
+    pokeapi.stop()
+    okta.stop()
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,295 @@
+"""
+Servidores locales que reemplazan a la PokeAPI y a Okta durante las pruebas de carga.
+Sirven los datos del snapshot (o sintéticos) e inyectan latencia, errores y timeouts
+configurables, para poder medir la API sin depender de pokeapi.co ni del tenant de Okta.
+
+Uso como proceso independiente:
+    python -m benchmarks.stub_servers --pokeapi-latency lognormal:40,0.5 --error-rate 0.01
+
+y luego iniciar la API con:
+    POKEAPI_BASE_URL=http://127.0.0.1:8081/api/v2 OKTA_AUTH_SERVER_URL=http://127.0.0.1:8082/oauth2/default python run.py
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from app.services.pokemon_service import id_from_url
+from benchmarks.fixtures import load_fixtures
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    Interpreta una distribución de latencia y devuelve un generador en segundos.
+
+    Formatos (en milisegundos):
+        fixed:MS
+        uniform:MIN,MAX
+        exponential:MEDIA
+        lognormal:MEDIANA,SIGMA
+
+    Raises:
+        ValueError: Si el formato es inválido
+    """
+    kind, _, params = spec.partition(':')
+    values = [float(value) for value in params.split(',') if value]
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'exponential' and len(values) == 1:
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000 if values[0] else 0.0
+    if kind == 'lognormal' and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1]) / 1000
+    raise ValueError(f"Distribución de latencia inválida: '{spec}'")
+
+class FaultProfile:
+    """
+    Perfil de fallas de un stub: latencia, tasa de errores y tasa de timeouts.
+
+    Attributes:
+        latency (str): Distribución de latencia (ver parse_latency)
+        error_rate (float): Proporción de respuestas 503
+        timeout_rate (float): Proporción de requests que no responden a tiempo
+        timeout_seconds (float): Demora de las requests que simulan un timeout
+    """
+
+    def __init__(self, latency: str = 'fixed:0', error_rate: float = 0.0, timeout_rate: float = 0.0,
+                 timeout_seconds: float = 15.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.timeout_rate = timeout_rate
+        self.timeout_seconds = timeout_seconds
+        self._sample_latency = parse_latency(latency)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def apply(self) -> Optional[int]:
+        """
+        Aplica el perfil a una request: duerme la latencia sorteada y decide si falla.
+
+        Returns:
+            Optional[int]: Código de error a devolver, o None si la request sigue normalmente
+        """
+        with self._lock:
+            roll = self._rng.random()
+            delay = self._sample_latency(self._rng)
+        if roll < self.timeout_rate:
+            time.sleep(self.timeout_seconds)
+            return 504
+        time.sleep(delay)
+        if roll < self.timeout_rate + self.error_rate:
+            return 503
+        return None
+
+Handler = Callable[[Dict, Dict], Tuple[int, Dict]]
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Servidor HTTP mínimo con rutas por expresión regular y un perfil de fallas.
+
+    Attributes:
+        routes (List[Tuple[str, re.Pattern, Handler]]): Método, patrón de path y handler
+        faults (FaultProfile): Perfil de fallas aplicado a cada request
+    """
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, port: int, faults: FaultProfile):
+        super().__init__(('127.0.0.1', port), _StubRequestHandler)
+        self.routes: List[Tuple[str, re.Pattern, Handler]] = []
+        self.faults = faults
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base del servidor."""
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+    def add_route(self, method: str, pattern: str, handler: Handler) -> None:
+        """Registra un handler para un método y un patrón de path."""
+        self.routes.append((method, re.compile(f'^{pattern}/?$'), handler))
+
+    def start(self) -> 'StubServer':
+        """Inicia el servidor en un thread en segundo plano."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Detiene el servidor."""
+        self.shutdown()
+        self.server_close()
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Despacha cada request al handler registrado en el StubServer."""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True #Headers y body van en escrituras separadas: sin esto, keep-alive suma ~40 ms
+
+    def _dispatch(self, method: str) -> None:
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        if method == 'POST':
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length).decode('utf-8')
+            params.update({key: values[-1] for key, values in parse_qs(body).items()})
+
+        status, payload = 404, {"detail": "Not found."}
+        for route_method, pattern, handler in self.server.routes:
+            match = pattern.match(parsed.path)
+            if route_method == method and match:
+                status = self.server.faults.apply() or 200
+                if status == 200:
+                    status, payload = handler(match.groupdict(), params)
+                else:
+                    payload = {"detail": "Stub fault injected."}
+                break
+
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def log_message(self, format, *args):
+        pass
+
+def create_pokeapi_stub(fixtures: Dict, faults: FaultProfile, port: int = 0) -> StubServer:
+    """
+    Crea un stub de la PokeAPI (/api/v2) con los datos de fixtures.
+
+    Args:
+        fixtures (Dict): Secciones pokemon, types y evolution_chains (formato del snapshot)
+        faults (FaultProfile): Perfil de fallas
+        port (int, optional): Puerto, 0 para uno libre
+
+    Returns:
+        StubServer: Servidor sin iniciar
+    """
+    server = StubServer(port, faults)
+    base = '/api/v2'
+    pokemon = {data['name']: data for data in fixtures['pokemon']}
+    pokemon.update({str(data['id']): data for data in fixtures['pokemon']})
+    types = {data['name']: data for data in fixtures.get('types', [])}
+    chains = {str(data['id']): data for data in fixtures.get('evolution_chains', [])}
+    chain_by_species = {}
+    for chain in chains.values():
+        pending = [chain['chain']]
+        while pending:
+            link = pending.pop()
+            chain_by_species[str(id_from_url(link['species']['url']))] = chain['id']
+            pending.extend(link['evolves_to'])
+
+    def listing(items: List[str], resource: str) -> Dict:
+        return {
+            "count": len(items),
+            "results": [{"name": name, "url": f'{server.url}{base}/{resource}/{name}/'} for name in items]
+        }
+
+    def lookup(table: Dict, key: str) -> Tuple[int, Dict]:
+        return (200, table[key]) if key in table else (404, {"detail": "Not found."})
+
+    server.add_route('GET', f'{base}/pokemon', lambda args, params: (200, listing(
+        [data['name'] for data in fixtures['pokemon']][:int(params.get('limit', 20))], 'pokemon')))
+    server.add_route('GET', f'{base}/pokemon/(?P<key>[^/]+)', lambda args, params: lookup(pokemon, args['key'].lower()))
+    server.add_route('GET', f'{base}/type', lambda args, params: (200, listing(list(types) + ['unknown', 'shadow'], 'type')))
+    server.add_route('GET', f'{base}/type/(?P<key>[^/]+)', lambda args, params: lookup(types, args['key'].lower()))
+    server.add_route('GET', f'{base}/pokemon-species/(?P<key>[^/]+)', lambda args, params: (
+        (200, {"id": int(args['key']), "evolution_chain": {"url": f"{server.url}{base}/evolution-chain/{chain_by_species[args['key']]}/"}})
+        if args['key'] in chain_by_species else (404, {"detail": "Not found."})))
+    server.add_route('GET', f'{base}/evolution-chain', lambda args, params: (200, listing(list(chains), 'evolution-chain')))
+    server.add_route('GET', f'{base}/evolution-chain/(?P<key>[^/]+)', lambda args, params: lookup(chains, args['key']))
+    return server
+
+def create_okta_stub(faults: FaultProfile, port: int = 0) -> StubServer:
+    """
+    Crea un stub del servidor de autorización de Okta (/oauth2/default).
+
+    Cualquier credencial es válida salvo el password 'invalid'. Los tokens emitidos
+    empiezan con 'stub-' y son los únicos que la introspección informa como activos.
+
+    Args:
+        faults (FaultProfile): Perfil de fallas
+        port (int, optional): Puerto, 0 para uno libre
+
+    Returns:
+        StubServer: Servidor sin iniciar
+    """
+    server = StubServer(port, faults)
+    counter = iter(range(1, 1 << 62))
+
+    def token(args: Dict, params: Dict) -> Tuple[int, Dict]:
+        if params.get('password') == 'invalid':
+            return 401, {"error": "invalid_grant"}
+        return 200, {"access_token": f"stub-{next(counter)}", "token_type": "Bearer", "expires_in": 3600}
+
+    def introspect(args: Dict, params: Dict) -> Tuple[int, Dict]:
+        return 200, {"active": params.get('token', '').startswith('stub-')}
+
+    server.add_route('POST', '/oauth2/default/v1/token', token)
+    server.add_route('POST', '/oauth2/default/v1/introspect', introspect)
+    return server
+
+def add_fault_arguments(parser: argparse.ArgumentParser) -> None:
+    """Agrega a un parser los argumentos del perfil de fallas de los stubs."""
+    parser.add_argument('--pokeapi-latency', default='lognormal:30,0.5', help='Distribución de latencia de la PokeAPI')
+    parser.add_argument('--okta-latency', default='lognormal:20,0.3', help='Distribución de latencia de Okta')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Proporción de respuestas 503')
+    parser.add_argument('--timeout-rate', type=float, default=0.0, help='Proporción de requests que exceden el timeout')
+    parser.add_argument('--timeout-seconds', type=float, default=15.0, help='Demora de los timeouts simulados')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--fixtures', default='data/pokedex_snapshot.json',
+                        help='Snapshot grabado que sirven los stubs (si no existe se usan datos sintéticos)')
+
+def start_stubs(args: argparse.Namespace, pokeapi_port: int = 0, okta_port: int = 0) -> Tuple[StubServer, StubServer]:
+    """
+    Inicia los stubs de PokeAPI y Okta con el perfil de fallas de los argumentos.
+
+    Returns:
+        Tuple[StubServer, StubServer]: Stubs de PokeAPI y Okta ya iniciados
+    """
+    pokeapi_faults = FaultProfile(args.pokeapi_latency, args.error_rate, args.timeout_rate, args.timeout_seconds, args.seed)
+    okta_faults = FaultProfile(args.okta_latency, args.error_rate, args.timeout_rate, args.timeout_seconds, args.seed + 1)
+    pokeapi = create_pokeapi_stub(load_fixtures(args.fixtures), pokeapi_faults, pokeapi_port).start()
+    okta = create_okta_stub(okta_faults, okta_port).start()
+    return pokeapi, okta
+
+def stub_environment(pokeapi: StubServer, okta: StubServer) -> Dict[str, str]:
+    """Variables de entorno que apuntan la API a los stubs."""
+    return {
+        "POKEAPI_BASE_URL": f'{pokeapi.url}/api/v2',
+        "OKTA_AUTH_SERVER_URL": f'{okta.url}/oauth2/default'
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pokeapi-port', type=int, default=8081)
+    parser.add_argument('--okta-port', type=int, default=8082)
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    pokeapi, okta = start_stubs(args, args.pokeapi_port, args.okta_port)
+    print('Stubs iniciados. Exportá estas variables antes de iniciar la API:')
+    for key, value in stub_environment(pokeapi, okta).items():
+        print(f'  export {key}={value}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pokeapi.stop()
+        okta.stop()
+
+if __name__ == '__main__':
+    main()
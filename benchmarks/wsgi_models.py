@@ -0,0 +1,111 @@
+"""
+Benchmark de los modelos de workers de gunicorn (sync, threaded y gevent).
+Levanta los stubs de PokeAPI y Okta, inicia la API con `gunicorn -c gunicorn.conf.py wsgi:app`
+una vez por modelo y ejecuta la misma carga de benchmarks.load_test contra cada uno.
+
+Uso:
+    python -m benchmarks.wsgi_models --duration 20 --concurrency 32
+    python -m benchmarks.wsgi_models --models threaded gevent --workers 4 --pokeapi-latency fixed:80
+"""
+
+# Importa primero load_test: configura el entorno de los stubs antes de que se importe `app`
+from benchmarks.load_test import STUB_PORTS, discover_routes, run_load
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict
+import requests
+from benchmarks.environment import free_port
+from benchmarks.fixtures import load_fixtures, write_fixture_snapshot
+from benchmarks.stub_servers import add_fault_arguments, start_stubs
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WORKER_MODELS = ('sync', 'threaded', 'gevent')
+
+def start_gunicorn(model: str, workers: int, threads: int, port: int, timeout: float = 60.0) -> subprocess.Popen:
+    """
+    Inicia gunicorn con un modelo de workers y espera a que responda.
+
+    Returns:
+        subprocess.Popen: Proceso master de gunicorn
+    """
+    env = dict(os.environ, WSGI_WORKER_MODEL=model, WSGI_WORKERS=str(workers), WSGI_THREADS=str(threads),
+               WSGI_BIND=f'127.0.0.1:{port}', PYTHONPATH=REPO_ROOT)
+    process = subprocess.Popen([sys.executable, '-m', 'gunicorn', '-c', os.path.join(REPO_ROOT, 'gunicorn.conf.py'), 'wsgi:app'],
+                               cwd=tempfile.mkdtemp(prefix='pokedex-wsgi-'), env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline and process.poll() is None:
+        try:
+            if requests.get(f'http://127.0.0.1:{port}/', timeout=1).status_code == 200:
+                return process
+        except requests.exceptions.ConnectionError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f'gunicorn ({model}) no respondió a tiempo')
+
+def stop_gunicorn(process: subprocess.Popen) -> None:
+    """Detiene gunicorn esperando a que terminen las requests en curso (SIGTERM)."""
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=60)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', nargs='*', default=list(WORKER_MODELS), choices=WORKER_MODELS)
+    parser.add_argument('--workers', type=int, default=2, help='Procesos de gunicorn por modelo')
+    parser.add_argument('--threads', type=int, default=8, help='Threads por proceso en el modelo threaded')
+    parser.add_argument('--duration', type=float, default=20.0, help='Duración de la carga por modelo en segundos')
+    parser.add_argument('--concurrency', type=int, default=16, help='Cantidad de clientes concurrentes')
+    parser.add_argument('--routes', nargs='*', default=[], help='Reglas a medir (default: todas)')
+    parser.add_argument('--output', default=None, help='Archivo JSON donde guardar los resultados')
+    add_fault_arguments(parser)
+    args = parser.parse_args()
+
+    # Los workers precargan el mismo snapshot que sirven los stubs
+    fixtures = load_fixtures(args.fixtures)
+    snapshot_path = os.path.join(tempfile.mkdtemp(prefix='pokedex-wsgi-'), 'snapshot.json')
+    write_fixture_snapshot(snapshot_path, fixtures)
+    os.environ['POKEDEX_SNAPSHOT_PATH'] = snapshot_path
+    samples = {
+        "names": [data['name'] for data in fixtures['pokemon']],
+        "types": [data['name'] for data in fixtures['types']],
+        "abilities": sorted({a['ability']['name'] for data in fixtures['pokemon'] for a in data['abilities']})
+    }
+
+    pokeapi, okta = start_stubs(args, STUB_PORTS['pokeapi'], STUB_PORTS['okta'])
+    routes = discover_routes(args.routes)
+    results: Dict[str, Dict] = {}
+    for model in args.models:
+        port = free_port()
+        process = start_gunicorn(model, args.workers, args.threads, port)
+        try:
+            report = run_load(f'http://127.0.0.1:{port}', routes, args.duration, args.concurrency, samples)
+        finally:
+            stop_gunicorn(process)
+        active = [result for result in report['rutas'].values() if result['requests']]
+        results[model] = {
+            "rps_total": report['rps_total'],
+            "errores": sum(result['errores'] for result in active),
+            "p50_max": max(result['p50'] for result in active),
+            "p99_max": max(result['p99'] for result in active),
+            "rutas": report['rutas']
+        }
+        print(f'{model}: {report["rps_total"]:.1f} req/s')
+
+    print(f'\n{"modelo":10} {"req/s":>8} {"errores":>8} {"peor p50 ms":>12} {"peor p99 ms":>12}')
+    for model, result in results.items():
+        print(f'{model:10} {result["rps_total"]:8.1f} {result["errores"]:8d} {result["p50_max"]:12.1f} {result["p99_max"]:12.1f}')
+
+    pokeapi.stop()
+    okta.stop()
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump({"configuracion": vars(args), "modelos": results}, output_file, indent=2, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
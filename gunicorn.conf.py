@@ -0,0 +1,64 @@
+"""
+Configuración de gunicorn para servir la Pokedex API en producción.
+
+Uso:
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+Todo se ajusta con variables de entorno (o en el .env):
+    WSGI_WORKER_MODEL   'sync' (procesos), 'threaded' (procesos con threads) o 'gevent'
+                        (green threads, conviene para las llamadas a PokeAPI y Okta). Default = threaded.
+    WSGI_WORKERS        Cantidad de procesos. Default = 2 * CPUs + 1 (1 * CPUs + 1 con gevent)
+    WSGI_THREADS        Threads por proceso en el modelo 'threaded'. Default = 8
+    WSGI_CONNECTIONS    Conexiones simultáneas por proceso en el modelo 'gevent'. Default = 256
+    WSGI_BIND           Dirección de escucha. Default = 0.0.0.0:5000
+    WSGI_BACKLOG        Conexiones pendientes en la cola del socket. Default = 2048
+    WSGI_KEEPALIVE      Segundos que se mantiene abierta una conexión ociosa. Default = 5
+    WSGI_TIMEOUT        Segundos sin respuesta antes de reiniciar un worker. Default = 30
+    WSGI_GRACEFUL_TIMEOUT  Segundos para terminar las requests en curso al reiniciar. Default = 30
+    WSGI_MAX_REQUESTS   Requests por worker antes de reciclarlo (0 = nunca). Default = 0
+    WSGI_ACCESSLOG      Archivo del access log de gunicorn ('-' = consola). Default = sin access log
+
+Reinicio sin cortes: `kill -HUP <pid del master>` levanta workers nuevos y deja que los
+viejos terminen sus requests dentro de WSGI_GRACEFUL_TIMEOUT. Como la app se precarga en
+el master (preload_app), HUP reutiliza el código ya cargado: para desplegar código nuevo
+usar `kill -USR2` (nuevo master) y luego `kill -QUIT` al master viejo.
+"""
+
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+load_dotenv()
+os.environ.setdefault('POKEDEX_DEBUG', 'false') #Sin modo debug ni logs DEBUG en producción
+
+WORKER_CLASSES = {'sync': 'sync', 'threaded': 'gthread', 'gevent': 'gevent'}
+
+worker_model = os.getenv('WSGI_WORKER_MODEL', 'threaded')
+if worker_model not in WORKER_CLASSES:
+    raise ValueError(f"WSGI_WORKER_MODEL debe ser uno de {', '.join(WORKER_CLASSES)}, no '{worker_model}'")
+
+if worker_model == 'gevent':
+    # Parchea sockets, locks y threads antes de que preload_app importe la app (requests, urllib3, threading)
+    from gevent import monkey
+    monkey.patch_all()
+
+cpus = multiprocessing.cpu_count()
+
+bind = os.getenv('WSGI_BIND', '0.0.0.0:5000')
+worker_class = WORKER_CLASSES[worker_model]
+workers = int(os.getenv('WSGI_WORKERS', cpus + 1 if worker_model == 'gevent' else 2 * cpus + 1))
+threads = int(os.getenv('WSGI_THREADS', '8')) if worker_model == 'threaded' else 1
+worker_connections = int(os.getenv('WSGI_CONNECTIONS', '256'))
+backlog = int(os.getenv('WSGI_BACKLOG', '2048'))
+keepalive = int(os.getenv('WSGI_KEEPALIVE', '5'))
+timeout = int(os.getenv('WSGI_TIMEOUT', '30'))
+graceful_timeout = int(os.getenv('WSGI_GRACEFUL_TIMEOUT', '30'))
+max_requests = int(os.getenv('WSGI_MAX_REQUESTS', '0'))
+max_requests_jitter = max_requests // 10
+
+# Crea la app (y precarga la Pokedex) en el master: los workers la heredan al hacer fork
+preload_app = True
+
+# Los logs de la app ya van a consola y archivo; gunicorn solo registra sus propios eventos
+accesslog = os.getenv('WSGI_ACCESSLOG') or None
+errorlog = '-'
@@ -0,0 +1,21 @@
+"""
+Fixtures compartidas de las pruebas.
+Usan documentos sintéticos (benchmarks/fixtures.py), nunca el snapshot local: los
+resultados no dependen de lo que haya en data/.
+"""
+
+import pytest
+from app.services.pokedex_store import PokedexStore
+from app.services.pokemon_service import PokemonService
+from app.services.snapshot_service import SnapshotService
+from benchmarks.fixtures import synthetic_pokemon_documents
+
+@pytest.fixture
+def pokemon_service():
+    service = PokemonService()
+    service.cache_pokemon_documents(synthetic_pokemon_documents(300))
+    return service
+
+@pytest.fixture
+def store(pokemon_service):
+    return PokedexStore(pokemon_service, SnapshotService(path='/nonexistent'))
@@ -0,0 +1,64 @@
+"""
+Pruebas del índice invertido de habilidades y tipos (AbilityIndex), comparado contra
+un recorrido directo de los documentos.
+"""
+
+import pytest
+from app.services.ability_index import AbilityIndex, normalize_ability
+
+@pytest.fixture
+def ability_index(store):
+    return AbilityIndex(store)
+
+def names_with(pokemon_service, predicate):
+    """Nombres de los documentos que cumplen el predicado, por número de Pokedex."""
+    documents = sorted(pokemon_service.pokemon_cache.values(), key=lambda data: data['id'])
+    return [data['name'] for data in documents if predicate(data)]
+
+def abilities_of(data):
+    return {ability['ability']['name'] for ability in data['abilities']}
+
+def types_of(data):
+    return {t['type']['name'] for t in data['types']}
+
+def test_all_and_any_modes(pokemon_service, ability_index):
+    both = ability_index.search(['levitate', 'pressure'])
+    either = ability_index.search(['levitate', 'pressure'], ability_mode='any')
+
+    assert [p['nombre'] for p in both['pokemon']] == names_with(pokemon_service, lambda data: {'levitate', 'pressure'} <= abilities_of(data))
+    assert [p['nombre'] for p in either['pokemon']] == names_with(pokemon_service, lambda data: {'levitate', 'pressure'} & abilities_of(data))
+    assert either['total'] == len(either['pokemon'])
+
+def test_type_pair_filter(pokemon_service, ability_index):
+    sample = next(data for data in pokemon_service.pokemon_cache.values() if len(data['types']) == 2)
+    pair, ability = types_of(sample), sample['abilities'][0]['ability']['name']
+
+    result = ability_index.search([ability], types=sorted(pair, reverse=True), fields=('nombre',)) #El orden no importa
+
+    expected = names_with(pokemon_service, lambda data: ability in abilities_of(data) and types_of(data) == pair)
+    assert result['pokemon'] == [{"nombre": name} for name in expected]
+
+def test_ability_names_are_normalized(ability_index):
+    assert normalize_ability(' Swift Swim ') == 'swift-swim'
+    assert ability_index.search(['Swift Swim']) == ability_index.search(['swift-swim'])
+
+def test_new_documents_are_indexed(pokemon_service, ability_index):
+    before = ability_index.search(['levitate'])['total']
+    document = dict(pokemon_service.get_pokemon_document('pokemon-1'), id=301, name='pokemon-301',
+                    abilities=[{"ability": {"name": 'levitate', "url": ""}, "is_hidden": False, "slot": 1}])
+    pokemon_service.cache_pokemon_documents([document])
+
+    result = ability_index.search(['levitate'])
+
+    assert result['total'] == before + 1
+    assert result['pokemon'][-1]['nombre'] == 'pokemon-301'
+
+def test_invalid_searches(ability_index):
+    with pytest.raises(KeyError):
+        ability_index.search(['wonder-guard'])
+    with pytest.raises(ValueError):
+        ability_index.search([])
+    with pytest.raises(ValueError):
+        ability_index.search(['levitate'], types=['fire', 'water', 'grass'])
+    with pytest.raises(ValueError):
+        ability_index.search(['levitate'], types=['shadow'])
@@ -0,0 +1,74 @@
+"""
+Pruebas de la cache de tokens y del registro de invalidaciones entre workers.
+"""
+
+import os
+import time
+import pytest
+from app.services.auth_service import TokenCache
+from app.utils.cache import InvalidationBus, matches
+
+def test_token_cache_is_disabled_by_default():
+    cache = TokenCache(ttl=0)
+    cache.put('abc', 3600)
+
+    assert not cache.get('abc')
+
+def test_token_cache_honours_ttl_and_expiry():
+    cache = TokenCache(ttl=60, max_entries=2)
+    cache.put('long', 3600)
+    cache.put('expired', 0) #Ya vencido: no se recuerda
+    cache.put('short', 0.01)
+
+    assert cache.get('long')
+    assert not cache.get('expired')
+    time.sleep(0.02)
+    assert not cache.get('short')
+
+def test_token_cache_is_bounded():
+    cache = TokenCache(ttl=60, max_entries=2)
+    for token in ('a', 'b', 'c'):
+        cache.put(token, 3600)
+
+    assert not cache.get('a')
+    assert cache.get('b') and cache.get('c')
+
+@pytest.mark.parametrize('pattern, key, expected', [
+    ('pokemon/pikachu', 'pokemon/pikachu', True),
+    ('pokemon/pika', 'pokemon/pikachu', False),
+    ('pokemon/*', 'pokemon/pikachu', True),
+    ('*', 'type/fire', True),
+    ('type/*', 'pokemon/pikachu', False)
+])
+def test_invalidation_patterns(pattern, key, expected):
+    assert matches(pattern, key) is expected
+
+def test_bus_delivers_each_pattern_once():
+    bus = InvalidationBus(slots=4)
+    bus.publish('pokemon/pikachu')
+    bus.publish('type/*')
+
+    assert bus.poll() == ['pokemon/pikachu', 'type/*']
+    assert bus.poll() == []
+
+def test_bus_flushes_everything_when_behind():
+    bus = InvalidationBus(slots=4)
+    for i in range(5):
+        bus.publish(f'pokemon/pokemon-{i}')
+
+    assert bus.poll() == ['*']
+
+def test_bus_rejects_long_patterns():
+    with pytest.raises(ValueError):
+        InvalidationBus().publish('pokemon/' + 'x' * 300)
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Necesita fork')
+def test_bus_is_shared_with_forked_workers():
+    bus = InvalidationBus()
+    pid = os.fork()
+    if pid == 0: #Worker
+        bus.publish('pokemon/pikachu')
+        os._exit(0)
+    os.waitpid(pid, 0)
+
+    assert bus.poll() == ['pokemon/pikachu']
@@ -0,0 +1,110 @@
+"""
+Pruebas del control de admisión: límite adaptativo (AIMD), descarte con 503 y
+deadline de las requests (504).
+"""
+
+import pytest
+from unittest import mock
+from flask import Flask, Response
+from app.services.auth_service import AuthService
+from app.utils import admission
+from app.utils.admission import AdaptiveLimiter, DeadlineExceeded, register_admission_control, request_timeout
+from app.utils.decorators import handle_api_errors, requires_auth
+
+@pytest.fixture
+def limiter(monkeypatch):
+    limiter = AdaptiveLimiter('upstream', 1)
+    monkeypatch.setitem(admission.limiters, 'upstream', limiter) #Clase de los endpoints no listados
+    monkeypatch.setattr(admission, 'ADMISSION_CONTROL', True)
+    monkeypatch.setattr(admission, 'ADMISSION_QUEUE_TIMEOUT', 0.01)
+    return limiter
+
+@pytest.fixture
+def client(limiter):
+    app = Flask(__name__)
+    register_admission_control(app)
+
+    @app.route('/upstream')
+    def upstream():
+        return {"timeout": request_timeout(10)}
+
+    @app.route('/pokemon')
+    @requires_auth
+    @handle_api_errors
+    def pokemon():
+        raise DeadlineExceeded('Se agotó el tiempo disponible para la request')
+
+    @app.route('/stream')
+    def stream():
+        return Response(iter([b'a', b'b']), mimetype='text/plain')
+
+    return app.test_client()
+
+def test_limiter_sheds_when_full():
+    limiter = AdaptiveLimiter('local', 2)
+    assert limiter.acquire(0) and limiter.acquire(0)
+
+    assert not limiter.acquire(0.01)
+    assert limiter.stats()['descartadas'] == 1
+    limiter.release(0.001)
+    assert limiter.acquire(0)
+
+def test_limiter_adapts_to_latency():
+    limiter = AdaptiveLimiter('local', 10, min_limit=2)
+    for _ in range(3):
+        limiter.acquire(0)
+    limiter.release(0.001)
+    limiter.release(0.001)
+    assert limiter.limit == 10 #No supera el máximo
+
+    limiter.release(1.0) #Muy por encima de la referencia: reducción multiplicativa
+    assert limiter.limit == pytest.approx(9)
+    assert limiter.baseline < 0.02
+
+def test_unsampled_release_only_frees_the_slot():
+    limiter = AdaptiveLimiter('cached', 4)
+    limiter.acquire(0)
+    limiter.release(5.0, sample=False)
+
+    assert limiter.inflight == 0
+    assert limiter.baseline is None
+    assert limiter.limit == 4
+
+def test_full_class_answers_503(client, limiter):
+    assert limiter.acquire(0) #Ocupa el único lugar
+
+    response = client.get('/upstream')
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert limiter.shed == 1
+    limiter.release(0.001)
+    assert client.get('/upstream').status_code == 200
+    assert limiter.inflight == 0
+
+def test_exhausted_deadline_answers_504(client, monkeypatch):
+    monkeypatch.setattr(admission, 'REQUEST_DEADLINE', -1)
+
+    response = client.get('/upstream')
+
+    assert response.status_code == 504
+    assert 'Retry-After' in response.headers
+
+def test_deadline_is_not_swallowed_by_route_decorators(client):
+    with mock.patch.object(AuthService, 'validate_token', return_value=True):
+        response = client.get('/pokemon', headers={'Authorization': 'Bearer abc'})
+
+    assert response.status_code == 504 #No 500 (handle_api_errors) ni 401 (requires_auth)
+
+def test_request_timeout_is_capped_by_the_deadline(client, monkeypatch):
+    monkeypatch.setattr(admission, 'REQUEST_DEADLINE', 2)
+
+    assert 0 < client.get('/upstream').get_json()['timeout'] <= 2
+
+def test_streamed_response_holds_its_slot_until_closed(client, limiter):
+    response = client.get('/stream', buffered=False)
+    assert limiter.inflight == 1
+
+    assert b''.join(response.response) == b'ab'
+    response.close()
+    assert limiter.inflight == 0
@@ -0,0 +1,44 @@
+"""
+Pruebas de la construcción en bloque de columnas e índice invertido (build_bulk):
+el resultado tiene que ser idéntico al de la construcción serial.
+"""
+
+import random
+import numpy as np
+import pytest
+from app.services.ability_index import build_inverted_index
+from app.services.bulk_build import build_bulk
+from app.services.pokedex_store import build_columns
+from app.services.pokemon_service import trim_pokemon_document
+from benchmarks.fixtures import synthetic_pokemon_documents
+
+@pytest.fixture(scope='module')
+def documents():
+    documents = synthetic_pokemon_documents(300)
+    random.Random(1).shuffle(documents) #Las tandas no llegan ordenadas por número
+    return documents
+
+def assert_same_postings(expected, merged):
+    assert expected.keys() == merged.keys()
+    for key in expected:
+        np.testing.assert_array_equal(expected[key], merged[key])
+
+@pytest.mark.parametrize('processes', [1, 3])
+def test_bulk_build_matches_serial(documents, processes):
+    trimmed = [trim_pokemon_document(data) for data in documents]
+    columns, inverted = build_columns(trimmed), build_inverted_index(trimmed)
+
+    result = build_bulk(documents, processes=processes, version=7)
+
+    for expected, merged in zip(columns, result.columns):
+        np.testing.assert_array_equal(expected, merged)
+    assert_same_postings(inverted.abilities, result.inverted.abilities)
+    assert_same_postings(inverted.types, result.inverted.types)
+    assert result.inverted.version == 7
+    assert set(result.timings) >= {'proyeccion', 'fusion'}
+
+def test_empty_input():
+    result = build_bulk([], processes=2)
+
+    assert len(result.columns.ids) == 0
+    assert result.inverted.abilities == {}
@@ -0,0 +1,68 @@
+"""
+Pruebas de la invalidación de caches (POST /admin/caches/invalidate): los documentos
+invalidados se siguen usando hasta volver a descargarse, así los índices derivados nunca
+quedan vacíos.
+"""
+
+from unittest import mock
+import requests
+from app.services.ability_index import AbilityIndex, normalize_ability
+from app.services.pokemon_service import PokemonService
+from app.services.refresh_service import RefreshService
+
+def upstream_returning(document):
+    response = mock.Mock()
+    response.json.return_value = document
+    return mock.patch.object(PokemonService, '_make_request', return_value=response)
+
+def test_full_flush_keeps_query_and_abilities(pokemon_service, store):
+    abilities = AbilityIndex(store)
+    ability = normalize_ability(pokemon_service.get_cached_documents()[0]['abilities'][0]['ability']['name'])
+    query_before = store.query(types=['fire'])
+    abilities_before = abilities.search([ability])
+    total = len(pokemon_service.pokemon_cache)
+
+    assert pokemon_service.invalidate_cache('*') == total
+
+    assert store.query(types=['fire']) == query_before
+    assert store.query()['indexados'] == total
+    assert abilities.search([ability]) == abilities_before
+
+def test_stale_document_is_refetched_into_indexes(pokemon_service, store):
+    updated = dict(pokemon_service.get_pokemon_document(5))
+    pokemon_service.invalidate_cache('pokemon/5')
+    updated['stats'] = [dict(stat, base_stat=255) for stat in updated['stats']]
+
+    with upstream_returning(updated):
+        assert pokemon_service.get_pokemon_document(updated['name'])['stats'][0]['base_stat'] == 255
+    assert not pokemon_service.stale_keys
+    assert store.query(sort='total', limit=1, fields=('nombre',))['pokemon'] == [{"nombre": updated['name']}]
+
+def test_stale_document_served_when_upstream_fails(pokemon_service, store):
+    name = pokemon_service.get_cached_documents()[0]['name']
+    total = len(pokemon_service.pokemon_cache)
+    pokemon_service.invalidate_cache(f'pokemon/{name}')
+
+    with mock.patch.object(PokemonService, '_make_request', side_effect=requests.exceptions.ConnectionError('caída')):
+        assert pokemon_service.get_pokemon_document(name) is pokemon_service.pokemon_cache[name]
+    assert f'pokemon/{name}' in pokemon_service.stale_keys
+    assert store.query()['indexados'] == total
+
+def test_refresh_pass_refetches_stale_documents(pokemon_service, store):
+    documents = {document['name']: document for document in pokemon_service.get_cached_documents()}
+    stale = sorted(documents)[:3]
+    for name in stale:
+        pokemon_service.invalidate_cache(f'pokemon/{name}')
+
+    def fetch(url):
+        response = mock.Mock()
+        response.json.return_value = documents[url.rsplit('/', 1)[-1]]
+        return response
+
+    refresh_service = RefreshService(store, concurrency=2, recheck_batch=0)
+    with mock.patch.object(PokemonService, 'get_pokemon_listing', return_value=list(documents)), \
+         mock.patch.object(PokemonService, 'get_pokemon_types', return_value={"tipos": []}), \
+         mock.patch.object(PokemonService, '_make_request', side_effect=fetch):
+        assert refresh_service.plan().recheck == stale
+        assert refresh_service.run()['actualizados'] == 0
+    assert not pokemon_service.stale_keys
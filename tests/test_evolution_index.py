@@ -0,0 +1,68 @@
+"""
+Pruebas del índice de evoluciones (EvolutionIndex): linaje, ramificaciones y
+reconstrucción cuando cambian las cadenas en cache.
+"""
+
+import pytest
+from unittest import mock
+from app.services.evolution_index import EvolutionIndex
+from benchmarks.fixtures import synthetic_evolution_chain_documents
+
+def link(species_id, evolves_to=(), min_level=None):
+    return {
+        "species": {"name": f'species-{species_id}', "url": f"https://pokeapi.co/api/v2/pokemon-species/{species_id}/"},
+        "evolution_details": [{"trigger": "level-up", "min_level": min_level, "item": None}] if min_level else [],
+        "evolves_to": list(evolves_to)
+    }
+
+@pytest.fixture
+def evolution_index(pokemon_service, store):
+    pokemon_service.cache_evolution_chain_documents(synthetic_evolution_chain_documents(300))
+    return EvolutionIndex(store)
+
+def test_lineage_of_middle_stage(evolution_index):
+    result = evolution_index.lineage('pokemon-2') #Cadena sintética 1 -> 2 -> 3
+
+    assert result['raiz'] == 'species-1'
+    assert result['especie'] == {
+        "especie": 'species-2', "id_especie": 2, "evoluciona_de": 'species-1',
+        "como": {"disparador": 'level-up', "nivel_minimo": 16, "objeto": None}
+    }
+    assert [a['especie'] for a in result['ancestros']] == ['species-1']
+    assert [d['especie'] for d in result['descendientes']] == ['species-3']
+    assert result['ramificaciones'] == []
+
+def test_branches_are_reported(pokemon_service, evolution_index):
+    branched = {"id": 500, "chain": link(1, [link(2, min_level=20), link(3, min_level=20)])}
+    pokemon_service.cache_evolution_chain_documents([branched])
+
+    result = evolution_index.lineage('pokemon-1')
+
+    assert [d['especie'] for d in result['descendientes']] == ['species-2', 'species-3']
+    assert result['ramificaciones'] == [{"especie": 'species-1', "evoluciones": ['species-2', 'species-3']}]
+
+def test_changed_chain_rebuilds_graph(pokemon_service, evolution_index):
+    assert len(evolution_index.lineage('pokemon-1')['descendientes']) == 2
+    truncated = {"id": 1, "chain": link(1, [link(2, min_level=16)])}
+    pokemon_service.cache_evolution_chain_documents([truncated])
+
+    result = evolution_index.lineage('pokemon-1')
+
+    assert [d['especie'] for d in result['descendientes']] == ['species-2']
+    assert evolution_index.get_graph().root[3] < 0 #species-3 ya no pertenece a ninguna cadena
+
+def test_unknown_species_fetches_its_chain(pokemon_service, store):
+    index = EvolutionIndex(store)
+    chain = {"id": 7, "chain": link(299, [link(300, min_level=30)])}
+    with mock.patch.object(pokemon_service, 'get_evolution_chain_id', return_value=7) as chain_id, \
+         mock.patch.object(pokemon_service, 'get_evolution_chain_document', return_value=chain):
+        result = index.lineage('pokemon-300')
+
+    chain_id.assert_called_once_with(300)
+    assert result['raiz'] == 'species-299'
+    assert [a['especie'] for a in result['ancestros']] == ['species-299']
+
+def test_unknown_pokemon_raises_key_error(pokemon_service, evolution_index):
+    with mock.patch.object(pokemon_service, 'get_pokemon_document', side_effect=ValueError('404')):
+        with pytest.raises(KeyError):
+            evolution_index.lineage('missingno')
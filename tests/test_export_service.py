@@ -0,0 +1,67 @@
+"""
+Pruebas de la exportación en streaming (ExportService): NDJSON, CSV y reanudación por cursor.
+"""
+
+import csv
+import io
+import json
+import pytest
+from app.services.export_service import ExportService
+from app.services.pokemon_service import build_pokemon_record
+
+DEFAULT_CSV_HEADER = ['número_pokedex', 'nombre', 'tipos', 'altura', 'peso', 'habilidades',
+                      'hp', 'ataque', 'defensa', 'ataque_especial', 'defensa_especial', 'velocidad']
+
+@pytest.fixture
+def export_service(store):
+    return ExportService(store, batch_size=50)
+
+def export(export_service, export_format='ndjson', fields=None, **selection):
+    documents = export_service.resolve(export_service.select(**selection))
+    chunks = list(export_service.stream(documents, export_format, fields))
+    return documents, chunks, b''.join(chunks).decode('utf-8')
+
+def test_ndjson_matches_pokemon_records(pokemon_service, export_service):
+    documents, chunks, body = export(export_service)
+
+    records = [json.loads(line) for line in body.splitlines()]
+    assert len(records) == len(documents) == len(pokemon_service.pokemon_cache)
+    assert records[0] == build_pokemon_record(pokemon_service.get_pokemon_document('pokemon-1'))
+    assert [record['número_pokedex'] for record in records] == sorted(record['número_pokedex'] for record in records)
+    assert len(chunks) == 6 #300 fichas en fragmentos de 50
+
+def test_cursor_limit_and_types(pokemon_service, export_service):
+    _, _, body = export(export_service, types=['fire'], cursor=100, limit=5, fields=('número_pokedex', 'tipos'))
+
+    records = [json.loads(line) for line in body.splitlines()]
+    expected = sorted((data for data in pokemon_service.pokemon_cache.values()
+                       if data['id'] > 100 and any(t['type']['name'] == 'fire' for t in data['types'])),
+                      key=lambda data: data['id'])[:5]
+    assert [record['número_pokedex'] for record in records] == [data['id'] for data in expected]
+    assert all(set(record) == {'número_pokedex', 'tipos'} and 'fire' in record['tipos'] for record in records)
+
+def test_csv_default_columns(pokemon_service, export_service):
+    _, _, body = export(export_service, 'csv', limit=3)
+
+    rows = list(csv.reader(io.StringIO(body)))
+    assert rows[0] == DEFAULT_CSV_HEADER
+    assert len(rows) == 4
+    record = build_pokemon_record(pokemon_service.get_pokemon_document('pokemon-1'))
+    assert rows[1] == [str(record['número_pokedex']), record['nombre'], '|'.join(record['tipos']), record['altura'],
+                       record['peso'], '|'.join(record['habilidades'])] + [str(value) for value in record['stats'].values()]
+
+def test_csv_column_order_ignores_fields_order(export_service):
+    _, _, body = export(export_service, 'csv', fields=('nombre', 'stats', 'número_pokedex'), limit=1)
+
+    header, row = list(csv.reader(io.StringIO(body)))
+    assert header == ['número_pokedex', 'nombre', 'hp', 'ataque', 'defensa', 'ataque_especial', 'defensa_especial', 'velocidad']
+    assert row[:2] == ['1', 'pokemon-1']
+
+def test_resolve_skips_documents_missing_from_the_cache(pokemon_service, export_service):
+    rows = export_service.select(limit=10)
+    pokemon_service.pokemon_cache = {name: data for name, data in pokemon_service.pokemon_cache.items() if name != 'pokemon-2'}
+
+    documents = export_service.resolve(rows)
+
+    assert len(documents) == 9
+    assert 'pokemon-2' not in [document['name'] for document in documents]
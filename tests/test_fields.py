@@ -0,0 +1,40 @@
+"""
+Pruebas de la selección de campos (parámetro `fields=`).
+"""
+
+import pytest
+from app.services.pokedex_store import ROW_FIELDS
+from app.services.pokemon_service import POKEMON_FIELDS, build_pokemon_record
+
+def test_parse_keeps_response_order():
+    assert POKEMON_FIELDS.parse('stats, nombre,tipos,nombre') == ('nombre', 'tipos', 'stats')
+    assert POKEMON_FIELDS.parse(None) is None
+    assert POKEMON_FIELDS.parse('') is None
+
+@pytest.mark.parametrize('value', ['nombre,color', ',', ' , '])
+def test_parse_rejects_unknown_or_empty(value):
+    with pytest.raises(ValueError):
+        POKEMON_FIELDS.parse(value)
+
+def test_projection_matches_full_record(pokemon_service):
+    document = pokemon_service.get_pokemon_document('pokemon-7')
+    full = build_pokemon_record(document)
+
+    projected = build_pokemon_record(document, POKEMON_FIELDS.parse('peso,nombre'))
+
+    assert projected == {"nombre": full['nombre'], "peso": full['peso']}
+    assert list(full) == list(POKEMON_FIELDS.default)
+    assert 'longitud_nombre' not in full
+    assert build_pokemon_record(document, ('longitud_nombre',)) == {"longitud_nombre": '9 caracteres'}
+
+def test_projectors_are_compiled_once():
+    fields = POKEMON_FIELDS.parse('nombre,tipos')
+    assert POKEMON_FIELDS.projector(fields) is POKEMON_FIELDS.projector(fields)
+    assert POKEMON_FIELDS.projector(None) is POKEMON_FIELDS.projector(POKEMON_FIELDS.default)
+
+def test_row_fields_match_document_fields(pokemon_service, store):
+    columns = store.get_columns()
+    row = list(columns.names).index('pokemon-7')
+    fields = ('nombre', 'número_pokedex', 'tipos', 'altura', 'peso', 'stats')
+
+    assert ROW_FIELDS.projector(fields)(columns, row) == build_pokemon_record(pokemon_service.get_pokemon_document('pokemon-7'), fields)
@@ -0,0 +1,101 @@
+"""
+Pruebas de los GETs con hedging a la PokeAPI (Hedger).
+"""
+
+import threading
+import time
+import pytest
+import requests
+from app.utils.hedging import HedgeBudget, Hedger, LatencyTracker
+
+class FakeResponse:
+    def __init__(self, attempt):
+        self.attempt = attempt
+        self.closed = threading.Event()
+
+    def close(self):
+        self.closed.set()
+
+class ScriptedHedger(Hedger):
+    """Hedger cuyas requests duran lo que indica `delays` (una entrada por intento)."""
+
+    def __init__(self, delays, **kwargs):
+        super().__init__(**kwargs)
+        self.delays = list(delays)
+        self.attempts = 0
+        self.responses = {}
+
+    def _fetch(self, url, timeout):
+        with self._lock:
+            attempt = self.attempts
+            self.attempts += 1
+        delay = self.delays[attempt] if attempt < len(self.delays) else 0
+        if isinstance(delay, Exception):
+            raise delay
+        time.sleep(delay)
+        response = FakeResponse(attempt)
+        self.responses[attempt] = response
+        return response
+
+def warm_up(hedger, samples=16):
+    """Registra latencias bajas para que el endpoint tenga p95 y el presupuesto tenga fichas."""
+    hedger.delays = [0] * samples + hedger.delays
+    for _ in range(samples):
+        hedger.get('https://pokeapi.test/pokemon/1', 1, 'pokemon/<x>')
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker(window=100, quantile=0.95, refresh=10)
+    for latency in range(1, 101):
+        tracker.add(latency / 1000)
+
+    assert tracker.count == 100
+    assert tracker.value == pytest.approx(0.096)
+
+def test_budget_limits_extra_requests():
+    budget = HedgeBudget(0.5, capacity=1)
+    assert not budget.spend()
+    budget.earn()
+    budget.earn()
+    budget.earn() #No acumula más que la capacidad
+    assert budget.spend()
+    assert not budget.spend()
+
+def test_no_hedge_without_samples():
+    hedger = ScriptedHedger([0.05], min_samples=16, min_delay=0.001)
+
+    response = hedger.get('https://pokeapi.test/pokemon/1', 1, 'pokemon/<x>')
+
+    assert response.attempt == 0
+    assert hedger.stats()['hedges'] == 0
+
+def test_slow_primary_is_hedged_and_loser_closed():
+    hedger = ScriptedHedger([0.5, 0], budget=1.0, min_samples=16, min_delay=0.01)
+    warm_up(hedger)
+
+    response = hedger.get('https://pokeapi.test/pokemon/1', 2, 'pokemon/<x>')
+
+    assert response.attempt == 17 #El hedge, no la primaria (intento 16)
+    stats = hedger.stats()
+    assert (stats['hedges'], stats['ganados']) == (1, 1)
+    deadline = time.monotonic() + 2
+    while 16 not in hedger.responses and time.monotonic() < deadline: #La primaria sigue en su thread
+        time.sleep(0.01)
+    assert hedger.responses[16].closed.wait(2)
+
+def test_hedge_needs_budget():
+    hedger = ScriptedHedger([0.05], budget=0.0, min_samples=16, min_delay=0.001)
+    warm_up(hedger)
+
+    response = hedger.get('https://pokeapi.test/pokemon/1', 1, 'pokemon/<x>')
+
+    assert response.attempt == 16
+    assert hedger.stats()['sin_presupuesto'] == 1
+
+def test_failure_and_timeout():
+    failing = ScriptedHedger([requests.exceptions.ConnectionError('sin red')])
+    with pytest.raises(requests.exceptions.ConnectionError):
+        failing.get('https://pokeapi.test/pokemon/1', 1, 'pokemon/<x>')
+
+    slow = ScriptedHedger([0.3])
+    with pytest.raises(requests.exceptions.Timeout):
+        slow.get('https://pokeapi.test/pokemon/1', 0.05, 'pokemon/<x>')
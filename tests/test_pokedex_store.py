@@ -0,0 +1,85 @@
+"""
+Pruebas del almacén columnar (PokedexStore): filtros, orden y top-k de /pokedex/query,
+comparados contra un recorrido directo de los documentos.
+"""
+
+import pytest
+from app.services.pokedex_store import STAT_NAMES, parse_query_args
+
+def reference(pokemon_service, predicate=lambda data: True):
+    """Documentos de la cache que cumplen el predicado, ordenados por número de Pokedex."""
+    return sorted((data for data in pokemon_service.pokemon_cache.values() if predicate(data)), key=lambda data: data['id'])
+
+def type_names(data):
+    return {t['type']['name'] for t in data['types']}
+
+def speed(data):
+    return data['stats'][STAT_NAMES.index('velocidad')]['base_stat']
+
+def test_type_filter_all_and_any(pokemon_service, store):
+    both = store.query(types=['water', 'ground'])
+    either = store.query(types=['water', 'ground'], type_mode='any')
+
+    expected_both = reference(pokemon_service, lambda data: {'water', 'ground'} <= type_names(data))
+    expected_either = reference(pokemon_service, lambda data: {'water', 'ground'} & type_names(data))
+    assert [p['nombre'] for p in both['pokemon']] == [data['name'] for data in expected_both]
+    assert [p['nombre'] for p in either['pokemon']] == [data['name'] for data in expected_either]
+    assert either['total'] == len(expected_either)
+    assert either['indexados'] == len(pokemon_service.pokemon_cache)
+
+def test_ranges_are_inclusive_and_in_api_units(pokemon_service, store):
+    result = store.query(ranges={'velocidad': (50, 100), 'peso': (None, 500)}) #peso en kg, el documento en hg
+
+    expected = reference(pokemon_service, lambda data: 50 <= speed(data) <= 100 and data['weight'] <= 5000)
+    assert [p['nombre'] for p in result['pokemon']] == [data['name'] for data in expected]
+
+@pytest.mark.parametrize('order', ['desc', 'asc'])
+def test_top_k_sort_breaks_ties_by_number(pokemon_service, store, order):
+    result = store.query(sort='velocidad', order=order, limit=25)
+
+    sign = -1 if order == 'desc' else 1
+    expected = sorted(reference(pokemon_service), key=lambda data: (sign * speed(data), data['id']))[:25]
+    assert [p['nombre'] for p in result['pokemon']] == [data['name'] for data in expected]
+    assert result['total'] == len(pokemon_service.pokemon_cache)
+
+def test_default_only_and_fields(pokemon_service, store):
+    form = dict(pokemon_service.get_pokemon_document('pokemon-1'), id=10001, name='pokemon-1-mega', is_default=False)
+    pokemon_service.cache_pokemon_documents([form])
+
+    everything = store.query(types=[], fields=('nombre',))
+    defaults = store.query(default_only=True, fields=('nombre',))
+
+    assert {"nombre": 'pokemon-1-mega'} in everything['pokemon']
+    assert {"nombre": 'pokemon-1-mega'} not in defaults['pokemon']
+    assert defaults['total'] == everything['total'] - 1
+
+def test_unknown_type_raises_value_error(store):
+    with pytest.raises(ValueError):
+        store.query(types=['shadow'])
+
+def test_parse_query_args():
+    parsed = parse_query_args({'type': 'fire,flying', 'min_velocidad': '90', 'max_velocidad': '120',
+                               'sort': 'total', 'order': 'asc', 'limit': '5', 'default_only': 'true'})
+
+    assert parsed == {
+        "types": ['fire', 'flying'],
+        "type_mode": 'all',
+        "ranges": {'velocidad': (90.0, 120.0)},
+        "sort": 'total',
+        "order": 'asc',
+        "limit": 5,
+        "default_only": True
+    }
+
+@pytest.mark.parametrize('args', [
+    {'type_mode': 'some'},
+    {'min_nombre': '3'},
+    {'min_velocidad': 'rápido'},
+    {'sort': 'nombre'},
+    {'order': 'up'},
+    {'limit': '0'},
+    {'limit': 'diez'}
+])
+def test_parse_query_args_rejects_invalid_values(args):
+    with pytest.raises(ValueError):
+        parse_query_args(args)
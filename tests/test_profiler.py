@@ -0,0 +1,46 @@
+"""
+Pruebas del perfilador a pedido: muestreo de la pila y anillo de perfiles en disco.
+"""
+
+import threading
+import time
+from app.utils.profiler import ProfileRing, SamplingCollector
+
+def busy_loop(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+def test_sampling_collector_records_collapsed_stacks(tmp_path):
+    collector = SamplingCollector(threading.get_ident())
+    collector.start()
+    busy_loop(0.05)
+    collector.stop()
+    collector.dump(tmp_path / 'profile.collapsed')
+
+    lines = (tmp_path / 'profile.collapsed').read_text(encoding='utf-8').splitlines()
+    assert lines
+    assert any('busy_loop (test_profiler.py:' in line for line in lines)
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+
+class FakeCollector:
+    def dump(self, path):
+        with open(path, 'w', encoding='utf-8') as profile_file:
+            profile_file.write('main 1\n')
+
+def test_ring_keeps_newest_profiles(tmp_path):
+    ring = ProfileRing(str(tmp_path), max_files=3)
+    saved = [ring.save(FakeCollector(), 'GET', f'/pokedex/pokemon-{i}', 12.5, 'collapsed') for i in range(5)]
+
+    assert [profile['id'] for profile in ring.list()] == saved[:1:-1]
+    assert ring.list()[0]['formato'] == 'collapsed'
+    assert ring.path_for(saved[-1]) == str(tmp_path / saved[-1])
+    assert ring.path_for(saved[0]) is None #Descartado por el anillo
+
+def test_ring_rejects_foreign_names(tmp_path):
+    ring = ProfileRing(str(tmp_path))
+    (tmp_path / 'notes.txt').write_text('x')
+
+    assert ring.list() == []
+    assert ring.path_for('notes.txt') is None
+    assert ring.path_for('../../etc/passwd') is None
@@ -0,0 +1,99 @@
+"""
+Pruebas de la actualización incremental (RefreshService) contra una PokeAPI simulada.
+"""
+
+import pytest
+import requests
+from unittest import mock
+from app.services.pokemon_service import PokemonService
+from app.services.refresh_service import RefreshService
+from benchmarks.fixtures import synthetic_evolution_chain_documents, synthetic_type_documents
+
+class FakePokeAPI:
+    """Responde las URLs de la PokeAPI con los documentos de `documents` ('pokemon/x' -> documento)."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.missing = [] #Pokemon listados cuyo documento responde 404
+        self.requested = []
+
+    def listing(self):
+        return sorted(key.split('/', 1)[1] for key in self.documents if key.startswith('pokemon/')) + self.missing
+
+    def __call__(self, url):
+        key = url.split('/api/v2/', 1)[1]
+        self.requested.append(key)
+        if key not in self.documents:
+            raise requests.exceptions.HTTPError(f'404 para {url}')
+        response = mock.Mock()
+        response.json.return_value = self.documents[key]
+        return response
+
+@pytest.fixture
+def pokeapi(pokemon_service):
+    pokemon = list(pokemon_service.pokemon_cache.values())
+    types = synthetic_type_documents(pokemon)
+    chains = synthetic_evolution_chain_documents(300)
+    pokemon_service.cache_type_documents(types)
+    pokemon_service.cache_evolution_chain_documents(chains)
+
+    documents = {f'pokemon/{data["name"]}': data for data in pokemon}
+    documents.update({f'type/{data["name"]}': data for data in types})
+    documents.update({f'evolution-chain/{data["id"]}': data for data in chains})
+    api = FakePokeAPI(documents)
+    with mock.patch.object(PokemonService, '_make_request', side_effect=api), \
+         mock.patch.object(PokemonService, 'get_pokemon_listing', side_effect=api.listing), \
+         mock.patch.object(PokemonService, 'get_pokemon_types', return_value={"tipos": [data['name'] for data in types]}):
+        yield api
+
+@pytest.fixture
+def refresh_service(store):
+    return RefreshService(store, concurrency=4, recheck_batch=0)
+
+def test_nothing_to_do(pokeapi, refresh_service):
+    summary = refresh_service.run()
+
+    assert {key: summary[key] for key in ('nuevos', 'actualizados', 'eliminados', 'tipos', 'cadenas')} == \
+        {"nuevos": 0, "actualizados": 0, "eliminados": 0, "tipos": 0, "cadenas": 0}
+    assert pokeapi.requested == []
+
+def test_new_changed_and_removed_pokemon(pokemon_service, pokeapi, refresh_service):
+    new = dict(pokeapi.documents['pokemon/pokemon-1'], id=301, name='pokemon-301')
+    pokeapi.documents['pokemon/pokemon-301'] = new
+    pokeapi.documents['pokemon/pokemon-2'] = dict(pokeapi.documents['pokemon/pokemon-2'], weight=1)
+    del pokeapi.documents['pokemon/pokemon-3']
+    pokemon_service.invalidate_cache('pokemon/pokemon-2')
+
+    summary = refresh_service.run()
+
+    assert (summary['nuevos'], summary['actualizados'], summary['eliminados']) == (1, 1, 1)
+    assert summary['fallidos'] == []
+    cache = pokemon_service.pokemon_cache
+    assert 'pokemon-301' in cache and 'pokemon-3' not in cache
+    assert cache['pokemon-2']['weight'] == 1
+    assert 'pokemon/pokemon-2' not in pokemon_service.stale_keys
+    assert summary['tipos'] > 0 #Cambiaron los miembros de los tipos afectados
+
+def test_failed_documents_are_skipped(pokemon_service, pokeapi, refresh_service):
+    pokeapi.documents['pokemon/pokemon-301'] = dict(pokeapi.documents['pokemon/pokemon-1'], id=301, name='pokemon-301')
+    pokeapi.documents['pokemon/pokemon-302'] = dict(pokeapi.documents['pokemon/pokemon-1'], id=302, name='pokemon-302')
+    pokeapi.missing.append('ghost')
+
+    summary = refresh_service.run()
+
+    assert summary['nuevos'] == 2
+    assert summary['fallidos'] == ['pokemon/ghost']
+    assert 'ghost' not in pokemon_service.pokemon_cache
+
+def test_stale_evolution_chain_is_refetched(pokemon_service, pokeapi, refresh_service):
+    chain = pokeapi.documents['evolution-chain/1']
+    pokeapi.documents['evolution-chain/1'] = dict(chain, chain=dict(chain['chain'], evolves_to=[]))
+    version = pokemon_service.evolution_chain_cache_version
+    pokemon_service.invalidate_cache('evolution-chain/1')
+
+    summary = refresh_service.run()
+
+    assert summary['cadenas'] == 1
+    assert pokemon_service.evolution_chain_cache[1]['chain']['evolves_to'] == []
+    assert pokemon_service.evolution_chain_cache_version > version
+    assert 'evolution-chain/1' not in pokemon_service.stale_keys
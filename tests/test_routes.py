@@ -0,0 +1,139 @@
+"""
+Pruebas de las rutas de la Pokedex con los servicios armados sobre los documentos sintéticos.
+"""
+
+import pytest
+import requests
+from unittest import mock
+from flask import Flask
+from app.api.errors.handlers import register_error_handlers
+from app.api.routes import pokemon as routes
+from app.services.auth_service import AuthService
+from app.services.export_service import ExportService
+from app.services.pokemon_service import PokemonService
+from app.services.sprite_cache import SpriteFile
+from app.services.type_chart import TypeChart
+from app.utils import admission
+from app.utils.admission import register_admission_control
+from benchmarks.fixtures import synthetic_type_documents
+
+HEADERS = {'Authorization': 'Bearer abc'}
+
+@pytest.fixture
+def client(monkeypatch, pokemon_service, store):
+    pokemon_service.cache_type_documents(synthetic_type_documents(list(pokemon_service.pokemon_cache.values())))
+    monkeypatch.setattr(routes, 'pokemon_service', pokemon_service)
+    monkeypatch.setattr(routes, 'pokedex_store', store)
+    monkeypatch.setattr(routes, 'type_chart', TypeChart(store))
+    monkeypatch.setattr(routes, 'export_service', ExportService(store, batch_size=50))
+    monkeypatch.setattr(admission, 'ADMISSION_CONTROL', False) #Los limitadores son globales del proceso
+    monkeypatch.setattr(AuthService, 'validate_token', lambda self, token: True)
+
+    app = Flask(__name__)
+    app.register_blueprint(routes.pokemon_bp)
+    register_error_handlers(app)
+    register_admission_control(app)
+    return app.test_client()
+
+@pytest.fixture
+def pokeapi_404():
+    with mock.patch.object(PokemonService, '_make_request', side_effect=requests.exceptions.HTTPError('404')):
+        yield
+
+def test_team_coverage(client):
+    response = client.get('/pokedex/team/coverage?team=pokemon-1,pokemon-2', headers=HEADERS)
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [member['nombre'] for member in body['equipo']] == ['pokemon-1', 'pokemon-2']
+    assert set(body['ofensiva']) == {'super_efectivo_contra', 'neutral_contra', 'sin_cobertura'}
+
+@pytest.mark.parametrize('query', ['', '?team=' + ','.join(['pokemon-1'] * 7)])
+def test_team_coverage_rejects_invalid_teams(client, query):
+    assert client.get(f'/pokedex/team/coverage{query}', headers=HEADERS).status_code == 400
+
+def test_team_coverage_unknown_member(client, pokeapi_404):
+    response = client.get('/pokedex/team/coverage?team=pokemon-1,missingno', headers=HEADERS)
+
+    assert response.status_code == 404
+    assert 'missingno' in response.get_json()['error']
+
+def test_team_coverage_without_known_types(client, pokemon_service):
+    pokemon_service.cache_pokemon_documents([dict(pokemon_service.get_pokemon_document('pokemon-1'), name='typeless', types=[])])
+
+    response = client.get('/pokedex/team/coverage?team=typeless', headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.get_json()['ofensiva']['super_efectivo_contra'] == []
+
+def test_get_pokemon_without_time_left_answers_504(client, monkeypatch):
+    monkeypatch.setattr(admission, 'REQUEST_DEADLINE', -1)
+
+    assert client.get('/pokedex/pokemon-1', headers=HEADERS).status_code == 200 #En cache: no necesita tiempo
+    response = client.get('/pokedex/missingno', headers=HEADERS)
+    assert response.status_code == 504
+    assert 'Retry-After' in response.headers
+
+def test_get_pokemon_unknown_answers_404(client, pokeapi_404):
+    assert client.get('/pokedex/missingno', headers=HEADERS).status_code == 404
+
+def test_export_ndjson_total_matches_body(client):
+    response = client.get('/pokedex/export?type=fire&limit=20', headers=HEADERS)
+
+    lines = response.data.decode('utf-8').splitlines()
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    assert int(response.headers['X-Pokedex-Export-Total']) == len(lines) > 0
+
+def test_export_total_skips_documents_gone_from_the_cache(client, pokemon_service, store):
+    store.get_columns()
+    pokemon_service.pokemon_cache = {name: data for name, data in pokemon_service.pokemon_cache.items() if name != 'pokemon-2'}
+
+    response = client.get('/pokedex/export?limit=5', headers=HEADERS)
+
+    assert response.headers['X-Pokedex-Export-Total'] == '4'
+    assert len(response.data.splitlines()) == 4
+
+def test_export_csv(client):
+    response = client.get('/pokedex/export?format=csv&limit=2&fields=nombre,número_pokedex', headers=HEADERS)
+
+    assert response.mimetype == 'text/csv'
+    assert response.data.decode('utf-8').splitlines() == ['número_pokedex,nombre', '1,pokemon-1', '2,pokemon-2']
+
+@pytest.mark.parametrize('query', ['format=xml', 'cursor=abc', 'limit=0', 'type=shadow', 'fields=color'])
+def test_export_rejects_invalid_parameters(client, query):
+    assert client.get(f'/pokedex/export?{query}', headers=HEADERS).status_code == 400
+
+class EvictingSpriteCache:
+    """Cache de sprites cuya primera imagen se descarta antes de enviarla (como lo haría evict())."""
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def get(self, url, timeout=10):
+        self.calls += 1
+        if self.calls == 1:
+            return SpriteFile(self.path + '.evicted', 'abc123', 'image/png')
+        return SpriteFile(self.path, 'abc123', 'image/png')
+
+def test_sprite_evicted_before_sending_is_fetched_again(client, monkeypatch, tmp_path):
+    sprite = tmp_path / 'sprite.png'
+    sprite.write_bytes(b'\x89PNG')
+    sprite_cache = EvictingSpriteCache(str(sprite))
+    monkeypatch.setattr(routes, 'sprite_cache', sprite_cache)
+
+    response = client.get('/pokedex/pokemon-1/sprite', headers=HEADERS)
+
+    assert response.status_code == 200
+    assert response.data == b'\x89PNG'
+    assert sprite_cache.calls == 2
+    response.close()
+
+def test_sprite_errors(client, monkeypatch):
+    failing = mock.Mock()
+    failing.get.side_effect = requests.exceptions.ConnectionError('sin red')
+    monkeypatch.setattr(routes, 'sprite_cache', failing)
+
+    assert client.get('/pokedex/pokemon-1/sprite', headers=HEADERS).status_code == 502
+    assert client.get('/pokedex/pokemon-1/sprite?variant=back_shiny', headers=HEADERS).status_code == 400
@@ -0,0 +1,54 @@
+"""
+Pruebas del índice de vecinos más cercanos (SimilarityIndex), comparado contra las
+distancias calculadas directamente sobre los stats normalizados.
+"""
+
+import numpy as np
+import pytest
+from unittest import mock
+from app.services.pokedex_store import TYPE_INDEX
+from app.services.similarity_index import SimilarityIndex
+
+@pytest.fixture
+def similarity(store):
+    return SimilarityIndex(store)
+
+def brute_force(store, name, predicate=lambda row: True):
+    """Distancias euclídeas sobre los stats en z-score, de menor a mayor (empates por fila)."""
+    columns = store.get_columns()
+    stats = columns.stats.astype(np.float64)
+    std = stats.std(axis=0)
+    std[std == 0] = 1
+    matrix = (stats - stats.mean(axis=0)) / std
+    row = list(columns.names).index(name)
+    distances = np.sqrt(((matrix - matrix[row]) ** 2).sum(axis=1))
+    candidates = [r for r in range(len(distances)) if r != row and predicate(r)]
+    return [str(columns.names[r]) for r in sorted(candidates, key=lambda r: (distances[r], r))]
+
+def test_nearest_matches_brute_force(store, similarity):
+    result = similarity.nearest('pokemon-42', k=8)
+
+    assert result['pokemon']['nombre'] == 'pokemon-42'
+    assert [p['nombre'] for p in result['similares']] == brute_force(store, 'pokemon-42')[:8]
+    distances = [p['distancia'] for p in result['similares']]
+    assert distances == sorted(distances)
+
+def test_type_filter_restricts_neighbours(store, similarity):
+    columns = store.get_columns()
+    water = 1 << TYPE_INDEX['water']
+
+    result = similarity.nearest('pokemon-42', k=5, types=['water'])
+
+    expected = brute_force(store, 'pokemon-42', lambda row: columns.type_mask[row] & water)[:5]
+    assert [p['nombre'] for p in result['similares']] == expected
+
+def test_k_is_capped_by_candidates(similarity):
+    result = similarity.nearest('pokemon-1', k=10_000, fields=('nombre',))
+
+    assert len(result['similares']) == 299
+    assert set(result['similares'][0]) == {'nombre', 'distancia'}
+
+def test_unknown_pokemon_raises_key_error(pokemon_service, similarity):
+    with mock.patch.object(pokemon_service, 'get_pokemon_document', side_effect=ValueError('404')):
+        with pytest.raises(KeyError):
+            similarity.nearest('missingno')
@@ -0,0 +1,107 @@
+"""
+Pruebas de la cache de sprites en disco (SpriteCache) con descargas simuladas.
+"""
+
+import os
+import pytest
+from unittest import mock
+from app.services import sprite_cache as sprite_module
+from app.services.sprite_cache import MAX_SPRITE_BYTES, SpriteCache
+
+class FakeResponse:
+    def __init__(self, content, content_type='image/png', content_length=None):
+        self.content = content
+        self.headers = {'Content-Type': content_type}
+        if content_length is not None:
+            self.headers['Content-Length'] = str(content_length)
+        self.chunks_read = 0
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.content), chunk_size):
+            self.chunks_read += 1
+            yield self.content[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = responses
+        self.requested = []
+
+    def get(self, url, timeout, stream=False):
+        assert stream #Las imágenes se leen por partes
+        self.requested.append(url)
+        return self.responses[url]
+
+@pytest.fixture
+def session():
+    session = FakeSession({})
+    with mock.patch.object(sprite_module, 'get_http_session', return_value=session):
+        yield session
+
+@pytest.fixture
+def cache(tmp_path, session):
+    return SpriteCache(str(tmp_path), max_bytes=10_000, concurrency=2)
+
+def test_download_is_cached_by_content(cache, session):
+    session.responses['https://sprites.test/1.png'] = FakeResponse(b'\x89PNG-one')
+    session.responses['https://sprites.test/1-copy.png'] = FakeResponse(b'\x89PNG-one')
+
+    first = cache.get('https://sprites.test/1.png')
+    again = cache.get('https://sprites.test/1.png')
+    copy = cache.get('https://sprites.test/1-copy.png')
+
+    assert first == again and first.mimetype == 'image/png'
+    assert copy.path == first.path #Mismo contenido, un solo archivo
+    assert session.requested == ['https://sprites.test/1.png', 'https://sprites.test/1-copy.png']
+    with open(first.path, 'rb') as file:
+        assert file.read() == b'\x89PNG-one'
+
+def test_rejects_non_images(cache, session):
+    session.responses['https://sprites.test/page'] = FakeResponse(b'<html>', 'text/html')
+
+    with pytest.raises(ValueError):
+        cache.get('https://sprites.test/page')
+    assert cache.lookup('https://sprites.test/page') is None
+
+def test_oversized_download_stops_early(cache, session):
+    response = FakeResponse(b'x' * (MAX_SPRITE_BYTES * 4))
+    session.responses['https://sprites.test/huge.png'] = response
+
+    with pytest.raises(ValueError):
+        cache.get('https://sprites.test/huge.png')
+    assert response.chunks_read * 64 * 1024 <= MAX_SPRITE_BYTES + 64 * 1024 #No se leyó todo el cuerpo
+
+def test_declared_oversize_is_rejected_before_reading(cache, session):
+    response = FakeResponse(b'x', content_length=MAX_SPRITE_BYTES + 1)
+    session.responses['https://sprites.test/huge.png'] = response
+
+    with pytest.raises(ValueError):
+        cache.get('https://sprites.test/huge.png')
+    assert response.chunks_read == 0
+
+def test_eviction_removes_least_recently_used(cache, session):
+    for i in range(4):
+        url = f'https://sprites.test/{i}.png'
+        session.responses[url] = FakeResponse(bytes([i]) * 3_000)
+        sprite = cache.get(url)
+        os.utime(sprite.path, (i, i)) #Cada imagen más reciente que la anterior
+
+    assert cache.size() <= cache.max_bytes
+    assert cache.lookup('https://sprites.test/0.png') is None
+    assert cache.lookup('https://sprites.test/3.png') is not None
+
+def test_evicted_sprite_is_downloaded_again(cache, session):
+    session.responses['https://sprites.test/1.png'] = FakeResponse(b'\x89PNG-one')
+    sprite = cache.get('https://sprites.test/1.png')
+    os.unlink(sprite.path)
+
+    assert cache.get('https://sprites.test/1.png') == sprite
+    assert len(session.requested) == 2
@@ -0,0 +1,61 @@
+"""
+Pruebas de la tabla de tipos (TypeChart) y de la cobertura de equipos.
+"""
+
+import pytest
+from app.services.pokedex_store import TYPE_NAMES
+from app.services.type_chart import TypeChart
+from benchmarks.fixtures import synthetic_type_documents
+
+@pytest.fixture
+def type_chart(pokemon_service, store):
+    pokemon_service.cache_type_documents(synthetic_type_documents(list(pokemon_service.pokemon_cache.values())))
+    return TypeChart(store)
+
+def single_type_pokemon(pokemon_service, type_name):
+    """Devuelve el nombre de un Pokemon sintético con un único tipo."""
+    for document in pokemon_service.pokemon_cache.values():
+        if [t['type']['name'] for t in document['types']] == [type_name]:
+            return document['name']
+    pytest.skip(f'No hay Pokemon sintético de tipo {type_name} puro')
+
+def test_matrix_follows_damage_relations(pokemon_service, type_chart):
+    matrix = type_chart.get_matrix()
+    relations = pokemon_service.get_type_document('fire')['damage_relations']
+    row = TYPE_NAMES.index('fire')
+    assert matrix.shape == (len(TYPE_NAMES), len(TYPE_NAMES))
+    for relation, multiplier in (('double_damage_to', 2), ('half_damage_to', 0.5), ('no_damage_to', 0)):
+        for defender in relations[relation]:
+            assert matrix[row, TYPE_NAMES.index(defender['name'])] == multiplier
+
+def test_team_coverage_uses_team_types(pokemon_service, type_chart):
+    name = single_type_pokemon(pokemon_service, 'water')
+    result = type_chart.team_coverage([name])
+    offense = result['ofensiva']
+    relations = pokemon_service.get_type_document('water')['damage_relations']
+    assert result['equipo'] == [{"nombre": name, "tipos": ['water']}]
+    assert sorted(offense['super_efectivo_contra']) == sorted(t['name'] for t in relations['double_damage_to'])
+    assert len(offense['super_efectivo_contra'] + offense['neutral_contra'] + offense['sin_cobertura']) == len(TYPE_NAMES)
+    multiplier = type_chart.get_matrix()[TYPE_NAMES.index('water'), TYPE_NAMES.index('water')]
+    assert result['defensa']['por_tipo']['water'] == {
+        "debiles": int(multiplier > 1), "resistentes": int(0 < multiplier < 1), "inmunes": int(multiplier == 0)
+    }
+
+def test_team_without_known_types_has_no_coverage(pokemon_service, type_chart):
+    document = dict(pokemon_service.get_pokemon_document('pokemon-1'), name='typeless', types=[])
+    pokemon_service.cache_pokemon_documents([document])
+
+    result = type_chart.team_coverage(['typeless'])
+
+    assert result['ofensiva']['sin_cobertura'] == list(TYPE_NAMES)
+    assert result['ofensiva']['super_efectivo_contra'] == result['ofensiva']['neutral_contra'] == []
+
+@pytest.mark.parametrize('team', [[], ['pokemon-1'] * 7])
+def test_team_size_is_validated(type_chart, team):
+    with pytest.raises(ValueError):
+        type_chart.team_coverage(team)
+
+def test_unknown_member_raises_key_error(type_chart, monkeypatch):
+    monkeypatch.setattr(type_chart.store.pokemon_service, 'get_pokemon_document', lambda name: {}[name])
+    with pytest.raises(KeyError):
+        type_chart.team_coverage(['missingno'])
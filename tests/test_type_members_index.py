@@ -0,0 +1,56 @@
+"""
+Pruebas del listado paginado de integrantes de un tipo (TypeMembersIndex).
+"""
+
+import pytest
+from app.services.type_members_index import TypeMembersIndex, encode_cursor
+
+@pytest.fixture
+def members_index(store):
+    return TypeMembersIndex(store)
+
+def fire_members(pokemon_service):
+    return [data for data in pokemon_service.pokemon_cache.values() if any(t['type']['name'] == 'fire' for t in data['types'])]
+
+def walk(members_index, **kwargs):
+    """Recorre todas las páginas y devuelve los nombres y la cantidad de páginas."""
+    names, cursor, pages = [], None, 0
+    while True:
+        page = members_index.page('fire', limit=7, cursor=cursor, **kwargs)
+        names += [member['nombre'] for member in page['pokemon']]
+        pages += 1
+        cursor = page['siguiente']
+        if cursor is None:
+            return names, pages
+
+@pytest.mark.parametrize('sort, order', [('id', 'asc'), ('id', 'desc'), ('name_length', 'asc'), ('name_length', 'desc')])
+def test_pages_cover_every_member_in_order(pokemon_service, members_index, sort, order):
+    key = (lambda data: data['id']) if sort == 'id' else (lambda data: (len(data['name']), data['id']))
+    expected = [data['name'] for data in sorted(fire_members(pokemon_service), key=key, reverse=order == 'desc')]
+
+    names, pages = walk(members_index, sort=sort, order=order)
+
+    assert names == expected
+    assert pages == -(-len(expected) // 7)
+
+def test_cursor_survives_updates(pokemon_service, members_index):
+    first = members_index.page('fire', limit=5)
+    earlier = dict(fire_members(pokemon_service)[0], id=0, name='pokemon-0') #Entra antes del cursor
+    pokemon_service.cache_pokemon_documents([earlier])
+
+    second = members_index.page('fire', limit=5, cursor=first['siguiente'])
+
+    assert second['total'] == first['total'] + 1
+    assert second['pokemon'][0]['número_pokedex'] > first['pokemon'][-1]['número_pokedex']
+
+def test_invalid_requests(members_index):
+    with pytest.raises(KeyError):
+        members_index.page('shadow')
+    with pytest.raises(ValueError):
+        members_index.page('fire', limit=0)
+    with pytest.raises(ValueError):
+        members_index.page('fire', sort='weight')
+    with pytest.raises(ValueError):
+        members_index.page('fire', cursor='not-a-cursor')
+    with pytest.raises(ValueError): #Cursor de otro orden
+        members_index.page('fire', cursor=encode_cursor('name_length', 'asc', False, 10))
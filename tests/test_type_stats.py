@@ -0,0 +1,77 @@
+"""
+Pruebas de las estadísticas por tipo (TypeStatsIndex): agregados, rankings y cambios de la cache.
+"""
+
+from unittest import mock
+import pytest
+from app.services.pokemon_service import PokemonService
+from app.services.type_stats import TypeStatsIndex
+
+@pytest.fixture
+def type_stats(store):
+    return TypeStatsIndex(store)
+
+def test_full_flush_keeps_type_stats(pokemon_service, type_stats):
+    summary = type_stats.summary('fire')
+    leaderboard = type_stats.leaderboard('fire', 'total')
+    type_leaderboard = type_stats.type_leaderboard('total')
+    assert summary['cantidad'] > 0
+
+    pokemon_service.invalidate_cache('*')
+
+    assert type_stats.summary('fire') == summary
+    assert type_stats.leaderboard('fire', 'total') == leaderboard
+    assert type_stats.type_leaderboard('total') == type_leaderboard
+
+def test_refetched_document_updates_type_stats(pokemon_service, type_stats):
+    name = type_stats.leaderboard('fire', 'total', k=1, order='asc')['ranking'][0]['nombre']
+    count = type_stats.summary('fire')['cantidad']
+    updated = dict(pokemon_service.get_pokemon_document(name))
+    updated['stats'] = [dict(stat, base_stat=255) for stat in updated['stats']]
+    pokemon_service.invalidate_cache(f'pokemon/{name}')
+
+    response = mock.Mock()
+    response.json.return_value = updated
+    with mock.patch.object(PokemonService, '_make_request', return_value=response):
+        pokemon_service.get_pokemon_document(name)
+
+    assert type_stats.summary('fire')['cantidad'] == count
+    assert type_stats.leaderboard('fire', 'total', k=1)['ranking'][0] == {"nombre": name, "número_pokedex": updated['id'], "valor": 1530}
+
+def fire_totals(pokemon_service):
+    """(total, número, nombre) de los Pokemon de tipo fire."""
+    return [(sum(stat['base_stat'] for stat in data['stats']), data['id'], data['name'])
+            for data in pokemon_service.pokemon_cache.values() if any(t['type']['name'] == 'fire' for t in data['types'])]
+
+def test_summary_and_leaderboard_match_documents(pokemon_service, type_stats):
+    totals = fire_totals(pokemon_service)
+    summary = type_stats.summary('fire')
+
+    assert summary['cantidad'] == len(totals)
+    assert summary['stats']['total']['promedio'] == round(sum(total for total, _, _ in totals) / len(totals), 2)
+    assert summary['stats']['total']['maximo'] == {"nombre": max(totals)[2], "número_pokedex": max(totals)[1], "valor": max(totals)[0]}
+    ranking = type_stats.leaderboard('fire', 'total', k=5)['ranking']
+    assert [entry['nombre'] for entry in ranking] == [name for _, _, name in sorted(totals, reverse=True)[:5]]
+
+def test_removed_pokemon_leave_the_aggregates(pokemon_service, type_stats):
+    best = type_stats.leaderboard('fire', 'total', k=1)['ranking'][0]
+    count = type_stats.summary('fire')['cantidad']
+
+    pokemon_service.swap_pokemon_documents([], [best['nombre']])
+
+    assert type_stats.summary('fire')['cantidad'] == count - 1
+    assert type_stats.leaderboard('fire', 'total', k=1)['ranking'][0] != best
+
+def test_type_leaderboard_is_sorted(type_stats):
+    ranking = type_stats.type_leaderboard('velocidad', order='asc')['ranking']
+
+    assert [entry['promedio'] for entry in ranking] == sorted(entry['promedio'] for entry in ranking)
+    assert all(entry['cantidad'] > 0 for entry in ranking)
+
+def test_invalid_arguments(type_stats):
+    with pytest.raises(KeyError):
+        type_stats.summary('shadow')
+    with pytest.raises(ValueError):
+        type_stats.leaderboard('fire', 'suerte')
+    with pytest.raises(ValueError):
+        type_stats.type_leaderboard('total', order='up')
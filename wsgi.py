@@ -0,0 +1,12 @@
+"""
+Punto de entrada WSGI para producción.
+Crea la aplicación una sola vez para el servidor WSGI; con gunicorn se ejecuta en el
+master antes del fork de los workers (ver gunicorn.conf.py).
+
+Uso:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+from app import create_app
+
+app = create_app()